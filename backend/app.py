@@ -2,18 +2,37 @@
 # Flask API with Gemini 2.0 Flash integration for target audience generation
 # YouTube processing with yt-dlp, Whisper, and clip analysis
 
-from flask import Flask, request, jsonify, send_from_directory, render_template, send_file, Response
+from flask import Flask, request, jsonify, send_from_directory, send_file, Response
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from werkzeug.middleware.proxy_fix import ProxyFix
 import os
+import asyncio
+import atexit
+import bisect
+import copy
+import difflib
 import json
+import queue
+import random
 import uuid
 import re
 import threading
 import time
 import hashlib
+import io
+import gzip
+import shutil
+import string
+import sqlite3
 import subprocess
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from types import SimpleNamespace
 from dotenv import load_dotenv
 
 # Optional imports - don't crash if missing
@@ -31,6 +50,46 @@ except ImportError:
     OPENAI_AVAILABLE = False
     print("[WARN] openai not available")
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    print("[WARN] orjson not available, using stdlib json")
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    print("[WARN] zstandard not available, transcripts stored uncompressed")
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+try:
+    from streaming_form_data import StreamingFormDataParser
+    from streaming_form_data.targets import BaseTarget, ValueTarget
+    STREAMING_FORM_DATA_AVAILABLE = True
+except ImportError:
+    STREAMING_FORM_DATA_AVAILABLE = False
+    print("[WARN] streaming-form-data not available, using Werkzeug multipart parser")
+
 # Load environment variables
 load_dotenv()
 
@@ -42,7 +101,8 @@ from word_level_transcript import (
     cache_word_transcript,
     create_word_transcript_from_job,
     format_timestamp,
-    parse_timestamp
+    parse_timestamp,
+    set_word_transcript_cache_dir
 )
 
 # =============================================================================
@@ -64,17 +124,11 @@ def parse_transcript_to_words(transcript_text, start_time, end_time):
     """
     import re
     
-    # Handle timestamp string inputs
+    # Handle timestamp string inputs (shares the cached timestamp parser)
     def to_seconds(ts):
         if isinstance(ts, (int, float)):
             return float(ts)
-        ts = str(ts).strip()
-        parts = ts.split(':')
-        if len(parts) == 3:
-            return int(parts[0]) * 3600 + int(parts[1]) * 60 + float(parts[2])
-        elif len(parts) == 2:
-            return int(parts[0]) * 60 + float(parts[1])
-        return float(ts)
+        return float(parse_timestamp_to_seconds(ts))
     
     start_sec = to_seconds(start_time)
     end_sec = to_seconds(end_time)
@@ -179,55 +233,241 @@ CORS(app, resources={
     r"/api/*": {
         "origins": cors_origins,
         "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-        "allow_headers": ["Content-Type", "Authorization", "X-Requested-With"],
+        "allow_headers": ["Content-Type", "Authorization", "X-Requested-With", "X-Upload-Id", "X-Chunk-Index"],
         "expose_headers": ["Content-Disposition"],  # For file downloads
         "supports_credentials": True if not any('*' in o for o in cors_origins) else False,
         "max_age": 3600  # Cache preflight for 1 hour
     }
 })
 
-# NUCLEAR CORS FIX: Manually add CORS headers to ALL responses (including ngrok)
+class CORSPreflightMiddleware:
+    """WSGI middleware that answers CORS preflight (OPTIONS) requests directly.
+
+    Preflights never reach Flask routing or the view functions; the headers
+    mirror the Flask-CORS configuration below.
+    """
+
+    def __init__(self, wsgi_app, origins):
+        self.wsgi_app = wsgi_app
+        self.origins = set(origins)
+        self.allow_all = not origins or '*' in self.origins
+        self.fallback_origin = origins[0] if origins else '*'
+        self.static_headers = [
+            ('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE,OPTIONS'),
+            ('Access-Control-Allow-Headers', 'Content-Type,Authorization,X-Requested-With,X-Upload-Id,X-Chunk-Index'),
+            ('Access-Control-Max-Age', '3600'),
+            ('Vary', 'Origin'),
+            ('Content-Length', '0'),
+        ]
+        if not self.allow_all:
+            self.static_headers.append(('Access-Control-Allow-Credentials', 'true'))
+
+    def allow_origin(self, origin):
+        """Access-Control-Allow-Origin value for a request Origin header"""
+        if origin and origin in self.origins:
+            return origin
+        if self.allow_all:
+            return '*'
+        return self.fallback_origin
+
+    def __call__(self, environ, start_response):
+        if environ.get('REQUEST_METHOD') != 'OPTIONS':
+            return self.wsgi_app(environ, start_response)
+
+        allow_origin = self.allow_origin(environ.get('HTTP_ORIGIN'))
+        start_response('204 No Content', [('Access-Control-Allow-Origin', allow_origin)] + self.static_headers)
+        return [b'']
+
+cors_preflight = CORSPreflightMiddleware(app.wsgi_app, cors_origins)
+app.wsgi_app = cors_preflight
+
+# Headers added to every response (including non-/api routes and ngrok), built once at startup
+STATIC_CORS_HEADERS = {
+    'Access-Control-Allow-Headers': 'Content-Type,Authorization,X-Requested-With,X-Upload-Id,X-Chunk-Index',
+    'Access-Control-Allow-Methods': 'GET,PUT,POST,DELETE,OPTIONS',
+    'Access-Control-Expose-Headers': 'Content-Disposition',
+    'Access-Control-Max-Age': '3600',
+}
+
 @app.after_request
 def after_request(response):
-    # Get the request's origin for dynamic CORS
-    request_origin = request.headers.get('Origin', '*')
-    
-    # Use configured origins or allow all if in development
-    allowed_origins = cors_origins if cors_origins else ['*']
-    
-    # If origin is in allowed list, use it; otherwise use first allowed or *
-    if request_origin in allowed_origins:
-        response.headers.add('Access-Control-Allow-Origin', request_origin)
-    elif '*' in allowed_origins:
-        response.headers.add('Access-Control-Allow-Origin', '*')
-    elif allowed_origins:
-        response.headers.add('Access-Control-Allow-Origin', allowed_origins[0])
+    response.headers['Access-Control-Allow-Origin'] = cors_preflight.allow_origin(request.headers.get('Origin'))
+    response.headers.update(STATIC_CORS_HEADERS)
+    return response
+
+# JSON responses (word lists, transcripts) compress 5-10x. Bodies over
+# COMPRESS_MIN_SIZE are sent zstd- or gzip-encoded when the client accepts it;
+# responses with an ETag keep their encoded bytes, so repeat requests for an
+# unchanged job don't compress again.
+COMPRESS_MIN_SIZE = 4096
+COMPRESS_CACHE_ENTRIES = 64
+_compressed_cache = OrderedDict()
+_compressed_cache_lock = threading.Lock()
+
+def compress_body(body, encoding):
+    """Encode a response body with zstd or gzip"""
+    if encoding == 'zstd':
+        return zstandard.compress(body, 3)
+    return gzip.compress(body, compresslevel=5)
+
+@app.after_request
+def compress_json_response(response):
+    if (response.mimetype != 'application/json' or response.status_code != 200
+            or response.is_streamed or 'Content-Encoding' in response.headers):
+        return response
+    accepted = request.accept_encodings
+    if ZSTD_AVAILABLE and 'zstd' in accepted:
+        encoding = 'zstd'
+    elif 'gzip' in accepted:
+        encoding = 'gzip'
     else:
-        response.headers.add('Access-Control-Allow-Origin', '*')
-    
-    response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization,X-Requested-With')
-    response.headers.add('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE,OPTIONS')
-    response.headers.add('Access-Control-Expose-Headers', 'Content-Disposition')
-    response.headers.add('Access-Control-Max-Age', '3600')
-    
-    # Handle ngrok-specific headers
-    # ngrok adds these headers - we pass them through but don't need special handling
-    # ngrok-skip-browser-warning is sometimes sent by clients
-    
+        return response
+    body = response.get_data()
+    if len(body) < COMPRESS_MIN_SIZE:
+        return response
+
+    etag = response.headers.get('ETag')
+    key = (request.path, etag, encoding) if etag else None
+    with _compressed_cache_lock:
+        encoded = _compressed_cache.get(key) if key else None
+    if encoded is None:
+        encoded = compress_body(body, encoding)
+        if key:
+            with _compressed_cache_lock:
+                _compressed_cache[key] = encoded
+                while len(_compressed_cache) > COMPRESS_CACHE_ENTRIES:
+                    _compressed_cache.popitem(last=False)
+
+    response.set_data(encoded)
+    response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
     return response
 
-# Chunked upload routes added below after DATA_DIR definition
-    """Save upload session data"""
-    session_file = os.path.join(CHUNKED_UPLOAD_DIR, f"session_{session_data['id']}.json")
-    with open(session_file, 'w') as f:
-        json.dump(session_data, f, indent=2)
+# Serve chunked-uploader.js from templates folder. A gzip copy is written at
+# startup and the page references it as chunked-uploader.js?v=<hash>, so it can
+# be cached as immutable and still change on redeploy.
+TEMPLATES_DIR = os.path.join(BACKEND_DIR, 'templates')
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+def precompress_static(directory, filename):
+    """Write <filename>.gz next to the file if missing or stale; returns (version, has_gz)"""
+    src_path = os.path.join(directory, filename)
+    gz_path = src_path + '.gz'
+    with open(src_path, 'rb') as f:
+        data = f.read()
+    version = hashlib.md5(data).hexdigest()[:12]
+    try:
+        if not os.path.exists(gz_path) or os.path.getmtime(gz_path) < os.path.getmtime(src_path):
+            with open(gz_path, 'wb') as f:
+                f.write(gzip.compress(data, 9))
+        return version, True
+    except OSError as e:
+        print(f"[WARN] Could not precompress {filename}: {e}")
+        return version, False
+
+CHUNKED_UPLOADER_VERSION, CHUNKED_UPLOADER_GZ = precompress_static(TEMPLATES_DIR, 'chunked-uploader.js')
 
-# Serve chunked-uploader.js from templates folder
 @app.route('/chunked-uploader.js')
 def serve_chunked_uploader():
-    return send_from_directory(os.path.join(BACKEND_DIR, 'templates'), 'chunked-uploader.js')
+    if CHUNKED_UPLOADER_GZ and 'gzip' in request.accept_encodings:
+        response = send_from_directory(TEMPLATES_DIR, 'chunked-uploader.js.gz', mimetype='application/javascript')
+        response.headers['Content-Encoding'] = 'gzip'
+        response.headers.pop('Content-Disposition', None)
+    else:
+        response = send_from_directory(TEMPLATES_DIR, 'chunked-uploader.js', mimetype='application/javascript')
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+    return response
 
 # CHUNKED UPLOAD ROUTES (inline for Render compatibility)
+#
+# Chunks are written straight into a preallocated file at
+# chunk_index * chunkSize, so completing an upload is a rename -
+# there is no separate reassembly pass over the data.
+
+CHUNK_WRITE_BUFSIZE = 1024 * 1024  # 1MB
+CHUNK_SPOOL_MAX = 16 * 1024 * 1024  # keep parsed chunks in memory up to 16MB
+
+def get_upload_part_path(upload_id):
+    """Path of the in-progress file that chunks are written into"""
+    return os.path.join(CHUNKED_UPLOAD_DIR, upload_id, 'upload.part')
+
+def preallocate_file(path, size):
+    """Create a file of the given size, reserving the disk blocks when supported"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT, 0o644)
+    try:
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except (AttributeError, OSError):
+            # Filesystem (or platform) can't reserve blocks - fall back to a sparse file
+            os.ftruncate(fd, size)
+    finally:
+        os.close(fd)
+
+def pwrite_stream(fd, stream, offset, max_bytes):
+    """Write a readable stream into fd starting at offset; returns bytes written.
+
+    Raises ValueError if the stream holds more than max_bytes.
+    """
+    written = 0
+    while True:
+        buf = stream.read(CHUNK_WRITE_BUFSIZE)
+        if not buf:
+            break
+        if written + len(buf) > max_bytes:
+            raise ValueError('Chunk is larger than expected')
+        view = memoryview(buf)
+        while view:
+            n = os.pwrite(fd, view, offset + written)
+            view = view[n:]
+            written += n
+    return written
+
+if STREAMING_FORM_DATA_AVAILABLE:
+    class SpooledTarget(BaseTarget):
+        """streaming-form-data target that collects a file field into a spooled temp file"""
+
+        def __init__(self):
+            super().__init__()
+            self.file = tempfile.SpooledTemporaryFile(max_size=CHUNK_SPOOL_MAX)
+
+        def on_data_received(self, chunk):
+            self.file.write(chunk)
+
+        def on_finish(self):
+            self.file.seek(0)
+
+def parse_chunk_form():
+    """Parse a chunk upload -> (upload_id, chunk_index, chunk_stream or None).
+
+    Raw application/octet-stream bodies carry their metadata in X-Upload-Id /
+    X-Chunk-Index headers and are streamed straight from request.stream.
+    Multipart forms use the C streaming-form-data parser when installed,
+    otherwise Werkzeug's (much slower) MultiPartParser via request.files.
+    """
+    if request.mimetype == 'application/octet-stream':
+        return (request.headers.get('X-Upload-Id'), request.headers.get('X-Chunk-Index', 0),
+                request.stream)
+
+    if not STREAMING_FORM_DATA_AVAILABLE:
+        chunk_file = request.files.get('chunk')
+        return (request.form.get('uploadId'), request.form.get('chunkIndex', 0),
+                chunk_file.stream if chunk_file else None)
+
+    upload_id, chunk_index, chunk = ValueTarget(), ValueTarget(), SpooledTarget()
+    parser = StreamingFormDataParser(headers=request.headers)
+    parser.register('uploadId', upload_id)
+    parser.register('chunkIndex', chunk_index)
+    parser.register('chunk', chunk)
+    while True:
+        data = request.stream.read(CHUNK_WRITE_BUFSIZE)
+        if not data:
+            break
+        parser.data_received(data)
+
+    return (upload_id.value.decode() or None, chunk_index.value.decode() or 0,
+            chunk.file if chunk._started else None)
+
 @app.route('/api/chunked/initiate', methods=['POST'])
 def initiate_chunked_upload():
     """Start a new chunked upload"""
@@ -242,6 +482,7 @@ def initiate_chunked_upload():
 
         upload_id = str(uuid.uuid4())
         total_chunks = (file_size + chunk_size - 1) // chunk_size
+        now = datetime.now().isoformat()
 
         session_data = {
             'id': upload_id,
@@ -249,15 +490,16 @@ def initiate_chunked_upload():
             'fileSize': file_size,
             'chunkSize': chunk_size,
             'totalChunks': total_chunks,
-            'uploadedChunks': [],
+            'chunksUploaded': 0,
             'status': 'in_progress',
-            'createdAt': datetime.now().isoformat(),
-            'updatedAt': datetime.now().isoformat()
+            'createdAt': now,
+            'updatedAt': now
         }
 
         upload_dir = os.path.join(CHUNKED_UPLOAD_DIR, upload_id)
         os.makedirs(upload_dir, exist_ok=True)
-        save_upload_session(session_data)
+        preallocate_file(get_upload_part_path(upload_id), file_size)
+        create_upload_session(session_data)
 
         return jsonify({
             'uploadId': upload_id,
@@ -272,16 +514,15 @@ def initiate_chunked_upload():
 def upload_chunk():
     """Upload a single chunk"""
     try:
-        upload_id = request.form.get('uploadId')
-        chunk_index = int(request.form.get('chunkIndex', 0))
+        upload_id, chunk_index, chunk_stream = parse_chunk_form()
+        chunk_index = int(chunk_index)
 
         if not upload_id:
             return jsonify({'error': 'uploadId is required'}), 400
 
-        if 'chunk' not in request.files:
+        if chunk_stream is None:
             return jsonify({'error': 'No chunk file provided'}), 400
 
-        chunk_file = request.files['chunk']
         session = get_upload_session(upload_id)
 
         if not session:
@@ -290,28 +531,42 @@ def upload_chunk():
         if session['status'] != 'in_progress':
             return jsonify({'error': f'Upload already completed or failed'}), 400
 
-        if chunk_index in session['uploadedChunks']:
+        total_chunks = session['totalChunks']
+        if chunk_index < 0 or chunk_index >= total_chunks:
+            return jsonify({'error': f'Invalid chunk index: {chunk_index}'}), 400
+
+        if is_chunk_uploaded(session, chunk_index):
+            chunks_uploaded = session['chunksUploaded']
             return jsonify({
                 'chunkIndex': chunk_index,
-                'chunksUploaded': len(session['uploadedChunks']),
-                'progress': len(session['uploadedChunks']) / session['totalChunks'] * 100
+                'chunksUploaded': chunks_uploaded,
+                'progress': chunks_uploaded / total_chunks * 100
             }), 200
 
-        upload_dir = os.path.join(CHUNKED_UPLOAD_DIR, upload_id)
-        chunk_path = os.path.join(upload_dir, f"chunk_{chunk_index:05d}")
-        chunk_file.save(chunk_path)
-
-        session['uploadedChunks'].append(chunk_index)
-        session['updatedAt'] = datetime.now().isoformat()
-        save_upload_session(session)
-
-        progress = len(session['uploadedChunks']) / session['totalChunks'] * 100
+        # Write the chunk at its final position in the preallocated file
+        chunk_size = session['chunkSize']
+        offset = chunk_index * chunk_size
+        max_bytes = min(chunk_size, session['fileSize'] - offset)
+        part_fd = acquire_upload_fds(upload_id)[0]
+        try:
+            try:
+                written = pwrite_stream(part_fd, chunk_stream, offset, max_bytes)
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            if written != max_bytes:
+                # Truncated body (client abort, proxy cut) - leave the bit unset so it's re-sent
+                return jsonify({'error': f'Incomplete chunk: expected {max_bytes} bytes, got {written}'}), 400
+
+            record_uploaded_chunk(session, chunk_index)
+        finally:
+            release_upload_fds(upload_id)
+        chunks_uploaded = session['chunksUploaded']
 
         return jsonify({
             'chunkIndex': chunk_index,
-            'chunksUploaded': len(session['uploadedChunks']),
-            'totalChunks': session['totalChunks'],
-            'progress': progress
+            'chunksUploaded': chunks_uploaded,
+            'totalChunks': total_chunks,
+            'progress': chunks_uploaded / total_chunks * 100
         }), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -328,9 +583,9 @@ def get_chunked_status(upload_id):
             'status': session['status'],
             'filename': session['filename'],
             'fileSize': session['fileSize'],
-            'chunksUploaded': len(session['uploadedChunks']),
+            'chunksUploaded': session['chunksUploaded'],
             'totalChunks': session['totalChunks'],
-            'progress': len(session['uploadedChunks']) / session['totalChunks'] * 100
+            'progress': session['chunksUploaded'] / session['totalChunks'] * 100
         }
         
         # Include file path if completed
@@ -346,72 +601,9 @@ def get_chunked_status(upload_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-def reassemble_file_async(upload_id, session):
-    """Background task to reassemble chunks"""
-    print(f"[CHUNKED] Starting reassembly for {upload_id}, {session['totalChunks']} chunks")
-    try:
-        upload_dir = os.path.join(CHUNKED_UPLOAD_DIR, upload_id)
-        final_dir = os.path.join(DATA_DIR, 'uploads')
-        os.makedirs(final_dir, exist_ok=True)
-        
-        print(f"[CHUNKED] Upload dir: {upload_dir}")
-        print(f"[CHUNKED] Final dir: {final_dir}")
-        
-        # Check disk space
-        import shutil
-        stat = shutil.disk_usage(final_dir)
-        print(f"[CHUNKED] Disk space: {stat.free / (1024**3):.2f} GB free")
-
-        final_filename = f"{upload_id}_{session['filename']}"
-        final_path = os.path.join(final_dir, final_filename)
-        
-        print(f"[CHUNKED] Reassembling to: {final_path}")
-
-        # Combine chunks (stream and delete to save disk space)
-        with open(final_path, 'wb') as outfile:
-            for i in range(session['totalChunks']):
-                chunk_path = os.path.join(upload_dir, f"chunk_{i:05d}")
-                if not os.path.exists(chunk_path):
-                    raise Exception(f"Chunk {i} not found at {chunk_path}")
-                with open(chunk_path, 'rb') as infile:
-                    outfile.write(infile.read())
-                # Delete chunk immediately after writing
-                try:
-                    os.remove(chunk_path)
-                except:
-                    pass
-                
-                if i % 50 == 0:
-                    print(f"[CHUNKED] Processed {i}/{session['totalChunks']} chunks")
-
-        actual_size = os.path.getsize(final_path)
-        print(f"[CHUNKED] Final file size: {actual_size} bytes")
-        
-        # Clean up upload directory
-        try:
-            os.rmdir(upload_dir)
-        except:
-            pass
-
-        # Update session
-        session['status'] = 'completed'
-        session['finalPath'] = final_path
-        session['finalSize'] = actual_size
-        session['completedAt'] = datetime.now().isoformat()
-        save_upload_session(session)
-        
-        print(f"[CHUNKED] Reassembly complete: {final_path}")
-    except Exception as e:
-        print(f"[CHUNKED] Reassembly failed: {e}")
-        import traceback
-        traceback.print_exc()
-        session['status'] = 'error'
-        session['error'] = str(e)
-        save_upload_session(session)
-
 @app.route('/api/chunked/complete', methods=['POST'])
 def complete_chunked_upload():
-    """Finalize upload - start async reassembly"""
+    """Finalize upload - chunks are already in place, so just move the file"""
     try:
         data = request.json
         upload_id = data.get('uploadId') if data else None
@@ -429,39 +621,43 @@ def complete_chunked_upload():
                 'filePath': session.get('finalPath'),
                 'message': 'Upload already completed'
             }), 200
-            
-        if session['status'] == 'processing':
-            return jsonify({
-                'status': 'processing',
-                'message': 'File reassembly in progress...'
-            }), 200
 
         # Check if all chunks uploaded
-        expected_chunks = set(range(session['totalChunks']))
-        uploaded_chunks = set(session['uploadedChunks'])
-        missing_chunks = expected_chunks - uploaded_chunks
-
-        if missing_chunks:
+        missing_count = session['totalChunks'] - session['chunksUploaded']
+        if missing_count:
             return jsonify({
-                'error': f'Missing chunks: {sorted(missing_chunks)[:10]}',
-                'missingCount': len(missing_chunks)
+                'error': f'Missing chunks: {find_missing_chunks(session)}',
+                'missingCount': missing_count
             }), 400
 
-        # Mark as processing and start background task
-        session['status'] = 'processing'
+        final_dir = UPLOADS_DIR
+        os.makedirs(final_dir, exist_ok=True)
+        final_path = os.path.join(final_dir, f"{upload_id}_{session['filename']}")
+
+        close_upload_fds(upload_id)
+        os.replace(get_upload_part_path(upload_id), final_path)
+        try:
+            os.rmdir(os.path.join(CHUNKED_UPLOAD_DIR, upload_id))
+            os.remove(_session_bitmap_file(upload_id))
+        except OSError:
+            pass
+
+        actual_size = os.path.getsize(final_path)
+        print(f"[CHUNKED] Upload complete: {final_path} ({actual_size} bytes)")
+
+        session['status'] = 'completed'
+        session['finalPath'] = final_path
+        session['finalSize'] = actual_size
+        session['completedAt'] = session['updatedAt'] = datetime.now().isoformat()
         save_upload_session(session)
-        
-        thread = threading.Thread(
-            target=reassemble_file_async,
-            args=(upload_id, session)
-        )
-        thread.daemon = True
-        thread.start()
 
         return jsonify({
-            'status': 'processing',
-            'message': 'File reassembly started. Poll /api/chunked/status to check progress.'
-        }), 202
+            'status': 'completed',
+            'filePath': final_path,
+            'filename': session['filename'],
+            'fileSize': actual_size,
+            'message': 'Upload completed'
+        }), 200
         
     except Exception as e:
         import traceback
@@ -480,9 +676,35 @@ if GOOGLE_AI_AVAILABLE and GEMINI_API_KEY:
     except Exception as e:
         print(f"[STARTUP] Gemini config error: {e}")
 
+# GenerativeModel handles are reusable across calls - build each one once
+gemini_models = {}
+
+def get_gemini_model(name):
+    """Return a cached genai.GenerativeModel for the given model name"""
+    model = gemini_models.get(name)
+    if model is None:
+        model = gemini_models[name] = genai.GenerativeModel(name)
+    return model
+
+# One pooled HTTP client for all OpenAI traffic (SDK calls and streamed Whisper
+# uploads), so parallel chunk requests reuse warm TCP+TLS connections
+# instead of handshaking per call. HTTP/2 when the h2 package is installed.
+api_http = None
+if HTTPX_AVAILABLE:
+    try:
+        import h2  # noqa: F401
+        HTTP2_AVAILABLE = True
+    except ImportError:
+        HTTP2_AVAILABLE = False
+    api_http = httpx.Client(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+        timeout=httpx.Timeout(600.0, connect=10.0)
+    )
+
 if OPENAI_AVAILABLE and OPENAI_API_KEY:
     try:
-        openai_client = OpenAI(api_key=OPENAI_API_KEY)
+        openai_client = OpenAI(api_key=OPENAI_API_KEY, http_client=api_http)
         print("[STARTUP] OpenAI client configured")
     except Exception as e:
         print(f"[STARTUP] OpenAI config error: {e}")
@@ -496,61 +718,741 @@ os.makedirs(DATA_DIR, exist_ok=True)
 os.makedirs(JOBS_DIR, exist_ok=True)
 os.makedirs(TRANSCRIPTS_DIR, exist_ok=True)
 
+# Parsed word transcripts survive restarts here (see word_level_transcript)
+set_word_transcript_cache_dir(os.path.join(DATA_DIR, 'word_transcripts'))
+
 # Chunked upload configuration
 CHUNKED_UPLOAD_DIR = os.path.join(DATA_DIR, 'chunked_uploads')
 CHUNK_SIZE = 10 * 1024 * 1024  # 10MB chunks
 os.makedirs(CHUNKED_UPLOAD_DIR, exist_ok=True)
 
+# Upload sessions go to Redis when REDIS_URL / REDIS_HOST is configured, so every
+# worker (or replica sharing the upload volume) sees the same chunk state.
+# Sessions are a JSON blob in sess:{id}, received chunks are bits in bits:{id}
+# (SETBIT / BITCOUNT), and both expire after UPLOAD_SESSION_TTL seconds.
+REDIS_URL = os.getenv('REDIS_URL') or (
+    f"redis://{os.getenv('REDIS_HOST')}:{os.getenv('REDIS_PORT', '6379')}/0" if os.getenv('REDIS_HOST') else None
+)
+UPLOAD_SESSION_TTL = int(os.getenv('UPLOAD_SESSION_TTL', str(24 * 3600)))
+redis_client = None
+
+if REDIS_URL:
+    if not REDIS_AVAILABLE:
+        print("[WARN] REDIS_URL set but redis package not installed, using file-based upload sessions")
+    else:
+        try:
+            redis_client = redis.Redis.from_url(REDIS_URL)
+            redis_client.ping()
+            print("[STARTUP] Upload sessions stored in Redis")
+        except Exception as e:
+            print(f"[STARTUP] Redis unavailable ({e}), using file-based upload sessions")
+            redis_client = None
+
+def _redis_session_key(session_id):
+    return f"sess:{session_id}"
+
+def _redis_bits_key(session_id):
+    return f"bits:{session_id}"
+
+# Otherwise upload sessions live in memory; the JSON file is only rewritten on state
+# changes. Received chunks are tracked in a bitmap (one bit per chunk) that is
+# mirrored to session_{id}.bitmap with a single-byte pwrite per chunk, so
+# progress survives a restart without rewriting the session JSON.
+upload_sessions = {}
+upload_bitmaps = {}
+upload_sessions_lock = threading.RLock()
+
+# Open (part_fd, bitmap_fd) per session, least recently used first. Sessions
+# that are abandoned never reach complete, so past MAX_CACHED_UPLOAD_FDS the
+# oldest idle sessions' descriptors are closed (and reopened if they resume).
+MAX_CACHED_UPLOAD_FDS = int(os.getenv('MAX_CACHED_UPLOAD_FDS', '64'))
+upload_fds = OrderedDict()
+upload_fd_users = {}  # session_id -> chunk writes currently using its descriptors
+
+def _session_file(session_id):
+    return os.path.join(CHUNKED_UPLOAD_DIR, f"session_{session_id}.json")
+
+def _session_bitmap_file(session_id):
+    return os.path.join(CHUNKED_UPLOAD_DIR, f"session_{session_id}.bitmap")
+
+def create_upload_session(session_data):
+    """Register a new session with an empty chunk bitmap and save it"""
+    if redis_client is not None:
+        save_upload_session(session_data)
+        return
+
+    bitmap = bytearray((session_data['totalChunks'] + 7) // 8)
+    with upload_sessions_lock:
+        with open(_session_bitmap_file(session_data['id']), 'wb') as f:
+            f.write(bitmap)
+        upload_bitmaps[session_data['id']] = bitmap
+        save_upload_session(session_data)
+
 def get_upload_session(session_id):
-    """Load upload session data"""
-    session_file = os.path.join(CHUNKED_UPLOAD_DIR, f"session_{session_id}.json")
-    if os.path.exists(session_file):
-        with open(session_file, 'r') as f:
-            return json.load(f)
-    return None
+    """Load upload session data (from memory, or disk + chunk bitmap on first access)"""
+    if redis_client is not None:
+        data = redis_client.get(_redis_session_key(session_id))
+        if data is None:
+            return None
+        session = loads_json(data)
+        session['chunksUploaded'] = redis_client.bitcount(_redis_bits_key(session_id))
+        return session
+
+    with upload_sessions_lock:
+        session = upload_sessions.get(session_id)
+        if session is not None:
+            return session
+
+        session_file = _session_file(session_id)
+        if not os.path.exists(session_file):
+            return None
+        with open(session_file, 'rb') as f:
+            session = loads_json(f.read())
+
+        bitmap_file = _session_bitmap_file(session_id)
+        if os.path.exists(bitmap_file):
+            with open(bitmap_file, 'rb') as f:
+                bitmap = bytearray(f.read())
+        else:
+            bitmap = _migrate_legacy_session(session)
+        session['chunksUploaded'] = int.from_bytes(bitmap, 'little').bit_count()
+
+        upload_sessions[session_id] = session
+        upload_bitmaps[session_id] = bitmap
+        return session
+
+def _migrate_legacy_session(session):
+    """Convert a session saved before bitmaps existed (one chunk_NNNNN file per
+    chunk, an uploadedChunks list) to the preallocated part file + bitmap file.
+
+    Chunks whose file is missing or the wrong size are left unmarked so the
+    client re-sends them. Returns the bitmap.
+    """
+    session_id = session['id']
+    bitmap = bytearray((session['totalChunks'] + 7) // 8)
+    uploaded_chunks = session.pop('uploadedChunks', [])
+    if session['status'] == 'in_progress':
+        chunk_dir = os.path.join(CHUNKED_UPLOAD_DIR, session_id)
+        os.makedirs(chunk_dir, exist_ok=True)
+        part_path = get_upload_part_path(session_id)
+        preallocate_file(part_path, session['fileSize'])
+        chunk_size = session['chunkSize']
+        with open(part_path, 'r+b') as part:
+            for chunk_index in uploaded_chunks:
+                chunk_path = os.path.join(chunk_dir, f"chunk_{chunk_index:05d}")
+                offset = chunk_index * chunk_size
+                expected = min(chunk_size, session['fileSize'] - offset)
+                if not os.path.exists(chunk_path):
+                    continue
+                if os.path.getsize(chunk_path) == expected:
+                    with open(chunk_path, 'rb') as chunk:
+                        part.seek(offset)
+                        shutil.copyfileobj(chunk, part, CHUNK_WRITE_BUFSIZE)
+                    bitmap[chunk_index >> 3] |= 1 << (chunk_index & 7)
+                os.remove(chunk_path)
+    with open(_session_bitmap_file(session_id), 'wb') as f:
+        f.write(bitmap)
+    with open(_session_file(session_id), 'wb') as f:
+        f.write(dumps_json(session))
+    print(f"[CHUNKED] Migrated legacy upload session {session_id}")
+    return bitmap
 
 def save_upload_session(session_data):
-    """Save upload session data"""
-    session_file = os.path.join(CHUNKED_UPLOAD_DIR, f"session_{session_data['id']}.json")
-    with open(session_file, 'w') as f:
-        json.dump(session_data, f, indent=2)
+    """Save upload session data (full rewrite - use on state transitions)"""
+    if redis_client is not None:
+        pipe = redis_client.pipeline()
+        pipe.set(_redis_session_key(session_data['id']), dumps_json(session_data), ex=UPLOAD_SESSION_TTL)
+        pipe.expire(_redis_bits_key(session_data['id']), UPLOAD_SESSION_TTL)
+        pipe.execute()
+        return
+
+    with upload_sessions_lock:
+        upload_sessions[session_data['id']] = session_data
+        with open(_session_file(session_data['id']), 'wb') as f:
+            f.write(dumps_json(session_data))
+
+def get_upload_fds(session_id):
+    """(part_fd, bitmap_fd) for a session, opened once and reused for every chunk.
+
+    pwrite takes an explicit offset, so concurrent chunk writers can share the
+    descriptors without seeking. bitmap_fd is None when sessions are in Redis.
+    Hold them with acquire_upload_fds so they can't be evicted mid-write.
+    """
+    with upload_sessions_lock:
+        fds = upload_fds.get(session_id)
+        if fds is not None:
+            upload_fds.move_to_end(session_id)
+            return fds
+        part_fd = os.open(get_upload_part_path(session_id), os.O_WRONLY)
+        bitmap_fd = None
+        if redis_client is None:
+            try:
+                bitmap_fd = os.open(_session_bitmap_file(session_id), os.O_WRONLY)
+            except OSError:
+                os.close(part_fd)
+                raise
+        fds = upload_fds[session_id] = (part_fd, bitmap_fd)
+        _evict_idle_upload_fds()
+        return fds
+
+def acquire_upload_fds(session_id):
+    """get_upload_fds, pinned until the matching release_upload_fds"""
+    with upload_sessions_lock:
+        upload_fd_users[session_id] = upload_fd_users.get(session_id, 0) + 1
+        try:
+            return get_upload_fds(session_id)
+        except OSError:
+            release_upload_fds(session_id)
+            raise
+
+def release_upload_fds(session_id):
+    """Unpin a session's descriptors after a chunk write"""
+    with upload_sessions_lock:
+        users = upload_fd_users.pop(session_id, 0) - 1
+        if users > 0:
+            upload_fd_users[session_id] = users
+        _evict_idle_upload_fds()
+
+def _evict_idle_upload_fds():
+    """Close the least recently used idle sessions' descriptors beyond the cap"""
+    excess = len(upload_fds) - MAX_CACHED_UPLOAD_FDS
+    if excess <= 0:
+        return
+    idle = [session_id for session_id in upload_fds if session_id not in upload_fd_users]
+    for session_id in idle[:excess]:
+        _close_fds(upload_fds.pop(session_id))
+
+def _close_fds(fds):
+    """Close a (part_fd, bitmap_fd) pair"""
+    for fd in fds:
+        if fd is not None:
+            os.close(fd)
+
+def close_upload_fds(session_id):
+    """Close a session's cached descriptors (before the part file is moved)"""
+    with upload_sessions_lock:
+        fds = upload_fds.pop(session_id, None)
+    if fds:
+        _close_fds(fds)
+
+def is_chunk_uploaded(session, chunk_index):
+    """O(1) bit test against the session's chunk bitmap"""
+    if redis_client is not None:
+        return bool(redis_client.getbit(_redis_bits_key(session['id']), chunk_index))
+    bitmap = upload_bitmaps[session['id']]
+    return bool(bitmap[chunk_index >> 3] & (1 << (chunk_index & 7)))
+
+def record_uploaded_chunk(session, chunk_index):
+    """Mark a chunk as received: set its bit in memory and pwrite that one byte"""
+    if redis_client is not None:
+        pipe = redis_client.pipeline()
+        pipe.setbit(_redis_bits_key(session['id']), chunk_index, 1)
+        pipe.expire(_redis_bits_key(session['id']), UPLOAD_SESSION_TTL)
+        pipe.bitcount(_redis_bits_key(session['id']))
+        _, _, session['chunksUploaded'] = pipe.execute()
+        return
+
+    with upload_sessions_lock:
+        bitmap = upload_bitmaps[session['id']]
+        byte_index = chunk_index >> 3
+        mask = 1 << (chunk_index & 7)
+        if bitmap[byte_index] & mask:
+            return
+        bitmap[byte_index] |= mask
+        session['chunksUploaded'] += 1
+        os.pwrite(get_upload_fds(session['id'])[1], bytes((bitmap[byte_index],)), byte_index)
+
+def find_missing_chunks(session, limit=10):
+    """Indices of the first `limit` chunks that have not been received"""
+    total_chunks = session['totalChunks']
+    if redis_client is not None:
+        # Redis numbers bits from the most significant bit of each byte
+        bitmap = (redis_client.get(_redis_bits_key(session['id'])) or b'').ljust((total_chunks + 7) // 8, b'\0')
+        masks = [0x80 >> bit for bit in range(8)]
+    else:
+        bitmap = upload_bitmaps[session['id']]
+        masks = [1 << bit for bit in range(8)]
+
+    missing = []
+    for byte_index, byte in enumerate(bitmap):
+        if byte == 0xFF:
+            continue
+        for bit, mask in enumerate(masks):
+            chunk_index = (byte_index << 3) + bit
+            if chunk_index >= total_chunks:
+                return missing
+            if not byte & mask:
+                missing.append(chunk_index)
+                if len(missing) >= limit:
+                    return missing
+    return missing
 
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
-def save_data(filename, data, directory=DATA_DIR):
-    """Save data to JSON file"""
+def _json_default(obj):
+    """Fallback for types orjson doesn't encode natively (Decimal, sets)"""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return DefaultJSONProvider.default(obj)
+
+def dumps_json(payload):
+    """Serialize payload to JSON bytes (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, default=_json_default).encode('utf-8')
+
+def loads_json(data):
+    """Parse JSON bytes/str (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, so jsonify() skips the stdlib encoder"""
+
+    def dumps(self, obj, **kwargs):
+        return dumps_json(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return loads_json(s)
+
+    def response(self, *args, **kwargs):
+        # Hand Werkzeug the encoded bytes directly instead of a str
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_json(obj), mimetype=self.mimetype)
+
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
+
+def save_data(filename, data, directory=DATA_DIR, durable=False):
+    """Save data to JSON file atomically (single write + rename; fsync only when durable)"""
     filepath = os.path.join(directory, filename)
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+    tmp_path = f"{filepath}.{uuid.uuid4().hex}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, dumps_json(data))
+        if durable:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, filepath)
     return filepath
 
+# Parsed load_data results keyed by path, validated against the file's stat
+LOAD_CACHE_ENTRIES = 256
+_load_cache = OrderedDict()
+_load_cache_lock = threading.Lock()
+
 def load_data(filename, directory=DATA_DIR):
-    """Load data from JSON file"""
+    """Load data from JSON file (cached until the file changes - copy before mutating)"""
     filepath = os.path.join(directory, filename)
-    if os.path.exists(filepath):
-        with open(filepath, 'r') as f:
-            return json.load(f)
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    version = (st.st_mtime_ns, st.st_size, st.st_ino)
+    with _load_cache_lock:
+        cached = _load_cache.get(filepath)
+        if cached and cached[0] == version:
+            _load_cache.move_to_end(filepath)
+            return cached[1]
+
+    with open(filepath, 'rb') as f:
+        data = loads_json(f.read())
+    with _load_cache_lock:
+        _load_cache[filepath] = (version, data)
+        _load_cache.move_to_end(filepath)
+        while len(_load_cache) > LOAD_CACHE_ENTRIES:
+            _load_cache.popitem(last=False)
+    return data
+
+# ============================================================================
+# JOB STORAGE (SQLite, WAL mode)
+# ============================================================================
+
+JOBS_DB_PATH = os.path.join(JOBS_DIR, 'jobs.db')
+_jobs_db_lock = threading.Lock()
+
+def _open_jobs_db():
+    """Open the jobs database and create the schema if needed"""
+    conn = sqlite3.connect(JOBS_DB_PATH, check_same_thread=False)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS jobs ('
+        'id TEXT PRIMARY KEY, data BLOB NOT NULL, status TEXT, updated_at REAL)'
+    )
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status)')
+    # Transcripts are large and written once - kept out of the job row so clip
+    # edits and progress updates only rewrite the small record
+    conn.execute('CREATE TABLE IF NOT EXISTS job_transcripts (id TEXT PRIMARY KEY, data BLOB NOT NULL)')
+    # Listing index for profile_{id}.json files, so /profiles doesn't scan DATA_DIR
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS profiles ('
+        'id TEXT PRIMARY KEY, podcast_name TEXT, created_at TEXT, word_count INTEGER)'
+    )
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_profiles_created ON profiles(created_at DESC)')
+    # Uploaded video lookup by video id / job id, for clip extraction
+    conn.execute('CREATE TABLE IF NOT EXISTS uploads (key TEXT PRIMARY KEY, path TEXT NOT NULL)')
+    conn.commit()
+    return conn
+
+jobs_db = _open_jobs_db()
+
+def index_profile(profile_data):
+    """Add or refresh a profile's row in the listing index"""
+    with _jobs_db_lock:
+        jobs_db.execute(
+            'INSERT OR REPLACE INTO profiles (id, podcast_name, created_at, word_count) VALUES (?, ?, ?, ?)',
+            (profile_data['id'], profile_data['podcastName'], profile_data['createdAt'],
+             profile_data.get('wordCount', 0))
+        )
+        jobs_db.commit()
+
+def list_indexed_profiles():
+    """Profile summaries, newest first"""
+    with _jobs_db_lock:
+        rows = jobs_db.execute(
+            'SELECT id, podcast_name, created_at, word_count FROM profiles ORDER BY created_at DESC'
+        ).fetchall()
+    return [
+        {'id': row[0], 'podcastName': row[1], 'createdAt': row[2], 'wordCount': row[3]}
+        for row in rows
+    ]
+
+def _backfill_profile_index():
+    """Index profile files written before the index existed (runs once, on an empty index)"""
+    with _jobs_db_lock:
+        if jobs_db.execute('SELECT 1 FROM profiles LIMIT 1').fetchone():
+            return
+    for filename in os.listdir(DATA_DIR):
+        if filename.startswith('profile_') and filename.endswith('.json'):
+            data = load_data(filename)
+            if data:
+                index_profile(data)
+
+_backfill_profile_index()
+
+UPLOADS_DIR = os.path.join(DATA_DIR, 'uploads')
+VIDEO_EXTENSIONS = ('.mp4', '.mov', '.avi', '.mkv', '.webm')
+with _jobs_db_lock:
+    upload_index = dict(jobs_db.execute('SELECT key, path FROM uploads').fetchall())
+
+def register_upload(file_path, *keys):
+    """Remember where an uploaded video lives under each of the given ids"""
+    rows = [(key, file_path) for key in keys if key]
+    with _jobs_db_lock:
+        jobs_db.executemany('INSERT OR REPLACE INTO uploads (key, path) VALUES (?, ?)', rows)
+        jobs_db.commit()
+    upload_index.update(rows)
+
+def upload_path(video_id, file_ext):
+    """Deterministic, hash-partitioned location for a direct upload: uploads/<xx>/<video_id><ext>"""
+    partition = hashlib.blake2b(video_id.encode(), digest_size=1).hexdigest()
+    return os.path.join(UPLOADS_DIR, partition, f"{video_id}{file_ext}")
+
+def find_upload(video_id, job_id):
+    """Path of the uploaded video for a job; probes the partitioned layout, scans only for legacy files"""
+    for key in (video_id, job_id):
+        path = upload_index.get(key) if key else None
+        if path and os.path.exists(path):
+            return path
+
+    if video_id:
+        for ext in VIDEO_EXTENSIONS:
+            path = upload_path(video_id, ext)
+            if os.path.exists(path):
+                register_upload(path, video_id, job_id)
+                return path
+
+    # Uploads from before the partitioned layout sit flat in UPLOADS_DIR
+    if not os.path.exists(UPLOADS_DIR):
+        return None
+    by_video = by_job = None
+    for fname in os.listdir(UPLOADS_DIR):
+        if by_video is None and video_id and (fname.startswith(video_id) or video_id in fname):
+            by_video = os.path.join(UPLOADS_DIR, fname)
+        if by_job is None and job_id in fname:
+            by_job = os.path.join(UPLOADS_DIR, fname)
+    path = by_video or by_job
+    if path:
+        register_upload(path, video_id, job_id)
+    return path
+
+# Jobs are served from a process-wide cache in front of the SQLite table.
+# Writes mark the cached record dirty and a background thread flushes dirty
+# records every JOB_FLUSH_INTERVAL seconds, so a burst of progress updates or
+# clip edits to one job costs a single database write. Safe because the app
+# runs as a single process (see Procfile).
+JOB_FLUSH_INTERVAL = 0.5
+JOB_CACHE_ENTRIES = int(os.getenv('JOB_CACHE_ENTRIES', '64'))
+TERMINAL_JOB_STATUSES = ('complete', 'failed')
+
+class JobStore:
+    """In-memory job cache with write-behind persistence to the jobs table.
+
+    get() returns the shared cached dict; changes must go through update() or
+    put() so they are marked dirty and flushed.
+    """
+
+    def __init__(self, flush_interval=JOB_FLUSH_INTERVAL, max_entries=JOB_CACHE_ENTRIES):
+        self._cache = OrderedDict()  # job_id -> job dict, least recently used first
+        self._versions = {}  # job_id -> last write time, for ETags
+        self._dirty = set()
+        self._stored_transcripts = {}  # job_id -> transcript object last written to job_transcripts
+        self._lock = threading.RLock()
+        self._max_entries = max_entries
+        self._flush_interval = flush_interval
+        threading.Thread(target=self._flush_loop, name='job-flush', daemon=True).start()
+        atexit.register(self.flush)
+
+    def _read(self, job_id):
+        """Load a job row, migrating legacy job_{id}.json files on first access"""
+        with _jobs_db_lock:
+            row = jobs_db.execute('SELECT data, updated_at FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        if row:
+            job_data = loads_json(row[0])
+            if 'transcript' not in job_data:
+                with _jobs_db_lock:
+                    transcript_row = jobs_db.execute(
+                        'SELECT data FROM job_transcripts WHERE id = ?', (job_id,)
+                    ).fetchone()
+                if transcript_row:
+                    job_data['transcript'] = loads_json(transcript_row[0])
+                    self._stored_transcripts[job_id] = job_data['transcript']
+            return job_data, row[1]
+
+        job_data = load_data(f"job_{job_id}.json", JOBS_DIR)
+        if job_data:
+            # load_data's dict is shared, and job records are edited in place
+            job_data = copy.deepcopy(job_data)
+            job_data.setdefault('id', job_id)
+            return job_data, self._write(job_data)
+        return None, None
+
+    def _write(self, job_data):
+        """Insert or replace a job row (transcript only when it's a new one); returns its write time"""
+        written_at = time.time()
+        job_id = job_data['id']
+        transcript = job_data.get('transcript')
+        new_transcript = transcript is not None and self._stored_transcripts.get(job_id) is not transcript
+        payload = dumps_json({key: value for key, value in job_data.items() if key != 'transcript'})
+        with _jobs_db_lock:
+            if new_transcript:
+                jobs_db.execute(
+                    'INSERT OR REPLACE INTO job_transcripts (id, data) VALUES (?, ?)',
+                    (job_id, dumps_json(transcript))
+                )
+            jobs_db.execute(
+                'INSERT OR REPLACE INTO jobs (id, data, status, updated_at) VALUES (?, ?, ?, ?)',
+                (job_id, payload, job_data.get('status'), written_at)
+            )
+            jobs_db.commit()
+        if new_transcript:
+            self._stored_transcripts[job_id] = transcript
+        return written_at
+
+    def _remember(self, job_id, job_data, version):
+        self._cache[job_id] = job_data
+        self._cache.move_to_end(job_id)
+        self._versions[job_id] = version
+        # Evict the least recently used clean records
+        for old_id in list(self._cache):
+            if len(self._cache) <= self._max_entries:
+                break
+            if old_id not in self._dirty:
+                del self._cache[old_id]
+                self._versions.pop(old_id, None)
+                self._stored_transcripts.pop(old_id, None)
+
+    def get(self, job_id):
+        """The job record, or None"""
+        with self._lock:
+            job_data = self._cache.get(job_id)
+            if job_data is not None:
+                self._cache.move_to_end(job_id)
+                return job_data
+            job_data, version = self._read(job_id)
+            if job_data is not None:
+                self._remember(job_id, job_data, version)
+            return job_data
+
+    def update(self, job_id, mutator):
+        """Apply mutator(job) to the record (creating it if missing) and mark it dirty"""
+        with self._lock:
+            job_data = self.get(job_id) or {'id': job_id}
+            mutator(job_data)
+            self._dirty.add(job_id)
+            self._remember(job_id, job_data, time.time())
+            return job_data
+
+    def put(self, job_data):
+        """Replace a job record and mark it dirty"""
+        with self._lock:
+            self._dirty.add(job_data['id'])
+            self._remember(job_data['id'], job_data, time.time())
+            return job_data
+
+    def flush(self, job_id=None):
+        """Write dirty records (or just job_id's) to the database"""
+        with self._lock:
+            job_ids = [job_id] if job_id is not None else list(self._dirty)
+            for dirty_id in job_ids:
+                if dirty_id in self._dirty:
+                    self._dirty.discard(dirty_id)
+                    self._write(self._cache[dirty_id])
+
+    def modified_at(self, job_id):
+        """Last write time of a job record (epoch seconds), or None"""
+        with self._lock:
+            version = self._versions.get(job_id)
+        if version is None:
+            with _jobs_db_lock:
+                row = jobs_db.execute('SELECT updated_at FROM jobs WHERE id = ?', (job_id,)).fetchone()
+            version = row[0] if row else None
+        return version
+
+    def etag(self, job_id):
+        """Cheap validator for a job record, derived from its last write time (no JSON decode)"""
+        version = self.modified_at(job_id)
+        return f"{int(version * 1_000_000):x}" if version is not None else None
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(self._flush_interval)
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"[ERROR] Job flush failed: {e}")
+
+job_store = JobStore()
+
+def is_not_modified(etag):
+    """True if the client's If-None-Match already has this ETag"""
+    return etag is not None and request.if_none_match.contains_weak(etag)
+
+def _set_validators(response, etag, last_modified=None):
+    """Attach the ETag, Last-Modified and no-cache headers shared by a 200 and its 304"""
+    response.set_etag(etag, weak=True)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+def revalidated_json(payload, etag, last_modified=None):
+    """JSON response (payload or pre-serialized bytes) carrying validators; no-cache makes clients revalidate"""
+    if isinstance(payload, bytes):
+        response = Response(payload, mimetype='application/json')
+    else:
+        response = json_response(payload)
+    return _set_validators(response, etag, last_modified)
+
+def not_modified(etag, last_modified=None):
+    """Empty 304 carrying the same validators revalidated_json would send"""
+    return _set_validators(Response(status=304), etag, last_modified)
+
+# Serialized response bodies keyed by (endpoint, job id, ...), each tagged with
+# the job ETag it was built from and bounded by total size - word-level bodies
+# carry the whole transcript and run to megabytes
+BODY_CACHE_BYTES = int(os.getenv('BODY_CACHE_BYTES', str(32 * 1024 * 1024)))
+_body_cache = OrderedDict()
+_body_cache_size = 0
+_body_cache_lock = threading.Lock()
+
+def get_cached_body(key, etag):
+    """JSON bytes cached for key at this job version, or None"""
+    with _body_cache_lock:
+        cached = _body_cache.get(key)
+        if cached and cached[0] == etag:
+            _body_cache.move_to_end(key)
+            return cached[1]
     return None
 
+def cache_body(key, etag, payload):
+    """Serialize payload, cache the bytes for key at this job version and return them"""
+    global _body_cache_size
+    body = dumps_json(payload)
+    with _body_cache_lock:
+        old = _body_cache.pop(key, None)
+        if old:
+            _body_cache_size -= len(old[1])
+        if len(body) <= BODY_CACHE_BYTES:
+            _body_cache[key] = (etag, body)
+            _body_cache_size += len(body)
+            while _body_cache_size > BODY_CACHE_BYTES:
+                _, (_, evicted) = _body_cache.popitem(last=False)
+                _body_cache_size -= len(evicted)
+    return body
+
+# Buffer size for copying uploaded files to disk (Werkzeug's default is 16KB)
+UPLOAD_COPY_BUFSIZE = 4 * 1024 * 1024  # 4MB
+
+HAS_SENDFILE = hasattr(os, 'sendfile')
+
+def sendfile_all(out_fd, in_fd, count):
+    """Copy count bytes from the start of in_fd to out_fd inside the kernel (zero-copy)"""
+    offset = 0
+    while offset < count:
+        sent = os.sendfile(out_fd, in_fd, offset, count - offset)
+        if sent == 0:
+            break
+        offset += sent
+    return offset
+
+def save_uploaded_file(file_storage, dest_path):
+    """Copy an uploaded file to disk without loading it into memory.
+
+    Uses os.sendfile (kernel-side copy) when the upload is spooled to a real
+    temp file, otherwise falls back to a 4MB-buffered copy.
+    """
+    src = file_storage.stream
+    try:
+        in_fd = src.fileno()
+    except (AttributeError, OSError, ValueError):
+        # In-memory upload (BytesIO) - no file descriptor
+        in_fd = None
+
+    with open(dest_path, 'wb') as dst:
+        if in_fd is not None and HAS_SENDFILE:
+            sendfile_all(dst.fileno(), in_fd, os.fstat(in_fd).st_size)
+        else:
+            src.seek(0)
+            shutil.copyfileobj(src, dst, UPLOAD_COPY_BUFSIZE)
+    return dest_path
+
+def json_response(payload, status=200):
+    """Build a JSON Response directly from bytes, skipping jsonify's str round-trip"""
+    return Response(dumps_json(payload), status=status, mimetype='application/json')
+
+YOUTUBE_ID_PATTERNS = [
+    re.compile(r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/|youtube\.com\/v\/|youtube\.com\/shorts\/)([^&\s?#]+)'),
+    re.compile(r'^([a-zA-Z0-9_-]{11})$')  # Direct video ID
+]
+
 def extract_youtube_id(url):
     """Extract YouTube video ID from various URL formats"""
-    patterns = [
-        r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/|youtube\.com\/v\/|youtube\.com\/shorts\/)([^&\s?#]+)',
-        r'^([a-zA-Z0-9_-]{11})$'  # Direct video ID
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, url)
+    for pattern in YOUTUBE_ID_PATTERNS:
+        match = pattern.search(url)
         if match:
             return match.group(1)
     return None
 
+# [[H:]M:]S[.fff] - one C-level match instead of split + per-part conversions
+TIMESTAMP_RE = re.compile(r'^(?:(?:(\d+):)?(\d+):)?(\d+(?:\.\d*)?)$')
+
+@lru_cache(maxsize=4096)
 def parse_timestamp_to_seconds(timestamp_str):
-    """Convert timestamp string (HH:MM:SS or MM:SS) or integer to seconds"""
+    """Convert timestamp string (HH:MM:SS or MM:SS) or integer to seconds (cached - the editor resubmits the same values)"""
     # Handle both string and numeric inputs
     timestamp_str = str(timestamp_str).strip()
+    match = TIMESTAMP_RE.match(timestamp_str)
+    if match:
+        hours, minutes, secs = match.groups()
+        return int(hours or 0) * 3600 + int(minutes or 0) * 60 + float(secs)
+
+    # Anything unusual (signs, exponents, ...) keeps the old lenient parsing
     parts = timestamp_str.split(':')
     if len(parts) == 3:
         return int(parts[0]) * 3600 + int(parts[1]) * 60 + float(parts[2])
@@ -560,9 +1462,13 @@ def parse_timestamp_to_seconds(timestamp_str):
 
 def format_seconds_to_timestamp(seconds):
     """Convert seconds to MM:SS or HH:MM:SS format"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    return _format_whole_seconds(int(seconds))
+
+@lru_cache(maxsize=16384)
+def _format_whole_seconds(seconds):
+    """format_seconds_to_timestamp for an int (cached - word times repeat the same second)"""
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
 
     if hours > 0:
         return f"{hours}:{minutes:02d}:{secs:02d}"
@@ -723,6 +1629,8 @@ def format_section_answers(answers, section_name):
             formatted.append(f"{question_num}. {value}")
     return '\n'.join(formatted) if formatted else "No answers provided."
 
+SECTION_ANSWER_RE = re.compile(r'^q([1-7])')
+
 def generate_profile_with_gemini(podcast_name, host_names, answers):
     """Generate target audience profile using Gemini 2.0 Flash"""
 
@@ -733,24 +1641,16 @@ def generate_profile_with_gemini(podcast_name, host_names, answers):
         raise Exception("Gemini API key not configured. Please contact support.")
 
     try:
-        # Format all sections
-        section_map = {
-            'section1': 'q1',
-            'section2': 'q2',
-            'section3': 'q3',
-            'section4': 'q4',
-            'section5': 'q5',
-            'section6': 'q6',
-            'section7': 'q7'
-        }
+        # Format all sections - bucket answers by section in a single pass (q1_* -> section1, ...)
+        section_answers = {f'section{i}': [] for i in range(1, 8)}
+        for q_key, value in answers.items():
+            match = SECTION_ANSWER_RE.match(q_key)
+            if match:
+                section_answers[f'section{match.group(1)}'].append((q_key, value))
 
         formatted_sections = {}
-        for section_key, section_prefix in section_map.items():
-            section_answers = {k: v for k, v in answers.items() if k.startswith(section_prefix)}
-            formatted_lines = []
-            for q_key, value in sorted(section_answers.items()):
-                q_num = q_key.replace(section_prefix, '').strip('_')
-                formatted_lines.append(f"{q_num}. {value}")
+        for section_key, items in section_answers.items():
+            formatted_lines = [f"{q_key[2:].strip('_')}. {value}" for q_key, value in sorted(items)]
             formatted_sections[section_key] = '\n'.join(formatted_lines) if formatted_lines else "No answers provided."
 
         print(f"[DEBUG] Formatted sections: {list(formatted_sections.keys())}")
@@ -771,7 +1671,7 @@ def generate_profile_with_gemini(podcast_name, host_names, answers):
         print(f"[DEBUG] Calling Gemini API...")
 
         # Call Gemini API
-        model = genai.GenerativeModel('gemini-1.5-flash')
+        model = get_gemini_model('gemini-1.5-flash')
         response = model.generate_content(
             prompt,
             generation_config=genai.types.GenerationConfig(
@@ -796,27 +1696,65 @@ def generate_profile_with_gemini(podcast_name, host_names, answers):
 # ============================================================================
 
 def update_job_status(job_id, status, progress_message=None, **kwargs):
-    """Update job status and save to file"""
-    job_file = os.path.join(JOBS_DIR, f"job_{job_id}.json")
-
-    job_data = load_data(f"job_{job_id}.json", JOBS_DIR) or {}
-    job_data['status'] = status
-    job_data['updatedAt'] = datetime.now().isoformat()
+    """Update job status; terminal states are flushed to the database immediately"""
+    def apply(job_data):
+        job_data['status'] = status
+        job_data['updatedAt'] = datetime.now().isoformat()
 
-    if progress_message:
-        job_data['progressMessage'] = progress_message
+        if progress_message:
+            job_data['progressMessage'] = progress_message
 
-    # Update any additional fields
-    for key, value in kwargs.items():
-        job_data[key] = value
+        # Update any additional fields
+        for key, value in kwargs.items():
+            job_data[key] = value
 
-    save_data(f"job_{job_id}.json", job_data, JOBS_DIR)
+    job_data = job_store.update(job_id, apply)
+    if status in TERMINAL_JOB_STATUSES:
+        job_store.flush(job_id)
     return job_data
 
+# yt-dlp/ffmpeg invocations from the processing pipeline run as asyncio
+# subprocesses on one shared event loop thread, so waiting on a long download
+# or encode doesn't pin a thread per process. The semaphore caps concurrent
+# media tools at half the cores so parallel jobs don't thrash the CPU.
+MEDIA_WORKERS = int(os.getenv('MEDIA_WORKERS') or max(1, (os.cpu_count() or 2) // 2))
+media_loop = asyncio.new_event_loop()
+threading.Thread(target=media_loop.run_forever, name='media-loop', daemon=True).start()
+media_slots = asyncio.Semaphore(MEDIA_WORKERS)
+PIPE = subprocess.PIPE
+DEVNULL = subprocess.DEVNULL
+
+async def run_media_command_async(cmd, stdout=DEVNULL, stderr=DEVNULL, text=False, timeout=None):
+    """Run a command with asyncio.create_subprocess_exec; mirrors subprocess.run's result.
+
+    Output streams default to DEVNULL - pass PIPE only for output that is read.
+    """
+    async with media_slots:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdin=DEVNULL, stdout=stdout, stderr=stderr
+        )
+        try:
+            out, err = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(cmd, timeout)
+
+    if text:
+        out = out.decode(errors='replace') if out is not None else None
+        err = err.decode(errors='replace') if err is not None else None
+    return subprocess.CompletedProcess(cmd, proc.returncode, out, err)
+
+def run_media_command(cmd, stdout=DEVNULL, stderr=DEVNULL, text=False, timeout=None):
+    """Run a yt-dlp/ffmpeg command on the media event loop and wait for the result"""
+    future = asyncio.run_coroutine_threadsafe(
+        run_media_command_async(cmd, stdout=stdout, stderr=stderr, text=text, timeout=timeout),
+        media_loop
+    )
+    return future.result()
+
 def download_youtube_audio(youtube_url, video_id, output_dir='/tmp'):
     """Download audio from YouTube video using yt-dlp"""
-    import subprocess
-
     output_path = os.path.join(output_dir, f"{video_id}.mp3")
 
     # Path to cookies file (for YouTube authentication)
@@ -832,7 +1770,8 @@ def download_youtube_audio(youtube_url, video_id, output_dir='/tmp'):
         '--output', output_path,
         '--no-playlist',
         '--quiet',
-        '--no-warnings'
+        '--no-warnings',
+        '--print', 'after_move:duration'  # cached so transcription can skip ffprobe
     ]
 
     # Add cookies if file exists
@@ -843,10 +1782,17 @@ def download_youtube_audio(youtube_url, video_id, output_dir='/tmp'):
     cmd.append(youtube_url)
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+        result = run_media_command(cmd, stdout=PIPE, stderr=PIPE, text=True, timeout=300)
         if result.returncode != 0:
             raise Exception(f"yt-dlp failed: {result.stderr}")
 
+        printed = result.stdout.split()
+        if printed:
+            try:
+                save_audio_duration(video_id, float(printed[-1]))
+            except ValueError:
+                pass  # "NA" when yt-dlp doesn't know the duration
+
         if not os.path.exists(output_path):
             # Try to find the file with possible suffix
             possible_files = [f for f in os.listdir(output_dir) if f.startswith(video_id) and f.endswith('.mp3')]
@@ -861,44 +1807,403 @@ def download_youtube_audio(youtube_url, video_id, output_dir='/tmp'):
     except Exception as e:
         raise Exception(f"Failed to download audio: {str(e)}")
 
-def split_audio_for_whisper(audio_path, video_id, chunk_duration_minutes=10):
-    """Split large audio file into chunks for Whisper (25MB limit)"""
-    import subprocess
-    import math
+def save_audio_duration(video_id, duration):
+    """Remember an audio file's duration (reported by yt-dlp/ffmpeg) in meta_{video_id}.json"""
+    save_data(f"meta_{video_id}.json", {'duration_seconds': duration}, DATA_DIR)
+
+def get_cached_duration(video_id):
+    """Duration saved by save_audio_duration, or None"""
+    meta = load_data(f"meta_{video_id}.json", DATA_DIR)
+    return meta.get('duration_seconds') if meta else None
 
-    # Get audio duration
+def get_audio_duration(audio_path):
+    """Audio duration in seconds via ffprobe"""
     cmd = ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
            '-of', 'default=noprint_wrappers=1:nokey=1', audio_path]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    total_duration = float(result.stdout.strip())
+    result = run_media_command(cmd, stdout=PIPE, text=True)
+    return float(result.stdout.strip())
+
+WHISPER_CHUNK_SECONDS = 10 * 60
+WHISPER_OVERLAP_SECONDS = 8  # audio repeated at the start of each following chunk
+
+# Silence skipping: ffmpeg's silencedetect finds pauses, intros/outros and ad
+# gaps so only voiced audio is sent (and billed) to Whisper. Timestamps are
+# mapped back to the original timeline afterwards. Opt-in, since detection is
+# an extra full decode of the audio before any upload starts.
+WHISPER_SKIP_SILENCE = os.getenv('WHISPER_SKIP_SILENCE', 'false').lower() == 'true'
+SILENCE_NOISE_DB = os.getenv('SILENCE_NOISE_DB', '-35dB')
+SILENCE_MIN_SECONDS = float(os.getenv('SILENCE_MIN_SECONDS', '2'))
+SILENCE_PAD_SECONDS = 0.25  # keep a little audio either side of speech
+SILENCE_RE = re.compile(r'silence_(start|end): (-?\d+(?:\.\d+)?)')
+
+def detect_speech_spans(audio_path, total_duration):
+    """Voiced (start, end) spans of the audio in seconds, from ffmpeg silencedetect"""
+    cmd = [
+        'ffmpeg', '-nostdin', '-i', audio_path,
+        '-af', f'silencedetect=noise={SILENCE_NOISE_DB}:d={SILENCE_MIN_SECONDS}',
+        '-f', 'null', '-'
+    ]
+    result = run_media_command(cmd, stderr=PIPE, text=True)
+    if result.returncode != 0:
+        return [(0.0, total_duration)]
+
+    spans = []
+    voiced_from = 0.0
+    for kind, value in SILENCE_RE.findall(result.stderr):
+        if kind == 'start':
+            voiced_to = min(float(value) + SILENCE_PAD_SECONDS, total_duration)
+            if voiced_from is not None and voiced_to > voiced_from:
+                spans.append((voiced_from, voiced_to))
+            voiced_from = None
+        else:
+            voiced_from = max(float(value) - SILENCE_PAD_SECONDS, 0.0)
+    if voiced_from is not None and total_duration > voiced_from:
+        spans.append((voiced_from, total_duration))
+    return spans
+
+def plan_whisper_chunks(spans, max_seconds=WHISPER_CHUNK_SECONDS, overlap=WHISPER_OVERLAP_SECONDS):
+    """Pack voiced spans into chunks holding at most max_seconds of audio each.
+
+    Every chunk after the first also repeats the last `overlap` seconds of the
+    chunk before it, so words cut at a boundary are heard whole at least once.
+    Returns (spans, own_start) pairs; own_start is where the chunk's new audio
+    begins on the original timeline (None for the first chunk).
+    """
+    chunks = []
+    current = []
+    length = 0.0
+    for start, end in spans:
+        while end > start:
+            take = min(end - start, max_seconds - length)
+            current.append((start, start + take))
+            length += take
+            start += take
+            if length >= max_seconds:
+                chunks.append(current)
+                current = []
+                length = 0.0
+    if current:
+        chunks.append(current)
+
+    planned = [(chunks[0], None)] if chunks else []
+    for previous, chunk in zip(chunks, chunks[1:]):
+        tail = []
+        remaining = overlap
+        for start, end in reversed(previous):
+            if remaining <= 0:
+                break
+            take = min(end - start, remaining)
+            tail.insert(0, (end - take, end))
+            remaining -= take
+        # Rejoin a span that was split at the boundary so ffmpeg sees one range
+        if tail and tail[-1][1] == chunk[0][0]:
+            tail[-1] = (tail[-1][0], chunk[0][1])
+            planned.append((tail + chunk[1:], chunk[0][0]))
+        else:
+            planned.append((tail + chunk, chunk[0][0]))
+    return planned
+
+def make_time_map(spans):
+    """Map a time in the compacted chunk audio back onto the original timeline"""
+    offsets = []
+    compacted = 0.0
+    for start, end in spans:
+        offsets.append(compacted)
+        compacted += end - start
+
+    def to_original(t):
+        i = max(bisect.bisect_right(offsets, t) - 1, 0)
+        start, end = spans[i]
+        return min(start + (t - offsets[i]), end)
+
+    return to_original
+
+def encode_audio_chunk(audio_path, chunk_index, spans):
+    """Encode one Whisper-sized chunk (a list of (start, end) spans) straight to memory.
+
+    -ss/-t go before -i so ffmpeg seeks in the input and only decodes this
+    chunk's range; with several spans an aselect filter drops the silences in
+    between. The mp3 comes back over stdout as a named BytesIO for the API.
+    """
+    range_start = spans[0][0]
+    range_end = spans[-1][1]
+    cmd = [
+        'ffmpeg', '-nostdin', '-v', 'error',
+        '-ss', str(range_start), '-t', str(range_end - range_start),
+        '-i', audio_path,
+        '-vn'
+    ]
+    if len(spans) > 1:
+        keep = '+'.join(f'between(t,{start - range_start:.3f},{end - range_start:.3f})' for start, end in spans)
+        cmd += ['-af', f"aselect='{keep}',asetpts=N/SR/TB"]
+    cmd += [
+        '-acodec', 'libmp3lame',
+        '-ar', '16000', '-ac', '1', '-b:a', '32k',
+        '-f', 'mp3', 'pipe:1'
+    ]
+    result = run_media_command(cmd, stdout=PIPE, stderr=PIPE)
+    if result.returncode != 0 or not result.stdout:
+        raise Exception(f"ffmpeg failed on chunk {chunk_index}: {result.stderr.decode(errors='replace')[-500:]}")
+
+    chunk = io.BytesIO(result.stdout)
+    chunk.name = f"chunk_{chunk_index:03d}.mp3"
+    return chunk
+
+# Whisper requests are pure network waits, so chunks of one episode are
+# transcribed side by side. The pool is shared across jobs, which also caps
+# the number of concurrent OpenAI calls.
+WHISPER_WORKERS = int(os.getenv('WHISPER_WORKERS', '4'))
+whisper_pool = ThreadPoolExecutor(max_workers=WHISPER_WORKERS, thread_name_prefix='whisper')
+
+# Whisper uploads go out through the shared httpx client directly: httpx's
+# multipart encoder streams file objects in small blocks, so a 24MB direct
+# upload never sits in memory in full (the OpenAI SDK reads the whole file first).
+whisper_http = api_http
+# Retries for rate limits, server errors and dropped connections, as the SDK
+# does on its own calls: exponential backoff unless the API sends Retry-After
+WHISPER_MAX_RETRIES = int(os.getenv('WHISPER_MAX_RETRIES', '2'))
+WHISPER_RETRY_STATUSES = frozenset({408, 409, 429})
+WHISPER_MAX_RETRY_DELAY = 60.0
+
+def whisper_retry_delay(attempt, response=None):
+    """Seconds to wait before retry number attempt (0-based)"""
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    try:
+        return min(WHISPER_MAX_RETRY_DELAY, max(0.0, float(retry_after)))
+    except (TypeError, ValueError):
+        return min(8.0, 0.5 * 2 ** attempt) * random.uniform(0.75, 1.0)
+
+def request_whisper_transcription(audio_file):
+    """POST audio to the Whisper transcription endpoint; returns the verbose_json response"""
+    if whisper_http is None:
+        return openai_client.audio.transcriptions.create(
+            model="whisper-1",
+            file=audio_file,
+            response_format="verbose_json"
+        )
+
+    for attempt in range(WHISPER_MAX_RETRIES + 1):
+        audio_file.seek(0)
+        try:
+            response = whisper_http.post(
+                f"{openai_client.base_url}audio/transcriptions",
+                headers={'Authorization': f'Bearer {OPENAI_API_KEY}'},
+                data={'model': 'whisper-1', 'response_format': 'verbose_json'},
+                files={'file': (os.path.basename(audio_file.name), audio_file, 'audio/mpeg')}
+            )
+        except httpx.TransportError as e:
+            if attempt == WHISPER_MAX_RETRIES:
+                raise
+            delay = whisper_retry_delay(attempt)
+            print(f"[WHISPER] Connection error ({e}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+            continue
+        retryable = response.status_code in WHISPER_RETRY_STATUSES or response.status_code >= 500
+        if not retryable or attempt == WHISPER_MAX_RETRIES:
+            break
+        delay = whisper_retry_delay(attempt, response)
+        print(f"[WHISPER] API returned {response.status_code}, retrying in {delay:.1f}s")
+        time.sleep(delay)
+
+    if response.status_code != 200:
+        raise Exception(f"Whisper API error {response.status_code}: {response.text[:500]}")
+    # Attribute access, like the SDK's response objects
+    return json.loads(response.content, object_hook=lambda d: SimpleNamespace(**d))
+
+def transcribe_audio_chunk(audio_file, to_original=None):
+    """Transcribe an open audio file with Whisper.
+
+    to_original maps chunk-relative seconds back to the episode timeline.
+    Returns (segments, words, full_text, duration); word indices are assigned
+    by the caller once chunks are merged in order.
+    """
+    if to_original is None:
+        to_original = lambda t: t
 
-    chunk_duration = chunk_duration_minutes * 60  # Convert to seconds
-    num_chunks = math.ceil(total_duration / chunk_duration)
+    response = request_whisper_transcription(audio_file)
 
-    chunks_dir = os.path.join(TRANSCRIPTS_DIR, f"chunks_{video_id}")
-    os.makedirs(chunks_dir, exist_ok=True)
+    segments = []
+    words = []
+    text_parts = []
 
-    chunk_files = []
-    for i in range(num_chunks):
-        start_time = i * chunk_duration
-        chunk_path = os.path.join(chunks_dir, f"chunk_{i:03d}.mp3")
+    for segment in response.segments:
+        # Adjust timestamps for chunk position / removed silence
+        adjusted_start = to_original(segment.start)
+        adjusted_end = to_original(segment.end)
 
-        # Extract chunk
-        cmd = [
-            'ffmpeg', '-y',
-            '-i', audio_path,
-            '-ss', str(start_time),
-            '-t', str(chunk_duration),
-            '-vn', '-acodec', 'libmp3lame',
-            '-ar', '16000', '-ac', '1', '-b:a', '32k',
-            chunk_path
-        ]
-        subprocess.run(cmd, capture_output=True)
+        start_time = format_seconds_to_timestamp(adjusted_start)
+        end_time = format_seconds_to_timestamp(adjusted_end)
+        text = segment.text.strip()
+
+        segments.append({
+            'start': start_time, 'end': end_time, 'text': text,
+            'start_seconds': adjusted_start, 'end_seconds': adjusted_end
+        })
+        text_parts.append(f"[{start_time}] {text}\n")
+
+        # Extract words from segment (OpenAI Whisper format) with adjusted timestamps
+        if hasattr(segment, 'words') and segment.words:
+            for word in segment.words:
+                words.append({
+                    'text': word.word.strip(),
+                    'start': to_original(word.start),
+                    'end': to_original(word.end)
+                })
+
+    return segments, words, ''.join(text_parts), response.duration
 
-        if os.path.exists(chunk_path):
-            chunk_files.append((chunk_path, start_time))
+def transcribe_audio_spans(audio_path, chunk_index, spans):
+    """Encode and transcribe one chunk of a recording (runs on whisper_pool)"""
+    return transcribe_audio_chunk(encode_audio_chunk(audio_path, chunk_index, spans), make_time_map(spans))
 
-    return chunk_files, total_duration
+def _match_tokens(texts):
+    """Normalise words for overlap matching (case and punctuation insensitive)"""
+    return [t.strip(string.punctuation).lower() for t in texts]
+
+def count_overlap_tokens(previous, following):
+    """How many leading tokens of `following` repeat the tail of `previous`.
+
+    Uses the matching blocks of difflib's SequenceMatcher and cuts after the
+    last block of two or more tokens, so a stray common word doesn't count.
+    """
+    matcher = difflib.SequenceMatcher(None, previous, following, autojunk=False)
+    cut = 0
+    for block in matcher.get_matching_blocks():
+        if block.size >= 2:
+            cut = block.b + block.size
+    return cut
+
+def trim_chunk_overlap(prev_segments, prev_words, segments, words, overlap_start, own_start):
+    """Drop the part of a chunk's transcript that repeats the previous chunk.
+
+    The chunk's audio starts at overlap_start and its new audio at own_start.
+    Words are aligned on tokens; if nothing lines up, anything heard before
+    own_start is treated as already transcribed.
+    """
+    cut_time = own_start
+    if words:
+        prev_tail = [w['text'] for w in prev_words if w['start'] >= overlap_start]
+        head = [w for w in words if w['start'] < own_start + WHISPER_OVERLAP_SECONDS]
+        cut = count_overlap_tokens(_match_tokens(prev_tail), _match_tokens(w['text'] for w in head))
+        if not cut:
+            cut = sum(1 for w in head if w['start'] < own_start)
+        words = words[cut:]
+        if words:
+            cut_time = words[0]['start']
+
+    prev_tail = []
+    for seg in prev_segments:
+        if seg['end_seconds'] >= overlap_start:
+            prev_tail.extend(seg['text'].split())
+
+    kept = []
+    for seg in segments:
+        if seg['end_seconds'] <= cut_time:
+            continue
+        if seg['start_seconds'] < cut_time:
+            tokens = seg['text'].split()
+            cut = count_overlap_tokens(_match_tokens(prev_tail), _match_tokens(tokens))
+            if cut >= len(tokens):
+                continue
+            seg = dict(seg, text=' '.join(tokens[cut:]))
+            if cut:
+                seg['start_seconds'] = cut_time
+                seg['start'] = format_seconds_to_timestamp(cut_time)
+        kept.append(seg)
+    return kept, words
+
+def add_editor_fields(segments):
+    """Store the transcript editor's per-segment fields (id, timestamp_text) once, at transcription time"""
+    for seg in segments:
+        seg['id'] = seg.get('start_seconds', 0)
+        seg['timestamp_text'] = f"[{seg['start']}] {seg['text']}"
+    return segments
+
+def format_editor_segments(segments):
+    """Editor-shaped copies of segments saved before add_editor_fields existed"""
+    # (each key looked up once per segment - this runs over thousands of rows)
+    return [{
+        'id': (start_seconds := seg.get('start_seconds', 0)),
+        'start': (start := seg['start']),
+        'end': seg['end'],
+        'start_seconds': start_seconds,
+        'end_seconds': seg.get('end_seconds', 0),
+        'text': (text := seg['text']),
+        'timestamp_text': f"[{start}] {text}"
+    } for seg in segments]
+
+def audio_fingerprint(audio_path):
+    """Content hash of an audio file, used as a transcript cache key"""
+    with open(audio_path, 'rb') as f:
+        return hashlib.file_digest(f, 'blake2b').hexdigest()[:32]
+
+# Cached transcripts are zstd-compressed JSON (roughly 5x smaller than the raw
+# file); legacy transcript_{key}.json files are upgraded on first read.
+TRANSCRIPT_EXT = '.json.zst' if ZSTD_AVAILABLE else '.json'
+if ZSTD_AVAILABLE:
+    zstd_compressor = zstandard.ZstdCompressor(level=6)
+    zstd_decompressor = zstandard.ZstdDecompressor()
+
+def _transcript_path(key, ext=TRANSCRIPT_EXT):
+    return os.path.join(TRANSCRIPTS_DIR, f"transcript_{key}{ext}")
+
+def write_transcript(key, transcript_data):
+    """Write a transcript file (compressed when zstandard is installed)"""
+    payload = dumps_json(transcript_data)
+    if ZSTD_AVAILABLE:
+        payload = zstd_compressor.compress(payload)
+    path = _transcript_path(key)
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+def read_transcript(key):
+    """Load a cached transcript by video id or fingerprint; None if there isn't one"""
+    path = _transcript_path(key)
+    if ZSTD_AVAILABLE and os.path.exists(path):
+        with open(path, 'rb') as f:
+            return loads_json(zstd_decompressor.decompress(f.read()))
+
+    legacy_path = _transcript_path(key, '.json')
+    if ZSTD_AVAILABLE and os.path.islink(legacy_path):
+        # Legacy video id link - upgrade the file it points at, then relink
+        target_key = os.readlink(legacy_path)[len('transcript_'):-len('.json')]
+        transcript_data = read_transcript(target_key)
+        if transcript_data is not None:
+            try:
+                os.unlink(legacy_path)
+            except FileNotFoundError:
+                pass
+            link_transcript(target_key, key)
+        return transcript_data
+
+    transcript_data = load_data(f"transcript_{key}.json", TRANSCRIPTS_DIR)
+    if transcript_data is None:
+        return None
+    if ZSTD_AVAILABLE:
+        write_transcript(key, transcript_data)
+        try:
+            os.remove(legacy_path)
+        except FileNotFoundError:
+            pass
+    # load_data's dict is shared; callers set top-level keys (videoId) on theirs
+    return dict(transcript_data)
+
+def link_transcript(fingerprint, video_id):
+    """Point the video id's transcript file at the content-addressed transcript file"""
+    link_path = _transcript_path(video_id)
+    try:
+        os.symlink(os.path.basename(_transcript_path(fingerprint)), link_path)
+    except FileExistsError:
+        pass
+    except OSError:
+        shutil.copyfile(_transcript_path(fingerprint), link_path)
+
+def save_transcript(transcript_data, video_id, fingerprint):
+    """Save a transcript under its audio fingerprint and link the video id to it"""
+    write_transcript(fingerprint, transcript_data)
+    link_transcript(fingerprint, video_id)
 
 def transcribe_with_whisper(audio_path, video_id):
     """Transcribe audio using OpenAI Whisper API - splits large files"""
@@ -906,140 +2211,220 @@ def transcribe_with_whisper(audio_path, video_id):
         raise Exception("OpenAI API key not configured")
 
     # Check if transcript already exists (caching)
-    transcript_file = os.path.join(TRANSCRIPTS_DIR, f"transcript_{video_id}.json")
-    if os.path.exists(transcript_file):
-        return load_data(f"transcript_{video_id}.json", TRANSCRIPTS_DIR)
+    transcript_data = read_transcript(video_id)
+    if transcript_data:
+        transcript_data['videoId'] = video_id
+        return transcript_data
+
+    # Same audio under a different video id/upload - reuse that transcript
+    fingerprint = audio_fingerprint(audio_path)
+    cached = read_transcript(fingerprint)
+    if cached:
+        print(f"[WHISPER] Reusing transcript for identical audio ({fingerprint})")
+        cached['videoId'] = video_id
+        link_transcript(fingerprint, video_id)
+        return cached
 
     # Check file size
     file_size = os.path.getsize(audio_path)
     print(f"[WHISPER] Audio file size: {file_size / (1024*1024):.1f} MB")
 
-    # If file is small enough, transcribe directly
-    if file_size < 24 * 1024 * 1024:  # Under 24MB
+    total_duration = get_cached_duration(video_id) or get_audio_duration(audio_path)
+    spans = [(0.0, total_duration)]
+    if WHISPER_SKIP_SILENCE:
+        spans = detect_speech_spans(audio_path, total_duration)
+        voiced = sum(end - start for start, end in spans)
+        print(f"[WHISPER] Voiced audio: {voiced:.0f}s of {total_duration:.0f}s")
+        if voiced >= 0.9 * total_duration:
+            spans = [(0.0, total_duration)]  # not enough silence to be worth cutting
+
+    # If file is small enough (and has no silence worth skipping), transcribe directly
+    if file_size < 24 * 1024 * 1024 and len(spans) == 1 and spans[0] == (0.0, total_duration):
         print(f"[WHISPER] Transcribing directly...")
         with open(audio_path, 'rb') as audio_file:
-            response = openai_client.audio.transcriptions.create(
-                model="whisper-1",
-                file=audio_file,
-                response_format="verbose_json"
-            )
+            segments, words, full_text, duration = transcribe_audio_chunk(audio_file)
+        for idx, word in enumerate(words):
+            word['index'] = idx
 
-        segments = []
-        words = []
-        full_text = ""
-        
-        # Process segments and extract word-level timestamps
-        word_idx = 0
-        for segment in response.segments:
-            start_time = format_seconds_to_timestamp(segment.start)
-            end_time = format_seconds_to_timestamp(segment.end)
-            text = segment.text.strip()
-            segments.append({
-                'start': start_time, 'end': end_time, 'text': text,
-                'start_seconds': segment.start, 'end_seconds': segment.end
-            })
-            full_text += f"[{start_time}] {text}\n"
-            
-            # Extract words from segment (OpenAI Whisper format)
-            if hasattr(segment, 'words') and segment.words:
-                for word in segment.words:
-                    words.append({
-                        'text': word.word.strip(),
-                        'start': word.start,
-                        'end': word.end,
-                        'index': word_idx
-                    })
-                    word_idx += 1
-        
         if words:
             print(f"[WHISPER] Word-level timestamps: {len(words)} words")
 
         transcript_data = {
-            'videoId': video_id, 'segments': segments, 'fullText': full_text,
+            'videoId': video_id, 'segments': add_editor_fields(segments), 'fullText': full_text,
             'words': words,  # Store word-level data
-            'duration': format_seconds_to_timestamp(response.duration),
+            'duration': format_seconds_to_timestamp(duration),
             'createdAt': datetime.now().isoformat()
         }
-        save_data(f"transcript_{video_id}.json", transcript_data, TRANSCRIPTS_DIR)
+        save_transcript(transcript_data, video_id, fingerprint)
         return transcript_data
 
-    # File too large - split into chunks
-    print(f"[WHISPER] File too large, splitting into chunks...")
-    chunk_files, total_duration = split_audio_for_whisper(audio_path, video_id)
-    print(f"[WHISPER] Split into {len(chunk_files)} chunks")
+    # Otherwise split into chunks of voiced audio. Each worker encodes its own
+    # chunk to memory and uploads it, so encoding one overlaps uploading another.
+    chunks = plan_whisper_chunks(spans)
+    print(f"[WHISPER] Splitting into {len(chunks)} chunks...")
+    futures = [
+        whisper_pool.submit(transcribe_audio_spans, audio_path, i, chunk_spans)
+        for i, (chunk_spans, _) in enumerate(chunks)
+    ]
 
     all_segments = []
     all_words = []
-    full_text = ""
-    word_index_offset = 0
-
-    for idx, (chunk_path, chunk_offset) in enumerate(chunk_files):
-        print(f"[WHISPER] Transcribing chunk {idx+1}/{len(chunk_files)}...")
-
-        with open(chunk_path, 'rb') as audio_file:
-            response = openai_client.audio.transcriptions.create(
-                model="whisper-1",
-                file=audio_file,
-                response_format="verbose_json"
-            )
-
-        for segment in response.segments:
-            # Adjust timestamps for chunk offset
-            adjusted_start = segment.start + chunk_offset
-            adjusted_end = segment.end + chunk_offset
 
-            start_time = format_seconds_to_timestamp(adjusted_start)
-            end_time = format_seconds_to_timestamp(adjusted_end)
-            text = segment.text.strip()
-
-            all_segments.append({
-                'start': start_time, 'end': end_time, 'text': text,
-                'start_seconds': adjusted_start, 'end_seconds': adjusted_end
-            })
-            full_text += f"[{start_time}] {text}\n"
-            
-            # Extract words from segment with adjusted timestamps
-            if hasattr(segment, 'words') and segment.words:
-                for word in segment.words:
-                    adjusted_word_start = word.start + chunk_offset
-                    adjusted_word_end = word.end + chunk_offset
-                    all_words.append({
-                        'text': word.word.strip(),
-                        'start': adjusted_word_start,
-                        'end': adjusted_word_end,
-                        'index': word_index_offset
-                    })
-                    word_index_offset += 1
-
-        # Clean up chunk file
-        try:
-            os.remove(chunk_path)
-        except:
-            pass
-
-    # Clean up chunks directory
-    try:
-        chunks_dir = os.path.join(TRANSCRIPTS_DIR, f"chunks_{video_id}")
-        os.rmdir(chunks_dir)
-    except:
-        pass
+    # Merge in chunk order so segments and word indices stay chronological,
+    # dropping the overlap each chunk shares with the one before it
+    for idx, future in enumerate(futures):
+        segments, words, _, _ = future.result()
+        print(f"[WHISPER] Chunk {idx+1}/{len(futures)} transcribed")
+        chunk_spans, own_start = chunks[idx]
+        if own_start is not None:
+            segments, words = trim_chunk_overlap(all_segments, all_words, segments, words,
+                                                 chunk_spans[0][0], own_start)
+        all_segments.extend(segments)
+        for word in words:
+            word['index'] = len(all_words)
+            all_words.append(word)
+
+    full_text = ''.join(f"[{seg['start']}] {seg['text']}\n" for seg in all_segments)
 
     transcript_data = {
         'videoId': video_id,
-        'segments': all_segments,
+        'segments': add_editor_fields(all_segments),
         'fullText': full_text,
         'words': all_words,  # Store word-level data
         'duration': format_seconds_to_timestamp(total_duration),
         'createdAt': datetime.now().isoformat()
     }
 
-    save_data(f"transcript_{video_id}.json", transcript_data, TRANSCRIPTS_DIR)
+    save_transcript(transcript_data, video_id, fingerprint)
     print(f"[WHISPER] Transcription complete: {len(all_segments)} segments, {len(all_words)} words")
     return transcript_data
 
+# Clip analysis prompt budget. The transcript is regrouped into ~30s
+# paragraphs (one timestamp each instead of one per Whisper segment) and, if it
+# is still over budget, sampled from the start, middle and end.
+CLIP_PROMPT_MAX_TOKENS = int(os.getenv('CLIP_PROMPT_MAX_TOKENS', '15000'))
+CLIP_PARAGRAPH_SECONDS = 30
+TRANSCRIPT_LINE_RE = re.compile(r'^\[([\d:.]+)\]\s*(.*)$')
+_clip_encoding = None
+
+def count_prompt_tokens(texts):
+    """gpt-4o-mini token counts for each text (tiktoken, else a chars/4 estimate)"""
+    global _clip_encoding
+    if _clip_encoding is None:
+        _clip_encoding = False
+        if TIKTOKEN_AVAILABLE:
+            try:
+                _clip_encoding = tiktoken.encoding_for_model('gpt-4o-mini')
+            except Exception as e:
+                print(f"[WARN] tiktoken encoding unavailable, estimating tokens: {e}")
+    if _clip_encoding:
+        return [len(tokens) for tokens in _clip_encoding.encode_ordinary_batch(texts)]
+    return [len(text) // 4 + 1 for text in texts]
+
+def compact_transcript(transcript_text):
+    """Regroup '[ts] text' transcript lines into paragraphs of ~CLIP_PARAGRAPH_SECONDS"""
+    paragraphs = []
+    para_start = None
+    para_seconds = 0.0
+    parts = []
+    for line in transcript_text.splitlines():
+        match = TRANSCRIPT_LINE_RE.match(line)
+        if not match:
+            if line.strip():
+                parts.append(line.strip())
+            continue
+        timestamp, text = match.groups()
+        seconds = parse_timestamp_to_seconds(timestamp)
+        if para_start is None or seconds - para_seconds >= CLIP_PARAGRAPH_SECONDS:
+            if parts:
+                paragraphs.append(f"[{para_start}] {' '.join(parts)}" if para_start else ' '.join(parts))
+            para_start, para_seconds, parts = timestamp, seconds, []
+        if text:
+            parts.append(text)
+    if parts:
+        paragraphs.append(f"[{para_start}] {' '.join(parts)}" if para_start else ' '.join(parts))
+    return paragraphs
+
+def fit_transcript_to_budget(transcript_text, max_tokens=CLIP_PROMPT_MAX_TOKENS):
+    """Compact the transcript and sample head/middle/tail if it exceeds max_tokens"""
+    paragraphs = compact_transcript(transcript_text)
+    counts = count_prompt_tokens(paragraphs)
+    if sum(counts) <= max_tokens:
+        return '\n'.join(paragraphs)
+
+    def take(indices, budget):
+        picked = []
+        for i in indices:
+            if counts[i] > budget:
+                break
+            budget -= counts[i]
+            picked.append(i)
+        return picked
+
+    share = max_tokens // 3
+    n = len(paragraphs)
+    head = take(range(n), share)
+    tail = take(range(n - 1, -1, -1), share)
+    middle = take(range(n // 2, n), share)
+    mid_start = max(n // 2 - len(middle) // 2, 0)
+    middle = range(mid_start, mid_start + len(middle))
+
+    lines = []
+    previous = None
+    for i in sorted(set(head) | set(middle) | set(tail)):
+        if previous is not None and i != previous + 1:
+            lines.append('[...]')
+        lines.append(paragraphs[i])
+        previous = i
+    print(f"[INFO] Transcript over {max_tokens} tokens, sampled {len(lines)} of {n} paragraphs")
+    return '\n'.join(lines)
+
+# Clip suggestions are cached on disk by a hash of the transcript text and the
+# audience profile, with the most recent few also kept in memory as JSON bytes.
+CLIP_CACHE_ENTRIES = 64
+_clip_cache = {}  # key -> JSON bytes, oldest first
+
+def clip_cache_key(transcript_text, target_audience_profile):
+    """Cache key for a clip analysis of this transcript for this audience"""
+    digest = hashlib.blake2b(transcript_text.encode('utf-8'), digest_size=12)
+    digest.update(b'|')
+    digest.update(target_audience_profile.encode('utf-8'))
+    return digest.hexdigest()
+
+def _remember_clips(key, payload):
+    _clip_cache.pop(key, None)
+    _clip_cache[key] = payload
+    while len(_clip_cache) > CLIP_CACHE_ENTRIES:
+        _clip_cache.pop(next(iter(_clip_cache)), None)
+
+def get_cached_clips(key):
+    """Previously validated clips for this key, or None"""
+    payload = _clip_cache.get(key)
+    if payload is None:
+        path = os.path.join(TRANSCRIPTS_DIR, f"clips_{key}.json")
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            payload = f.read()
+        _remember_clips(key, payload)
+    return loads_json(payload)
+
+def cache_clips(key, clips):
+    """Store validated clips under key"""
+    payload = dumps_json(clips)
+    with open(os.path.join(TRANSCRIPTS_DIR, f"clips_{key}.json"), 'wb') as f:
+        f.write(payload)
+    _remember_clips(key, payload)
+
 def analyze_clips_with_gemini(transcript_text, target_audience_profile):
     """Analyze transcript and suggest clips using OpenAI GPT (renamed for backwards compat)"""
     try:
+        cache_key = clip_cache_key(transcript_text, target_audience_profile)
+        cached = get_cached_clips(cache_key)
+        if cached:
+            print(f"[INFO] Reusing clip analysis ({cache_key})")
+            return cached
+
         if not OPENAI_AVAILABLE or not openai_client:
             print("[WARN] OpenAI not available, returning fallback")
             return [{
@@ -1059,7 +2444,7 @@ def analyze_clips_with_gemini(transcript_text, target_audience_profile):
         # Build the prompt
         prompt = CLIP_ANALYSIS_PROMPT % {
             'target_audience_profile': target_audience_profile,
-            'transcript': transcript_text[:150000]
+            'transcript': fit_transcript_to_budget(transcript_text)
         }
 
         print("[INFO] Calling OpenAI GPT-4 for clip analysis...")
@@ -1134,6 +2519,8 @@ def analyze_clips_with_gemini(transcript_text, target_audience_profile):
                 continue
 
         print(f"[INFO] Successfully validated {len(validated_clips)} clips")
+        if validated_clips:
+            cache_clips(cache_key, validated_clips)
         return validated_clips if validated_clips else [{
             'start_timestamp': '00:00',
             'end_timestamp': '10:00',
@@ -1158,18 +2545,25 @@ def analyze_clips_with_gemini(transcript_text, target_audience_profile):
             'why_it_works': 'This is a fallback response due to a processing error.'
         }]
 
-def process_episode_async(job_id, youtube_url, video_id, podcast_name, profile_id=None):
-    """Process episode in background thread"""
+def _run_pipeline(job_id, prepare_message, prepare_audio, video_id, podcast_name, profile_id=None):
+    """Shared job pipeline: prepare audio, transcribe, analyze and store the result.
+
+    prepare_audio() produces the temp audio file (yt-dlp download or ffmpeg
+    extraction); it is removed afterwards whether or not the job succeeds.
+    """
     audio_path = None
 
     try:
-        # Step 1: Download audio
-        update_job_status(job_id, 'downloading', 'Downloading audio from YouTube...')
-        audio_path = download_youtube_audio(youtube_url, video_id)
+        # Step 1: Download / extract audio
+        update_job_status(job_id, 'downloading', prepare_message)
+        audio_path = prepare_audio()
 
         # Step 2: Transcribe
         update_job_status(job_id, 'transcribing', 'Transcribing audio with Whisper...')
         transcript_data = transcribe_with_whisper(audio_path, video_id)
+        # Parse the word-level transcript here on the job worker so the editor
+        # doesn't pay for it on the first request after the job completes
+        cache_word_transcript(job_id, create_word_transcript_from_job({'transcript': transcript_data}))
 
         # Step 3: Get target audience profile
         update_job_status(job_id, 'analyzing', 'Retrieving target audience profile...')
@@ -1208,83 +2602,60 @@ def process_episode_async(job_id, youtube_url, video_id, podcast_name, profile_i
             except:
                 pass
 
+def process_episode_async(job_id, youtube_url, video_id, podcast_name, profile_id=None):
+    """Process episode in background thread"""
+    _run_pipeline(
+        job_id, 'Downloading audio from YouTube...',
+        lambda: download_youtube_audio(youtube_url, video_id),
+        video_id, podcast_name, profile_id
+    )
+
 def process_file_async(job_id, file_path, video_id, podcast_name, profile_id=None):
     """Process uploaded file in background thread"""
-    try:
-        # Step 1: Extract audio from uploaded video
-        update_job_status(job_id, 'downloading', 'Extracting audio from video...')
-        audio_path = extract_audio_from_file(file_path, video_id)
-
-        # Step 2: Transcribe
-        update_job_status(job_id, 'transcribing', 'Transcribing audio with Whisper...')
-        transcript_data = transcribe_with_whisper(audio_path, video_id)
-
-        # Step 3: Get target audience profile
-        update_job_status(job_id, 'analyzing', 'Retrieving target audience profile...')
-
-        target_audience_profile = ""
-        if profile_id:
-            profile_data = load_data(f"profile_{profile_id}.json", DATA_DIR)
-            if profile_data:
-                target_audience_profile = profile_data.get('profile', '')
-
-        # If no profile, use a default
-        if not target_audience_profile:
-            target_audience_profile = f"Target audience for {podcast_name}. Engaged listeners interested in podcast content."
-
-        # Step 4: Analyze clips
-        update_job_status(job_id, 'analyzing', 'AI analyzing segments for clip opportunities...')
-        clips = analyze_clips_with_gemini(transcript_data['fullText'], target_audience_profile)
-
-        # Step 5: Complete
-        update_job_status(
-            job_id,
-            'complete',
-            'Analysis complete!',
-            transcript=transcript_data,
-            clips=clips,
-            clipCount=len(clips)
-        )
-
-    except Exception as e:
-        update_job_status(job_id, 'failed', f'Error: {str(e)}', error=str(e))
-    finally:
-        # Cleanup temp audio file only (keep video for clip extraction)
-        if audio_path and os.path.exists(audio_path):
-            try:
-                os.remove(audio_path)
-            except:
-                pass
-        # NOTE: We keep file_path (original video) for clip download feature
+    # NOTE: only the extracted audio is cleaned up - file_path (original video)
+    # is kept for the clip download feature
+    _run_pipeline(
+        job_id, 'Extracting audio from video...',
+        lambda: extract_audio_from_file(file_path, video_id),
+        video_id, podcast_name, profile_id
+    )
+
+# Threads per extraction ffmpeg. 2 lets decoding overlap the mp3 encode while
+# keeping memory bounded on small instances; 0 lets ffmpeg use every core.
+FFMPEG_THREADS = os.getenv('FFMPEG_THREADS', '2')
+FFMPEG_OUT_TIME_RE = re.compile(r'^out_time_us=(\d+)$', re.MULTILINE)
 
 def extract_audio_from_file(file_path, video_id, output_dir='/tmp'):
     """Extract audio from uploaded video file using ffmpeg - optimized for Whisper (25MB limit)"""
-    import subprocess
-
     output_path = os.path.join(output_dir, f"{video_id}.mp3")
 
     # First pass: extract with good quality
     cmd = [
-        'ffmpeg',
+        'ffmpeg', '-v', 'error',  # stderr only carries errors
+        '-nostats', '-progress', 'pipe:1',  # progress on stdout ends with the output duration
         '-i', file_path,
         '-vn',  # No video
         '-acodec', 'libmp3lame',
         '-ar', '16000',  # 16kHz is good for speech recognition
         '-ac', '1',  # Mono (smaller file)
         '-b:a', '24k',  # Lower bitrate for memory efficiency
-        '-threads', '1',  # Limit threads for Render
+        '-threads', FFMPEG_THREADS,
         '-y',
         output_path
     ]
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+        result = run_media_command(cmd, stdout=PIPE, stderr=PIPE, text=True, timeout=600)
         if result.returncode != 0:
             raise Exception(f"ffmpeg failed: {result.stderr}")
 
         if not os.path.exists(output_path):
             raise Exception("Audio file not found after extraction")
 
+        out_times = FFMPEG_OUT_TIME_RE.findall(result.stdout)
+        if out_times:
+            save_audio_duration(video_id, int(out_times[-1]) / 1_000_000)
+
         # Check file size - Whisper limit is 25MB
         file_size = os.path.getsize(output_path)
         print(f"[AUDIO] Extracted {file_size} bytes ({file_size / (1024*1024):.1f} MB)")
@@ -1302,11 +2673,12 @@ def extract_audio_from_file(file_path, video_id, output_dir='/tmp'):
                 '-ar', '16000',
                 '-ac', '1',
                 '-b:a', '16k',  # Very low bitrate for speech
+                '-threads', FFMPEG_THREADS,
                 '-y',
                 temp_path
             ]
 
-            result2 = subprocess.run(cmd2, capture_output=True, text=True, timeout=300)
+            result2 = run_media_command(cmd2, timeout=300)
             if result2.returncode == 0 and os.path.exists(temp_path):
                 os.replace(temp_path, output_path)
                 new_size = os.path.getsize(output_path)
@@ -1322,21 +2694,17 @@ def extract_audio_from_file(file_path, video_id, output_dir='/tmp'):
 # API ROUTES - PROFILE (EXISTING)
 # ============================================================================
 
-@app.route('/api/health', methods=['GET', 'OPTIONS'])
+@app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint - keep it simple to prevent Railway timeouts"""
-    if request.method == 'OPTIONS':
-        return '', 204
     try:
         return jsonify({'status': 'healthy'}), 200
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
-@app.route('/api/questionnaire', methods=['POST', 'OPTIONS'])
+@app.route('/api/questionnaire', methods=['POST'])
 def save_questionnaire():
     """Save questionnaire answers"""
-    if request.method == 'OPTIONS':
-        return '', 204
     try:
         data = request.json
 
@@ -1358,7 +2726,7 @@ def save_questionnaire():
         }
 
         filename = f"questionnaire_{questionnaire_id}.json"
-        save_data(filename, questionnaire_data)
+        save_data(filename, questionnaire_data, durable=True)
 
         return jsonify({
             'id': questionnaire_id,
@@ -1369,11 +2737,9 @@ def save_questionnaire():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/questionnaire/<questionnaire_id>', methods=['GET', 'OPTIONS'])
+@app.route('/api/questionnaire/<questionnaire_id>', methods=['GET'])
 def get_questionnaire(questionnaire_id):
     """Get questionnaire by ID"""
-    if request.method == 'OPTIONS':
-        return '', 204
     try:
         filename = f"questionnaire_{questionnaire_id}.json"
         data = load_data(filename)
@@ -1386,11 +2752,46 @@ def get_questionnaire(questionnaire_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/generate-profile', methods=['POST', 'OPTIONS'])
+PROFILE_BATCH_WORKERS = int(os.getenv('PROFILE_BATCH_WORKERS', '8'))
+
+def create_profile_from_questionnaire(questionnaire_id):
+    """Generate, save and link a profile for a questionnaire; None if it doesn't exist"""
+    filename = f"questionnaire_{questionnaire_id}.json"
+    questionnaire = load_data(filename)
+
+    if not questionnaire:
+        print(f"[ERROR] Questionnaire not found: {questionnaire_id}")
+        return None
+
+    print(f"[DEBUG] Generating profile for podcast: {questionnaire.get('podcastName')}")
+
+    profile_text = generate_profile_with_gemini(
+        podcast_name=questionnaire['podcastName'],
+        host_names=questionnaire.get('hostNames', ''),
+        answers=questionnaire['answers']
+    )
+
+    profile_id = str(uuid.uuid4())
+    profile_data = {
+        'id': profile_id,
+        'questionnaireId': questionnaire_id,
+        'podcastName': questionnaire['podcastName'],
+        'profile': profile_text,
+        'wordCount': len(profile_text.split()),
+        'createdAt': datetime.now().isoformat()
+    }
+
+    profile_filename = f"profile_{profile_id}.json"
+    save_data(profile_filename, profile_data, durable=True)
+    index_profile(profile_data)
+
+    save_data(filename, {**questionnaire, 'profileId': profile_id}, durable=True)
+
+    return profile_data
+
+@app.route('/api/generate-profile', methods=['POST'])
 def generate_profile():
     """Generate target audience profile from questionnaire"""
-    if request.method == 'OPTIONS':
-        return '', 204
     print(f"[DEBUG] /api/generate-profile called")
 
     try:
@@ -1406,36 +2807,11 @@ def generate_profile():
             print("[ERROR] Questionnaire ID missing")
             return jsonify({'error': 'Questionnaire ID is required'}), 400
 
-        filename = f"questionnaire_{questionnaire_id}.json"
-        questionnaire = load_data(filename)
-
-        if not questionnaire:
-            print(f"[ERROR] Questionnaire not found: {questionnaire_id}")
+        profile_data = create_profile_from_questionnaire(questionnaire_id)
+        if not profile_data:
             return jsonify({'error': 'Questionnaire not found'}), 404
-
-        print(f"[DEBUG] Generating profile for podcast: {questionnaire.get('podcastName')}")
-
-        profile_text = generate_profile_with_gemini(
-            podcast_name=questionnaire['podcastName'],
-            host_names=questionnaire.get('hostNames', ''),
-            answers=questionnaire['answers']
-        )
-
-        profile_id = str(uuid.uuid4())
-        profile_data = {
-            'id': profile_id,
-            'questionnaireId': questionnaire_id,
-            'podcastName': questionnaire['podcastName'],
-            'profile': profile_text,
-            'wordCount': len(profile_text.split()),
-            'createdAt': datetime.now().isoformat()
-        }
-
-        profile_filename = f"profile_{profile_id}.json"
-        save_data(profile_filename, profile_data)
-
-        questionnaire['profileId'] = profile_id
-        save_data(filename, questionnaire)
+        profile_id = profile_data['id']
+        profile_text = profile_data['profile']
 
         print(f"[DEBUG] Profile generated successfully: {profile_id}")
 
@@ -1460,11 +2836,43 @@ def generate_profile():
         else:
             return jsonify({'error': f'There was an issue generating your profile: {error_msg}'}), 500
 
-@app.route('/api/profile/<profile_id>', methods=['GET', 'OPTIONS'])
+@app.route('/api/generate-profiles', methods=['POST'])
+def generate_profiles_batch():
+    """Generate profiles for several questionnaires concurrently"""
+    try:
+        data = request.json or {}
+        questionnaire_ids = data.get('questionnaireIds') or []
+
+        if not questionnaire_ids:
+            return jsonify({'error': 'questionnaireIds is required'}), 400
+
+        def generate_one(questionnaire_id):
+            try:
+                profile_data = create_profile_from_questionnaire(questionnaire_id)
+                if not profile_data:
+                    return {'questionnaireId': questionnaire_id, 'status': 'error', 'error': 'Questionnaire not found'}
+                return {
+                    'questionnaireId': questionnaire_id,
+                    'id': profile_data['id'],
+                    'profile': profile_data['profile'],
+                    'wordCount': profile_data['wordCount'],
+                    'status': 'success'
+                }
+            except Exception as e:
+                print(f"[ERROR] Batch profile generation failed for {questionnaire_id}: {e}")
+                return {'questionnaireId': questionnaire_id, 'status': 'error', 'error': str(e)}
+
+        # Each Gemini call is network-bound, so run them side by side
+        with ThreadPoolExecutor(max_workers=min(PROFILE_BATCH_WORKERS, len(questionnaire_ids))) as pool:
+            results = list(pool.map(generate_one, questionnaire_ids))
+
+        return jsonify({'results': results, 'count': len(results)}), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/profile/<profile_id>', methods=['GET'])
 def get_profile(profile_id):
     """Get generated profile by ID"""
-    if request.method == 'OPTIONS':
-        return '', 204
     try:
         filename = f"profile_{profile_id}.json"
         data = load_data(filename)
@@ -1477,25 +2885,11 @@ def get_profile(profile_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/user/<user_id>/profiles', methods=['GET', 'OPTIONS'])
+@app.route('/api/user/<user_id>/profiles', methods=['GET'])
 def get_user_profiles(user_id):
     """Get all profiles for a user"""
-    if request.method == 'OPTIONS':
-        return '', 204
     try:
-        profiles = []
-        for filename in os.listdir(DATA_DIR):
-            if filename.startswith('profile_') and filename.endswith('.json'):
-                data = load_data(filename)
-                if data:
-                    profiles.append({
-                        'id': data['id'],
-                        'podcastName': data['podcastName'],
-                        'createdAt': data['createdAt'],
-                        'wordCount': data.get('wordCount', 0)
-                    })
-
-        profiles.sort(key=lambda x: x['createdAt'], reverse=True)
+        profiles = list_indexed_profiles()
 
         return jsonify({
             'profiles': profiles,
@@ -1509,11 +2903,53 @@ def get_user_profiles(user_id):
 # API ROUTES - YOUTUBE PROCESSING (NEW)
 # ============================================================================
 
-@app.route('/api/process-episode', methods=['POST', 'OPTIONS'])
+# Fixed pool of pipeline workers fed from a queue, instead of a thread per submission
+JOB_WORKERS = int(os.getenv('JOB_WORKERS') or min(4, os.cpu_count() or 1))
+JOB_QUEUE = queue.Queue()
+
+def _job_worker():
+    """Run queued pipeline jobs forever"""
+    while True:
+        fn, args = JOB_QUEUE.get()
+        try:
+            fn(*args)
+        except Exception as e:
+            print(f"[ERROR] Job worker: {e}")
+        finally:
+            JOB_QUEUE.task_done()
+
+for _i in range(JOB_WORKERS):
+    threading.Thread(target=_job_worker, name=f'job-worker-{_i}', daemon=True).start()
+
+_JOB_TEMPLATE = {'status': 'queued', 'progressMessage': 'Queued for processing...'}
+
+def make_job_record(**fields):
+    """New queued job record: the constant template plus per-job fields and timestamps"""
+    now = datetime.now().isoformat()
+    job_data = _JOB_TEMPLATE.copy()
+    job_data.update(fields)
+    job_data['createdAt'] = job_data['updatedAt'] = now
+    return job_data
+
+def _create_job(job_id, fields, target, args):
+    """Save a queued job record, queue it for the worker pool and return the 202 response"""
+    job_data = make_job_record(id=job_id, **fields)
+    job_store.put(job_data)
+    job_store.flush(job_id)
+
+    # Hand off to the worker pool
+    JOB_QUEUE.put((target, (job_id, *args)))
+
+    return jsonify({
+        'jobId': job_id,
+        'status': 'queued',
+        'message': 'Episode processing started',
+        'queue_depth': JOB_QUEUE.qsize()
+    }), 202
+
+@app.route('/api/process-episode', methods=['POST'])
 def process_episode():
     """Start processing a YouTube episode, uploaded file, or server-side file path"""
-    if request.method == 'OPTIONS':
-        return '', 204
     try:
         # Check if this is a file upload
         if request.files and 'video' in request.files:
@@ -1546,43 +2982,21 @@ def process_episode():
         if not video_id:
             return jsonify({'error': 'Invalid YouTube URL. Please provide a valid YouTube video URL.'}), 400
 
-        # Generate job ID
         job_id = str(uuid.uuid4())
-
-        # Create job record
-        job_data = {
-            'id': job_id,
+        return _create_job(job_id, {
             'youtubeUrl': youtube_url,
             'videoId': video_id,
             'podcastName': podcast_name,
             'profileId': profile_id,
             'filePath': file_path,
-            'userId': user_id,
-            'status': 'queued',
-            'progressMessage': 'Queued for processing...',
-            'createdAt': datetime.now().isoformat(),
-            'updatedAt': datetime.now().isoformat()
-        }
-
-        save_data(f"job_{job_id}.json", job_data, JOBS_DIR)
-
-        # Start async processing
-        thread = threading.Thread(
-            target=process_episode_async,
-            args=(job_id, youtube_url, video_id, podcast_name, profile_id)
-        )
-        thread.daemon = True
-        thread.start()
-
-        return jsonify({
-            'jobId': job_id,
-            'status': 'queued',
-            'message': 'Episode processing started'
-        }), 202
+            'userId': user_id
+        }, process_episode_async, (youtube_url, video_id, podcast_name, profile_id))
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+ALLOWED_VIDEO_EXTENSIONS = frozenset(VIDEO_EXTENSIONS)
+
 def process_file_upload():
     """Handle file upload processing"""
     try:
@@ -1593,50 +3007,28 @@ def process_file_upload():
         if not video_file:
             return jsonify({'error': 'Video file is required'}), 400
 
-        # Validate file type
-        allowed_extensions = {'.mp4', '.mov', '.avi', '.mkv', '.webm'}
-        file_ext = os.path.splitext(video_file.filename)[1].lower()
-        if file_ext not in allowed_extensions:
-            return jsonify({'error': f'Invalid file type. Allowed: {", ".join(allowed_extensions)}'}), 400
+        # Validate file type (the raw name's extension - the name itself never
+        # reaches the saved path, and sanitizing it drops non-ASCII stems)
+        file_ext = os.path.splitext(video_file.filename or '')[1].lower()
+        if file_ext not in ALLOWED_VIDEO_EXTENSIONS:
+            return jsonify({'error': 'Invalid file type. Allowed: mp4, mov, avi, mkv, webm'}), 400
 
         # Generate job ID and video ID
         job_id = str(uuid.uuid4())
         video_id = f"upload_{job_id[:8]}"
 
         # Save uploaded file
-        upload_dir = os.path.join(DATA_DIR, 'uploads')
-        os.makedirs(upload_dir, exist_ok=True)
-        file_path = os.path.join(upload_dir, f"{video_id}{file_ext}")
-        video_file.save(file_path)
+        file_path = upload_path(video_id, file_ext)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        save_uploaded_file(video_file, file_path)
+        register_upload(file_path, video_id, job_id)
 
-        # Create job record
-        job_data = {
-            'id': job_id,
+        return _create_job(job_id, {
             'videoId': video_id,
             'podcastName': podcast_name,
             'profileId': profile_id,
-            'filePath': file_path,
-            'status': 'queued',
-            'progressMessage': 'Queued for processing...',
-            'createdAt': datetime.now().isoformat(),
-            'updatedAt': datetime.now().isoformat()
-        }
-
-        save_data(f"job_{job_id}.json", job_data, JOBS_DIR)
-
-        # Start async processing
-        thread = threading.Thread(
-            target=process_file_async,
-            args=(job_id, file_path, video_id, podcast_name, profile_id)
-        )
-        thread.daemon = True
-        thread.start()
-
-        return jsonify({
-            'jobId': job_id,
-            'status': 'queued',
-            'message': 'Episode processing started'
-        }), 202
+            'filePath': file_path
+        }, process_file_async, (file_path, video_id, podcast_name, profile_id))
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -1653,47 +3045,30 @@ def process_server_file(file_path, data):
         # Generate job ID and video ID
         job_id = str(uuid.uuid4())
         video_id = f"chunked_{job_id[:8]}"
+        register_upload(file_path, video_id, job_id)
         
-        # Create job record with file path for later clip extraction
-        job_data = {
-            'id': job_id,
+        # Job record keeps the file path for later clip extraction
+        return _create_job(job_id, {
             'videoId': video_id,
             'podcastName': podcast_name,
             'profileId': profile_id,
-            'filePath': file_path,
-            'filePath': file_path,
-            'status': 'queued',
-            'progressMessage': 'Queued for processing...',
-            'createdAt': datetime.now().isoformat(),
-            'updatedAt': datetime.now().isoformat()
-        }
-        
-        save_data(f"job_{job_id}.json", job_data, JOBS_DIR)
-        
-        # Start async processing
-        thread = threading.Thread(
-            target=process_file_async,
-            args=(job_id, file_path, video_id, podcast_name, profile_id)
-        )
-        thread.daemon = True
-        thread.start()
-        
-        return jsonify({
-            'jobId': job_id,
-            'status': 'queued',
-            'message': 'Episode processing started'
-        }), 202
+            'filePath': file_path
+        }, process_file_async, (file_path, video_id, podcast_name, profile_id))
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/job/<job_id>', methods=['GET', 'OPTIONS'])
+@app.route('/api/job/<job_id>', methods=['GET'])
 def get_job_status(job_id):
     """Get job status and results"""
-    if request.method == 'OPTIONS':
-        return '', 204
     try:
-        job_data = load_data(f"job_{job_id}.json", JOBS_DIR)
+        # Open tabs poll this every second - answer unchanged polls with a 304
+        modified_at = job_store.modified_at(job_id)
+        etag = job_store.etag(job_id)
+        if is_not_modified(etag):
+            return not_modified(etag, modified_at)
+
+        job_data = job_store.get(job_id)
 
         if not job_data:
             return jsonify({'error': 'Job not found'}), 404
@@ -1721,16 +3096,16 @@ def get_job_status(job_id):
         if 'error' in job_data:
             response['error'] = job_data['error']
 
-        return jsonify(response), 200
+        # Serialize straight to bytes
+        return revalidated_json(response, etag or job_store.etag(job_id),
+                                modified_at or job_store.modified_at(job_id))
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/analyze-clips', methods=['POST', 'OPTIONS'])
+@app.route('/api/analyze-clips', methods=['POST'])
 def analyze_clips():
     """Analyze clips from a transcript"""
-    if request.method == 'OPTIONS':
-        return '', 204
     try:
         data = request.json
         job_id = data.get('jobId')
@@ -1740,7 +3115,7 @@ def analyze_clips():
             return jsonify({'error': 'Job ID is required'}), 400
 
         # Load job data
-        job_data = load_data(f"job_{job_id}.json", JOBS_DIR)
+        job_data = job_store.get(job_id)
         if not job_data:
             return jsonify({'error': 'Job not found'}), 404
 
@@ -1764,11 +3139,13 @@ def analyze_clips():
         transcript_text = job_data['transcript']['fullText']
         clips = analyze_clips_with_gemini(transcript_text, target_audience_profile)
 
-        # Update job with clips
-        job_data['clips'] = clips
-        job_data['clipCount'] = len(clips)
-        job_data['updatedAt'] = datetime.now().isoformat()
-        save_data(f"job_{job_id}.json", job_data, JOBS_DIR)
+        # Update job with clips - applied to the current record, since the LLM
+        # call is slow and the job may have been edited (or reloaded) meanwhile
+        job_store.update(job_id, lambda job: job.update(
+            clips=clips,
+            clipCount=len(clips),
+            updatedAt=datetime.now().isoformat()
+        ))
 
         return jsonify({
             'clips': clips,
@@ -1779,18 +3156,27 @@ def analyze_clips():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/transcript/<video_id>', methods=['GET', 'OPTIONS'])
+@app.route('/api/transcript/<video_id>', methods=['GET'])
 def get_transcript(video_id):
     """Get cached transcript for a video"""
-    if request.method == 'OPTIONS':
-        return '', 204
     try:
-        transcript_data = load_data(f"transcript_{video_id}.json", TRANSCRIPTS_DIR)
+        # Transcripts never change once written - validate on the file's stat
+        try:
+            st = os.stat(_transcript_path(video_id))
+            etag = f"{st.st_mtime_ns:x}-{st.st_size:x}"
+        except OSError:
+            st = etag = None
+        if is_not_modified(etag):
+            return not_modified(etag, st.st_mtime)
+
+        transcript_data = read_transcript(video_id)
 
         if not transcript_data:
             return jsonify({'error': 'Transcript not found'}), 404
 
-        return jsonify(transcript_data), 200
+        if etag is None:
+            return json_response(transcript_data)
+        return revalidated_json(transcript_data, etag, st.st_mtime)
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -1799,13 +3185,16 @@ def get_transcript(video_id):
 # API ROUTES - TRANSCRIPT EDITOR (NEW)
 # ============================================================================
 
-@app.route('/api/job/<job_id>/full-transcript', methods=['GET', 'OPTIONS'])
+@app.route('/api/job/<job_id>/full-transcript', methods=['GET'])
 def get_full_transcript(job_id):
     """Get full transcript with timestamps for the transcript editor"""
-    if request.method == 'OPTIONS':
-        return '', 204
     try:
-        job_data = load_data(f"job_{job_id}.json", JOBS_DIR)
+        # Editor re-fetches on tab focus - skip the load and serialization if unchanged
+        etag = job_store.etag(job_id)
+        if is_not_modified(etag):
+            return not_modified(etag, job_store.modified_at(job_id))
+
+        job_data = job_store.get(job_id)
 
         if not job_data:
             return jsonify({'error': 'Job not found'}), 404
@@ -1817,25 +3206,17 @@ def get_full_transcript(job_id):
         transcript = job_data['transcript']
         segments = transcript.get('segments', [])
 
-        # Build formatted transcript with text including timestamps
-        formatted_segments = []
-        for seg in segments:
-            # Include timestamp in the text for display: [MM:SS] text
-            timestamp_text = f"[{seg['start']}] {seg['text']}"
-            formatted_segments.append({
-                'id': seg.get('start_seconds', 0),
-                'start': seg['start'],
-                'end': seg['end'],
-                'start_seconds': seg.get('start_seconds', 0),
-                'end_seconds': seg.get('end_seconds', 0),
-                'text': seg['text'],
-                'timestamp_text': timestamp_text
-            })
+        # New transcripts already carry the editor fields, so pass them through;
+        # older ones get formatted ([MM:SS] text) per request
+        if not segments or 'timestamp_text' in segments[0]:
+            formatted_segments = segments
+        else:
+            formatted_segments = format_editor_segments(segments)
 
         # Get clips if available
         clips = job_data.get('clips', [])
 
-        return jsonify({
+        return revalidated_json({
             'jobId': job_id,
             'videoId': job_data.get('videoId'),
             'podcastName': job_data.get('podcastName'),
@@ -1843,16 +3224,14 @@ def get_full_transcript(job_id):
             'segments': formatted_segments,
             'clips': clips,
             'fullText': transcript.get('fullText', '')
-        }), 200
+        }, etag or job_store.etag(job_id), job_store.modified_at(job_id))
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/job/<job_id>/save-clip', methods=['POST', 'OPTIONS'])
+@app.route('/api/job/<job_id>/save-clip', methods=['POST'])
 def save_clip(job_id):
     """Save adjusted clip timestamps"""
-    if request.method == 'OPTIONS':
-        return '', 204
     try:
         data = request.json
         clip_index = data.get('clipIndex')
@@ -1869,7 +3248,7 @@ def save_clip(job_id):
             return jsonify({'error': 'endTimestamp is required'}), 400
 
         # Load job data
-        job_data = load_data(f"job_{job_id}.json", JOBS_DIR)
+        job_data = job_store.get(job_id)
         if not job_data:
             return jsonify({'error': 'Job not found'}), 404
 
@@ -1882,6 +3261,21 @@ def save_clip(job_id):
         if clip_index < 0 or clip_index >= len(clips):
             return jsonify({'error': f'Invalid clip index. Must be between 0 and {len(clips)-1}'}), 400
 
+        # Editor auto-save resubmits identical values - skip the job write entirely
+        current = clips[clip_index]
+        if (current.get('start_timestamp') == start_timestamp
+                and current.get('end_timestamp') == end_timestamp
+                and (not transcript_excerpt or current.get('transcript_excerpt') == transcript_excerpt)):
+            return jsonify({
+                'success': True,
+                'unchanged': True,
+                'clipIndex': clip_index,
+                'startTimestamp': start_timestamp,
+                'endTimestamp': end_timestamp,
+                'durationMinutes': current.get('duration_minutes'),
+                'message': 'Clip unchanged'
+            }), 200
+
         # Calculate duration in minutes
         start_seconds = parse_timestamp_to_seconds(start_timestamp)
         end_seconds = parse_timestamp_to_seconds(end_timestamp)
@@ -1894,11 +3288,12 @@ def save_clip(job_id):
         if transcript_excerpt:
             clips[clip_index]['transcript_excerpt'] = transcript_excerpt
         clips[clip_index]['updatedAt'] = datetime.now().isoformat()
+        clear_clip_status(job_data, clip_index)
 
         # Save updated job
         job_data['clips'] = clips
         job_data['updatedAt'] = datetime.now().isoformat()
-        save_data(f"job_{job_id}.json", job_data, JOBS_DIR)
+        job_store.put(job_data)
 
         return jsonify({
             'success': True,
@@ -1912,13 +3307,34 @@ def save_clip(job_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/job/<job_id>/export-clips', methods=['GET', 'OPTIONS'])
+def build_clip_export(job_id, job_data):
+    """Export payload for a job's clips"""
+    return {
+        'jobId': job_id,
+        'videoId': job_data.get('videoId'),
+        'podcastName': job_data.get('podcastName'),
+        'exportedAt': datetime.now().isoformat(),
+        'clips': [{
+            'index': i,
+            'start_timestamp': clip.get('start_timestamp'),
+            'end_timestamp': clip.get('end_timestamp'),
+            'duration_minutes': clip.get('duration_minutes'),
+            'title_options': clip.get('title_options', {}),
+            'engaging_quote': clip.get('engaging_quote'),
+            'transcript_excerpt': clip.get('transcript_excerpt'),
+            'why_it_works': clip.get('why_it_works')
+        } for i, clip in enumerate(job_data['clips'])]
+    }
+
+@app.route('/api/job/<job_id>/export-clips', methods=['GET'])
 def export_clips(job_id):
     """Export clip data for download"""
-    if request.method == 'OPTIONS':
-        return '', 204
     try:
-        job_data = load_data(f"job_{job_id}.json", JOBS_DIR)
+        etag = job_store.etag(job_id)
+        if is_not_modified(etag):
+            return not_modified(etag, job_store.modified_at(job_id))
+
+        job_data = job_store.get(job_id)
 
         if not job_data:
             return jsonify({'error': 'Job not found'}), 404
@@ -1926,46 +3342,133 @@ def export_clips(job_id):
         if 'clips' not in job_data or not job_data['clips']:
             return jsonify({'error': 'No clips found for this job'}), 404
 
-        clips = job_data['clips']
+        # Steady state serves the bytes built for this job version
+        etag = etag or job_store.etag(job_id)
+        body = get_cached_body(('export', job_id), etag)
+        if body is None:
+            body = cache_body(('export', job_id), etag, build_clip_export(job_id, job_data))
 
-        # Build export data
-        export_data = {
-            'jobId': job_id,
-            'videoId': job_data.get('videoId'),
-            'podcastName': job_data.get('podcastName'),
-            'exportedAt': datetime.now().isoformat(),
-            'clips': []
-        }
-
-        for i, clip in enumerate(clips):
-            export_clip = {
-                'index': i,
-                'start_timestamp': clip.get('start_timestamp'),
-                'end_timestamp': clip.get('end_timestamp'),
-                'duration_minutes': clip.get('duration_minutes'),
-                'title_options': clip.get('title_options', {}),
-                'engaging_quote': clip.get('engaging_quote'),
-                'transcript_excerpt': clip.get('transcript_excerpt'),
-                'why_it_works': clip.get('why_it_works')
-            }
-            export_data['clips'].append(export_clip)
-
-        return jsonify(export_data), 200
+        return revalidated_json(body, etag, job_store.modified_at(job_id))
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/job/<job_id>/clip/<int:clip_index>/download', methods=['GET', 'OPTIONS'])
+# Behind nginx, set USE_XACCEL=1 to hand finished clip files to the proxy with
+# X-Accel-Redirect so it streams them with sendfile(2) instead of the app:
+#
+#   location /_protected_clips/ {
+#       internal;
+#       alias /app/backend/data/clips/;
+#       sendfile on;
+#       tcp_nopush on;
+#   }
+USE_XACCEL = os.environ.get('USE_XACCEL') == '1'
+CLIP_STREAM_CHUNK = 1024 * 1024  # 1MB reads from ffmpeg's stdout
+CLIP_STREAM_TIMEOUT = 300  # seconds before a streaming ffmpeg is killed
+XACCEL_CLIPS_PREFIX = os.environ.get('XACCEL_CLIPS_PREFIX', '/_protected_clips/')
+
+def send_clip_file(output_path, output_filename):
+    """Send an extracted clip as an attachment (via the proxy when USE_XACCEL is set)"""
+    if USE_XACCEL:
+        response = Response(mimetype='video/mp4')
+        response.headers['X-Accel-Redirect'] = f"{XACCEL_CLIPS_PREFIX}{output_filename}"
+        response.headers['Content-Disposition'] = f'attachment; filename="{output_filename}"'
+        return response
+
+    # Use send_file - most memory-efficient for file serving
+    return send_file(
+        output_path,
+        mimetype='video/mp4',
+        as_attachment=True,
+        download_name=output_filename
+    )
+
+class _TitleCharFilter(dict):
+    """str.translate table keeping alphanumerics, space, '-' and '_'; filled lazily per code point"""
+
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        self[codepoint] = codepoint if char.isalnum() or char in ' -_' else None
+        return self[codepoint]
+
+TITLE_CHAR_FILTER = _TitleCharFilter()
+
+# Clip files being extracted in the background by this process. Kept in memory
+# only, so an extraction cut short by a crash or restart can't report
+# 'processing' forever.
+clip_extractions = set()
+clip_extractions_lock = threading.Lock()
+
+def set_clip_status(job_id, output_filename, status):
+    """Record (or with status=None clear) a failed background extraction in the
+    job's clipStatus map, keyed by clip file name so edited clips start clean"""
+    def mutate(job):
+        statuses = job.setdefault('clipStatus', {})
+        if status is None:
+            statuses.pop(output_filename, None)
+        else:
+            statuses[output_filename] = status
+    job_store.update(job_id, mutate)
+
+def clear_clip_status(job_data, clip_index):
+    """Drop recorded extraction errors for a clip whose timestamps changed"""
+    prefix = f"{job_data['id']}_{clip_index}_"
+    statuses = job_data.get('clipStatus')
+    if statuses:
+        job_data['clipStatus'] = {name: status for name, status in statuses.items()
+                                  if not name.startswith(prefix)}
+
+def start_clip_extraction(job_id, output_filename, video_path, output_path, start_sec, duration):
+    """Extract a clip to disk on the media loop without holding a request thread"""
+    with clip_extractions_lock:
+        if output_filename in clip_extractions:
+            return
+        clip_extractions.add(output_filename)
+    set_clip_status(job_id, output_filename, None)
+    tmp_path = f"{output_path}.{uuid.uuid4().hex}.part"
+    cmd = [
+        'ffmpeg', '-nostdin', '-v', 'error',
+        '-noaccurate_seek',
+        '-ss', str(start_sec),
+        '-i', video_path,
+        '-t', str(duration),
+        '-map', '0:v:0?', '-map', '0:a:0?',
+        '-c', 'copy',
+        '-avoid_negative_ts', 'make_zero',
+        '-movflags', '+faststart',
+        '-f', 'mp4', tmp_path
+    ]
+
+    def done(future):
+        try:
+            result = future.result()
+            if result.returncode != 0:
+                raise RuntimeError(f"ffmpeg exited with {result.returncode}")
+            os.replace(tmp_path, output_path)
+            print(f"[CLIP] Background extraction done: {output_path}")
+        except Exception as e:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            set_clip_status(job_id, output_filename, f"error: {e}")
+            print(f"[CLIP] Background extraction failed: {e}")
+        finally:
+            with clip_extractions_lock:
+                clip_extractions.discard(output_filename)
+
+    future = asyncio.run_coroutine_threadsafe(run_media_command_async(cmd, timeout=300), media_loop)
+    future.add_done_callback(done)
+
+@app.route('/api/job/<job_id>/clip/<int:clip_index>/download', methods=['GET'])
 def download_clip_video(job_id, clip_index):
     """Extract and download a specific clip as video file.
     
-    Uses send_file for memory-efficient streaming instead of Response generator.
+    Already-extracted clips are sent from disk; otherwise ffmpeg's output is
+    streamed straight to the client and cached to disk (skip the cache with
+    ?cache=0), or with ?async=1 extracted in the background while the client
+    polls for a 202.
     """
-    
-    if request.method == 'OPTIONS':
-        return '', 204
     try:
-        job_data = load_data(f"job_{job_id}.json", JOBS_DIR)
+        job_data = job_store.get(job_id)
         if not job_data:
             return jsonify({'error': 'Job not found'}), 404
 
@@ -1985,22 +3488,8 @@ def download_clip_video(job_id, clip_index):
 
         # Find the original video file
         video_path = job_data.get('filePath')
-        video_id = job_data.get('videoId')
-        uploads_dir = os.path.join(DATA_DIR, 'uploads')
-        
         if not video_path or not os.path.exists(video_path):
-            if video_id and os.path.exists(uploads_dir):
-                for fname in os.listdir(uploads_dir):
-                    if fname.startswith(video_id) or video_id in fname:
-                        video_path = os.path.join(uploads_dir, fname)
-                        break
-        
-        if not video_path or not os.path.exists(video_path):
-            if os.path.exists(uploads_dir):
-                for fname in os.listdir(uploads_dir):
-                    if job_id in fname:
-                        video_path = os.path.join(uploads_dir, fname)
-                        break
+            video_path = find_upload(job_data.get('videoId'), job_id)
 
         if not video_path or not os.path.exists(video_path):
             return jsonify({'error': 'Original video file not found. Files are cleared between deploys on Render. Please re-upload the video.'}), 404
@@ -2011,7 +3500,7 @@ def download_clip_video(job_id, clip_index):
 
         # Generate output filename - INCLUDE TIMESTAMPS so edits create new files
         safe_title = clip.get('title_options', {}).get('punchy', f'clip_{clip_index}')
-        safe_title = "".join(c for c in safe_title if c.isalnum() or c in (' ', '-', '_')).rstrip()
+        safe_title = safe_title.translate(TITLE_CHAR_FILTER).rstrip()
         safe_title = safe_title.replace(' ', '_')[:20]
         # Include timestamps in filename so edited clips are different files
         start_safe = start_ts.replace(':', '')
@@ -2022,33 +3511,23 @@ def download_clip_video(job_id, clip_index):
         # Check if already extracted and ready (must have content)
         if os.path.exists(output_path) and os.path.getsize(output_path) > 1000:
             print(f"[CLIP] Serving existing clip: {output_path} ({os.path.getsize(output_path)} bytes)")
-            # Use send_file - most memory-efficient for file serving
-            return send_file(
-                output_path,
-                mimetype='video/mp4',
-                as_attachment=True,
-                download_name=output_filename
-            )
+            return send_clip_file(output_path, output_filename)
 
         # Check if currently processing
-        clip_status = job_data.get('clipStatus', {}).get(str(clip_index))
-        if clip_status == 'processing':
+        if output_filename in clip_extractions:
             return jsonify({'status': 'processing', 'message': 'Clip extraction in progress...'}), 202
 
-        # Check for errors
-        if clip_status and clip_status.startswith('error'):
+        # Check for errors - reported once, then cleared so the next request retries
+        clip_status = job_data.get('clipStatus', {}).get(output_filename)
+        if clip_status:
+            set_clip_status(job_id, output_filename, None)
             return jsonify({'error': 'Clip extraction failed', 'details': clip_status}), 500
 
         # Check if file exists and is valid
         if os.path.exists(output_path):
             file_size = os.path.getsize(output_path)
             if file_size > 10000:
-                return send_file(
-                    output_path,
-                    mimetype='video/mp4',
-                    as_attachment=True,
-                    download_name=output_filename
-                )
+                return send_clip_file(output_path, output_filename)
             else:
                 os.remove(output_path)
 
@@ -2063,41 +3542,90 @@ def download_clip_video(job_id, clip_index):
         
         print(f"[CLIP] Extracting {start_ts} ({start_sec}s) to {end_ts} ({end_sec}s), duration: {duration}s")
 
-        # FAST extraction using copy codec (no re-encoding)
-        # This is 10x faster than re-encoding with libx264
+        # ?async=1: extract to disk on the media loop and answer 202 right away;
+        # the client polls this URL until the finished file is served
+        if request.args.get('async') == '1':
+            start_clip_extraction(job_id, output_filename, video_path, output_path, start_sec, duration)
+            return jsonify({
+                'status': 'processing',
+                'message': 'Clip extraction started',
+                'pollUrl': request.path
+            }), 202
+
+        # FAST extraction using copy codec (no re-encoding), streamed to the
+        # client while ffmpeg is still muxing. A pipe can't be seeked, so the
+        # mp4 is fragmented (empty_moov) instead of +faststart. Unless ?cache=0,
+        # ffmpeg's tee muxer also writes the clip to disk for later requests -
+        # to a temp name, renamed into place only if ffmpeg finishes cleanly.
+        fragmented = 'f=mp4:movflags=frag_keyframe+empty_moov+default_base_moof'
+        cache_path = None
+        if request.args.get('cache') != '0':
+            cache_path = f"{output_path}.{uuid.uuid4().hex}.part"
+            outputs = ['-f', 'tee', f"[{fragmented}]pipe:1|[{fragmented}]{cache_path}"]
+        else:
+            outputs = ['-f', 'mp4', '-movflags', 'frag_keyframe+empty_moov+default_base_moof', 'pipe:1']
         cmd = [
-            'ffmpeg', '-y',
+            'ffmpeg', '-nostdin',
+            '-noaccurate_seek',  # cut on the keyframe before -ss; never decode toward the exact frame
             '-ss', str(start_sec),
             '-i', video_path,
             '-t', str(duration),
+            '-map', '0:v:0?', '-map', '0:a:0?',
             '-c', 'copy',  # Copy codec - no re-encoding, just copy packets
-            '-movflags', '+faststart',
-            output_path
+            '-avoid_negative_ts', 'make_zero',
+            *outputs
         ]
 
-        # Use DEVNULL to avoid memory issues - ffmpeg outputs progress to stderr which can be huge
-        # CRITICAL FIX: Never use stderr=PIPE - it buffers ALL of ffmpeg's output into memory.
-        # ffmpeg outputs massive progress info to stderr which can exceed 400MB on longer videos.
-        # This was causing the 512MB OOM crash. Use DEVNULL to discard all output.
-        result = subprocess.run(
+        # CRITICAL: never pipe stderr - ffmpeg's progress output on long videos
+        # once exceeded 400MB buffered in memory and OOM'd the 512MB instance.
+        # One ffmpeg per clip is deliberate: ffmpeg can't take new jobs on a
+        # running process, so a persistent "worker" would only be a shell that
+        # still exec's ffmpeg per clip (and evals request-derived paths).
+        # Popen already spawns via vfork, so the big app process isn't copied;
+        # repeat downloads are served from the cached file without a spawn.
+        proc = subprocess.Popen(
             cmd,
             stdin=subprocess.DEVNULL,
-            stdout=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
             stderr=subprocess.DEVNULL,
-            timeout=300
+            bufsize=0
         )
-        print(f"[CLIP] ffmpeg returncode: {result.returncode}")
-
-        if result.returncode != 0 or not os.path.exists(output_path) or os.path.getsize(output_path) < 1000:
+        # A hung ffmpeg must not hold this worker thread forever; killing it
+        # ends the stdout reads below
+        watchdog = threading.Timer(CLIP_STREAM_TIMEOUT, proc.kill)
+        watchdog.daemon = True
+        watchdog.start()
+
+        first_chunk = proc.stdout.read(CLIP_STREAM_CHUNK)
+        if not first_chunk:
+            watchdog.cancel()
+            returncode = proc.wait()
+            print(f"[CLIP] ffmpeg produced no output, returncode: {returncode}")
+            if cache_path and os.path.exists(cache_path):
+                os.remove(cache_path)
             return jsonify({'error': 'Extraction failed', 'details': 'ffmpeg process failed'}), 500
 
-        # Use send_file - most memory-efficient for file serving
-        return send_file(
-            output_path,
-            mimetype='video/mp4',
-            as_attachment=True,
-            download_name=output_filename
-        )
+        def generate():
+            yield first_chunk
+            yield from iter(lambda: proc.stdout.read(CLIP_STREAM_CHUNK), b'')
+
+        def finish():
+            watchdog.cancel()
+            if proc.poll() is None:
+                proc.kill()  # client went away mid-stream
+            returncode = proc.wait()
+            proc.stdout.close()
+            print(f"[CLIP] ffmpeg returncode: {returncode}")
+            if cache_path:
+                if returncode == 0 and os.path.exists(cache_path):
+                    os.replace(cache_path, output_path)
+                elif os.path.exists(cache_path):
+                    os.remove(cache_path)
+
+        response = Response(generate(), mimetype='video/mp4')
+        response.headers['Content-Disposition'] = f'attachment; filename="{output_filename}"'
+        response.call_on_close(finish)
+        return response
 
     except Exception as e:
         print(f"[CLIP] Error: {e}")
@@ -2110,26 +3638,33 @@ def download_clip_video(job_id, clip_index):
 # WORD-LEVEL TRANSCRIPT EDITING API
 # ============================================================================
 
-@app.route('/api/job/<job_id>/transcript-words', methods=['GET', 'OPTIONS'])
+@app.route('/api/job/<job_id>/transcript-words', methods=['GET'])
 def get_transcript_words(job_id):
     """Get word-level transcript for a job.
     
     Returns transcript parsed into individual words with timestamps.
     Each word includes: text, start_time, end_time, index
     """
-    if request.method == 'OPTIONS':
-        return '', 204
-    
     try:
+        # Unchanged since the client's copy - skip the (large) body entirely
+        etag = job_store.etag(job_id)
+        if is_not_modified(etag):
+            return not_modified(etag, job_store.modified_at(job_id))
+
         # Load job data
-        job_data = load_data(f"job_{job_id}.json", JOBS_DIR)
+        job_data = job_store.get(job_id)
         if not job_data:
             return jsonify({'error': 'Job not found'}), 404
         
         # Check if transcript exists
         if 'transcript' not in job_data:
             return jsonify({'error': 'Transcript not yet available'}), 400
-        
+
+        etag = etag or job_store.etag(job_id)
+        body = get_cached_body(('transcript-words', job_id), etag)
+        if body is not None:
+            return revalidated_json(body, etag, job_store.modified_at(job_id))
+
         # Check cache first
         word_transcript = get_cached_word_transcript(job_id)
         
@@ -2140,14 +3675,16 @@ def get_transcript_words(job_id):
             # Cache for future requests
             cache_word_transcript(job_id, word_transcript)
         
-        # Return word-level data
-        return jsonify({
+        # Return word-level data - Word is a dataclass, so the encoder
+        # serializes the list directly without a dict per word
+        body = cache_body(('transcript-words', job_id), etag, {
             'jobId': job_id,
-            'words': word_transcript.to_dict()['words'],
+            'words': word_transcript.words,
             'word_count': len(word_transcript.words),
             'total_duration': word_transcript.total_duration,
             'segments': job_data.get('transcript', {}).get('segments', [])
-        }), 200
+        })
+        return revalidated_json(body, etag, job_store.modified_at(job_id))
     
     except Exception as e:
         print(f"[ERROR] get_transcript_words: {e}")
@@ -2156,7 +3693,48 @@ def get_transcript_words(job_id):
         return jsonify({'error': str(e)}), 500
 
 
-@app.route('/api/job/<job_id>/clip/<int:clip_index>/words', methods=['GET', 'OPTIONS'])
+# Word lists served by get_clip_words, keyed by job and tied to the transcript
+# object they were built from (a reloaded or replaced transcript rebuilds them)
+_job_words_cache = OrderedDict()
+
+def word_time_columns(words):
+    """(starts, ends) of words for bisecting, or (None, None) if either goes
+    backwards - overlapping words (e.g. estimated ones overrunning the next
+    segment) need a linear scan"""
+    starts = [word['start'] for word in words]
+    ends = [word['end'] for word in words]
+    for column in (starts, ends):
+        if any(a > b for a, b in zip(column, islice(column, 1, None))):
+            return None, None
+    return starts, ends
+
+def get_job_words(job_id, job_data):
+    """(words, starts, ends) for a job - Whisper words, or words estimated from its
+    segment text (empty if there's no text) - plus their start/end times as flat lists.
+    starts/ends are None unless both are non-decreasing, i.e. safe to bisect."""
+    transcript_data = job_data.get('transcript', {})
+    cached = _job_words_cache.get(job_id)
+    if cached and cached[0] is transcript_data:
+        return cached[1]
+
+    words = transcript_data.get('words') or []
+    if not words:
+        print(f"[WARN] No Whisper word data, falling back to estimation")
+        segments = transcript_data.get('segments', [])
+        full_transcript_text = ' '.join(seg.get('text', '') for seg in segments)
+        if full_transcript_text.strip():
+            max_end_time = max((seg.get('end_seconds', 0) for seg in segments), default=0)
+            total_duration = job_data.get('duration_seconds') or max_end_time or 3600
+            words = parse_transcript_to_words(full_transcript_text, '00:00',
+                                             format_seconds_to_timestamp(total_duration))
+
+    result = (words, *word_time_columns(words))
+    _job_words_cache[job_id] = (transcript_data, result)
+    while len(_job_words_cache) > JOB_CACHE_ENTRIES:
+        _job_words_cache.popitem(last=False)
+    return result
+
+@app.route('/api/job/<job_id>/clip/<int:clip_index>/words', methods=['GET'])
 def get_clip_words(job_id, clip_index):
     """Get word-level transcript for editing a clip.
     
@@ -2164,12 +3742,14 @@ def get_clip_words(job_id, clip_index):
     Uses ACTUAL Whisper word-level timestamps (not estimates).
     Format: [{text: "word", start: 0.0, end: 0.5, index: 0}, ...]
     """
-    if request.method == 'OPTIONS':
-        return '', 204
-    
     try:
+        # Unchanged since the client's copy - skip the (large) body entirely
+        etag = job_store.etag(job_id)
+        if is_not_modified(etag):
+            return not_modified(etag, job_store.modified_at(job_id))
+
         # Load job data
-        job_data = load_data(f"job_{job_id}.json", JOBS_DIR)
+        job_data = job_store.get(job_id)
         if not job_data:
             return jsonify({'error': 'Job not found'}), 404
         
@@ -2181,48 +3761,45 @@ def get_clip_words(job_id, clip_index):
         clips = job_data['clips']
         if clip_index < 0 or clip_index >= len(clips):
             return jsonify({'error': 'Invalid clip index'}), 400
+
+        etag = etag or job_store.etag(job_id)
+        body = get_cached_body(('clip-words', job_id, clip_index), etag)
+        if body is not None:
+            return revalidated_json(body, etag, job_store.modified_at(job_id))
         
         clip = clips[clip_index]
         segment_start = parse_timestamp_to_seconds(clip.get('start_timestamp', '00:00'))
         segment_end = parse_timestamp_to_seconds(clip.get('end_timestamp', '00:00'))
         
-        # Get ACTUAL word-level data from Whisper transcription
+        # Get ACTUAL word-level data from Whisper transcription (or the cached estimate)
         transcript_data = job_data.get('transcript', {})
-        words = transcript_data.get('words', [])
-        
-        # Fallback to estimated words if no Whisper word data available
+        words, starts, ends = get_job_words(job_id, job_data)
+
+        # Nothing to estimate from - fall back to the clip's own excerpt
         if not words:
-            print(f"[WARN] No Whisper word data, falling back to estimation")
-            full_transcript_text = ''
-            max_end_time = 0
-            segments = transcript_data.get('segments', [])
-            for seg in segments:
-                full_transcript_text += seg.get('text', '') + ' '
-                seg_end = seg.get('end_seconds', 0)
-                if seg_end > max_end_time:
-                    max_end_time = seg_end
-            
-            if not full_transcript_text.strip():
-                full_transcript_text = clip.get('transcript_excerpt', '')
-                max_end_time = parse_timestamp_to_seconds(clip.get('end_timestamp', '01:00'))
-            
-            total_duration = job_data.get('duration_seconds') or max_end_time or 3600
-            words = parse_transcript_to_words(full_transcript_text, '00:00', 
+            total_duration = job_data.get('duration_seconds') or parse_timestamp_to_seconds(clip.get('end_timestamp', '01:00')) or 3600
+            words = parse_transcript_to_words(clip.get('transcript_excerpt', ''), '00:00',
                                              format_seconds_to_timestamp(total_duration))
-        else:
-            print(f"[INFO] Using Whisper word-level timestamps: {len(words)} words")
+            starts, ends = word_time_columns(words)
         
-        # Find segment boundaries in word list
-        segment_start_index = 0
-        segment_end_index = len(words) - 1
-        
-        for i, word in enumerate(words):
-            if word['start'] <= segment_start + 0.5:
-                segment_start_index = i
-            if word['end'] <= segment_end:
-                segment_end_index = i
+        # Find segment boundaries in word list: last word starting by the clip
+        # start (+0.5s), last word ending by the clip end (else the final word).
+        # Binary search when the start/end arrays are time-ordered.
+        if starts is not None:
+            segment_start_index = max(bisect.bisect_right(starts, segment_start + 0.5) - 1, 0)
+            segment_end_index = bisect.bisect_right(ends, segment_end) - 1
+            if segment_end_index < 0:
+                segment_end_index = len(words) - 1
+        else:
+            segment_start_index = 0
+            segment_end_index = len(words) - 1
+            for i, word in enumerate(words):
+                if word['start'] <= segment_start + 0.5:
+                    segment_start_index = i
+                if word['end'] <= segment_end:
+                    segment_end_index = i
         
-        return jsonify({
+        body = cache_body(('clip-words', job_id, clip_index), etag, {
             'jobId': job_id,
             'clipIndex': clip_index,
             'startTimestamp': clip.get('start_timestamp', '00:00'),
@@ -2233,7 +3810,8 @@ def get_clip_words(job_id, clip_index):
             'segmentEndIndex': segment_end_index,
             'isFullTranscript': True,
             'isWordLevel': transcript_data.get('words') is not None
-        }), 200
+        })
+        return revalidated_json(body, etag, job_store.modified_at(job_id))
     
     except Exception as e:
         print(f"[ERROR] get_clip_words: {e}")
@@ -2242,7 +3820,7 @@ def get_clip_words(job_id, clip_index):
         return jsonify({'error': str(e)}), 500
 
 
-@app.route('/api/job/<job_id>/clip/<int:clip_index>/update-words', methods=['POST', 'OPTIONS'])
+@app.route('/api/job/<job_id>/clip/<int:clip_index>/update-words', methods=['POST'])
 def update_clip_words(job_id, clip_index):
     """Update clip boundaries based on word indices.
     
@@ -2255,9 +3833,6 @@ def update_clip_words(job_id, clip_index):
     Returns updated clip timestamps based on word boundaries.
     Uses simple estimation (~0.3 seconds per word).
     """
-    if request.method == 'OPTIONS':
-        return '', 204
-    
     try:
         data = request.json or {}
         start_word_index = data.get('startWordIndex')
@@ -2278,7 +3853,7 @@ def update_clip_words(job_id, clip_index):
             return jsonify({'error': 'startWordIndex must be <= endWordIndex'}), 400
         
         # Load job data
-        job_data = load_data(f"job_{job_id}.json", JOBS_DIR)
+        job_data = job_store.get(job_id)
         if not job_data:
             return jsonify({'error': 'Job not found'}), 404
         
@@ -2300,14 +3875,9 @@ def update_clip_words(job_id, clip_index):
         # Fallback to estimated words if no Whisper word data
         if not words:
             print(f"[WARN] No Whisper word data in save, falling back to estimation")
-            full_transcript_text = ''
-            max_end_time = 0
             segments = transcript_data.get('segments', [])
-            for seg in segments:
-                full_transcript_text += seg.get('text', '') + ' '
-                seg_end = seg.get('end_seconds', 0)
-                if seg_end > max_end_time:
-                    max_end_time = seg_end
+            full_transcript_text = ''.join(seg.get('text', '') + ' ' for seg in segments)
+            max_end_time = max((seg.get('end_seconds', 0) for seg in segments), default=0)
             
             if not full_transcript_text.strip():
                 full_transcript_text = clip.get('transcript_excerpt', '')
@@ -2354,11 +3924,12 @@ def update_clip_words(job_id, clip_index):
         clip['end_timestamp'] = new_end_timestamp
         clip['duration_minutes'] = duration_minutes
         clip['updatedAt'] = datetime.now().isoformat()
+        clear_clip_status(job_data, clip_index)
         
         # Save updated job
         job_data['clips'] = clips
         job_data['updatedAt'] = datetime.now().isoformat()
-        save_data(f"job_{job_id}.json", job_data, JOBS_DIR)
+        job_store.put(job_data)
         
         return jsonify({
             'success': True,
@@ -2381,18 +3952,15 @@ def update_clip_words(job_id, clip_index):
         return jsonify({'error': str(e)}), 500
 
 
-@app.route('/api/job/<job_id>/clip/<int:clip_index>/segments', methods=['GET', 'OPTIONS'])
+@app.route('/api/job/<job_id>/clip/<int:clip_index>/segments', methods=['GET'])
 def get_clip_segments(job_id, clip_index):
     """Get Whisper segments for a specific clip (for time-based editor).
     
     Returns segments that overlap with the clip time range.
     """
-    if request.method == 'OPTIONS':
-        return '', 204
-    
     try:
         # Load job data
-        job_data = load_data(f"job_{job_id}.json", JOBS_DIR)
+        job_data = job_store.get(job_id)
         if not job_data:
             return jsonify({'error': 'Job not found'}), 404
         
@@ -2425,14 +3993,14 @@ def get_clip_segments(job_id, clip_index):
                 normalized_seg['end'] = seg_end
                 clip_segments.append(normalized_seg)
         
-        return jsonify({
+        return json_response({
             'jobId': job_id,
             'clipIndex': clip_index,
             'startTimestamp': clip.get('start_timestamp', '00:00'),
             'endTimestamp': clip.get('end_timestamp', '00:00'),
             'segments': clip_segments,
             'totalDuration': transcript_data.get('duration', '00:00')
-        }), 200
+        })
     
     except Exception as e:
         print(f"[ERROR] get_clip_segments: {e}")
@@ -2441,7 +4009,7 @@ def get_clip_segments(job_id, clip_index):
         return jsonify({'error': str(e)}), 500
 
 
-@app.route('/api/job/<job_id>/word-search', methods=['GET', 'OPTIONS'])
+@app.route('/api/job/<job_id>/word-search', methods=['GET'])
 def search_words_in_transcript(job_id):
     """Search for words in the transcript.
     
@@ -2451,9 +4019,6 @@ def search_words_in_transcript(job_id):
     
     Returns matching words with their timestamps.
     """
-    if request.method == 'OPTIONS':
-        return '', 204
-    
     try:
         query = request.args.get('q', '').strip()
         if not query:
@@ -2462,7 +4027,7 @@ def search_words_in_transcript(job_id):
         limit = int(request.args.get('limit', 10))
         
         # Load job data
-        job_data = load_data(f"job_{job_id}.json", JOBS_DIR)
+        job_data = job_store.get(job_id)
         if not job_data:
             return jsonify({'error': 'Job not found'}), 404
         
@@ -2474,27 +4039,20 @@ def search_words_in_transcript(job_id):
             cache_word_transcript(job_id, word_transcript)
         
         # Search for matching words (case-insensitive)
-        query_lower = query.lower()
-        matches = []
-        
-        for word in word_transcript.words:
-            if query_lower in word.text.lower():
-                matches.append({
-                    'text': word.text,
-                    'start_time': word.start_time,
-                    'end_time': word.end_time,
-                    'index': word.index,
-                    'formatted_time': format_timestamp(word.start_time)
-                })
-                if len(matches) >= limit:
-                    break
+        matches = [{
+            'text': word.text,
+            'start_time': word.start_time,
+            'end_time': word.end_time,
+            'index': word.index,
+            'formatted_time': format_timestamp(word.start_time)
+        } for word in word_transcript.search_words(query, limit)]
         
-        return jsonify({
+        return json_response({
             'jobId': job_id,
             'query': query,
             'matches': matches,
             'match_count': len(matches)
-        }), 200
+        })
     
     except Exception as e:
         print(f"[ERROR] search_words_in_transcript: {e}")
@@ -2507,33 +4065,44 @@ def search_words_in_transcript(job_id):
 # FRONTEND SERVING (Simple HTML Upload Form)
 # ============================================================================
 
+# index.html has no template variables - read it once at startup and serve the bytes
+INDEX_HTML_PATH = os.path.join(BACKEND_DIR, 'templates', 'index.html')
+with open(INDEX_HTML_PATH, 'rb') as f:
+    INDEX_HTML = f.read().replace(
+        b'src="chunked-uploader.js"',
+        f'src="chunked-uploader.js?v={CHUNKED_UPLOADER_VERSION}"'.encode()
+    )
+INDEX_HTML_ETAG = hashlib.md5(INDEX_HTML).hexdigest()[:12]
+
+def index_response():
+    """Return the cached upload form page, or a 304 if the client already has it"""
+    if is_not_modified(INDEX_HTML_ETAG):
+        return not_modified(INDEX_HTML_ETAG)
+    return _set_validators(Response(INDEX_HTML, mimetype='text/html'), INDEX_HTML_ETAG)
+
 @app.route('/', methods=['GET'])
 def serve_frontend():
     """Serve the simple HTML upload form"""
-    print(f"[DEBUG] Serving root page, BACKEND_DIR={BACKEND_DIR}")
-    try:
-        return render_template('index.html')
-    except Exception as e:
-        print(f"[DEBUG] Template error: {e}")
-        # Fallback: serve directly if template not found
-        index_path = os.path.join(BACKEND_DIR, 'templates', 'index.html')
-        print(f"[DEBUG] Looking for file at: {index_path}")
-        if os.path.exists(index_path):
-            print("[DEBUG] Found file, serving directly")
-            with open(index_path, 'r') as f:
-                return f.read()
-        return jsonify({'status': 'error', 'message': str(e), 'path': index_path}), 500
+    return index_response()
+
+def send_build_file(path):
+    """Send a build file with ETag/Last-Modified revalidation; Next.js's
+    content-hashed _next/static/ assets are cached as immutable instead"""
+    response = send_from_directory(app.static_folder, path, conditional=True, max_age=0)
+    if path.startswith('_next/static/'):
+        response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+    return response
 
 @app.route('/static/<path:path>', methods=['GET'])
 def serve_static(path):
     """Serve static files (Next.js build output)"""
-    return send_from_directory(app.static_folder, path)
+    return send_build_file(path)
 
 @app.route('/_next/<path:path>', methods=['GET'])
 def serve_nextjs(path):
     """Serve Next.js build files"""
     if app.static_folder:
-        return send_from_directory(app.static_folder, f'_next/{path}')
+        return send_build_file(f'_next/{path}')
     return jsonify({'error': 'Static files not available'}), 404
 
 @app.route('/<path:path>', methods=['GET'])
@@ -2541,7 +4110,7 @@ def serve_frontend_routes(path):
     """Catch-all for SPA routes"""
     if path.startswith('api/'):
         return jsonify({'error': 'Not found'}), 404
-    return render_template('index.html')
+    return index_response()
 
 # ============================================================================
 # MAIN
@@ -4,10 +4,21 @@
 import os
 import uuid
 import json
+import struct
 import hashlib
-from datetime import datetime
+import threading
+import time
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from flask import Blueprint, request, jsonify, send_from_directory
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    print("[WARN] orjson not available, using stdlib json")
+
 # Create a blueprint for chunked uploads
 chunked_bp = Blueprint('chunked', __name__, url_prefix='/api/chunked')
 
@@ -19,31 +30,180 @@ print(f"[CHUNKED] Blueprint loaded, BACKEND_DIR: {BACKEND_DIR}")
 # Configuration - use app's data directory
 CHUNKED_UPLOAD_DIR = os.path.join(BACKEND_DIR, 'data', 'chunked_uploads')
 CHUNK_SIZE = 10 * 1024 * 1024  # 10MB chunks (adjust as needed)
+REASSEMBLE_WORKERS = int(os.getenv('REASSEMBLE_WORKERS', '8'))
+REASSEMBLE_PROCESSES = int(os.getenv('REASSEMBLE_PROCESSES', '2'))
+REASSEMBLE_BUFSIZE = 1024 * 1024  # 1MB slices per pread/pwrite
 
 os.makedirs(CHUNKED_UPLOAD_DIR, exist_ok=True)
 
+# Received chunk indexes are appended to session_<id>.log (4 bytes each) instead
+# of rewriting the session JSON per chunk; every SESSION_LOG_COMPACT_EVERY
+# entries the log is folded into the JSON and truncated
+SESSION_LOG_COMPACT_EVERY = 128
+_session_log_lock = threading.RLock()  # re-entered when an append triggers compaction
+
+def _session_file(session_id):
+    return os.path.join(CHUNKED_UPLOAD_DIR, f"session_{session_id}.json")
+
+def _session_log_file(session_id):
+    return os.path.join(CHUNKED_UPLOAD_DIR, f"session_{session_id}.log")
+
 def get_upload_session(session_id):
-    """Load upload session data"""
-    session_file = os.path.join(CHUNKED_UPLOAD_DIR, f"session_{session_id}.json")
-    if os.path.exists(session_file):
-        with open(session_file, 'r') as f:
-            return json.load(f)
-    return None
+    """Load upload session data (JSON snapshot plus any logged chunks)"""
+    session_file = _session_file(session_id)
+    if not os.path.exists(session_file):
+        return None
+    with open(session_file, 'rb') as f:
+        data = f.read()
+    session = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+    log_file = _session_log_file(session_id)
+    if os.path.exists(log_file):
+        with open(log_file, 'rb') as f:
+            log = f.read()
+        log = log[:len(log) - len(log) % 4]  # ignore a torn trailing append
+        bits = get_uploaded_bits(session)
+        for (chunk_index,) in struct.iter_unpack('<I', log):
+            bits |= 1 << chunk_index
+        set_uploaded_bits(session, bits)
+    return session
 
 def save_upload_session(session_data):
-    """Save upload session data"""
-    session_file = os.path.join(CHUNKED_UPLOAD_DIR, f"session_{session_data['id']}.json")
-    with open(session_file, 'w') as f:
-        json.dump(session_data, f, indent=2)
+    """Save upload session data (encoded up front, one write; folds in and clears the chunk log)"""
+    session_file = _session_file(session_data['id'])
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(session_data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(session_data, indent=2).encode('utf-8')
+    tmp_file = f"{session_file}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(payload)
+    # Under the log lock, so no append lands between the snapshot and the log removal
+    with _session_log_lock:
+        os.replace(tmp_file, session_file)
+        # Everything logged so far is in the snapshot now (replaying it would be harmless)
+        log_file = _session_log_file(session_data['id'])
+        if os.path.exists(log_file):
+            os.remove(log_file)
+
+def log_uploaded_chunk(session_id, chunk_index):
+    """Append a received chunk to the session log, compacting it into the JSON when it grows"""
+    with _session_log_lock:
+        with open(_session_log_file(session_id), 'ab') as f:
+            f.write(struct.pack('<I', chunk_index))
+            logged = f.tell() // 4
+        if logged >= SESSION_LOG_COMPACT_EVERY:
+            session = get_upload_session(session_id)
+            session['updatedAt'] = now_iso()
+            save_upload_session(session)
+
+def get_uploaded_bits(session):
+    """Uploaded-chunk bitmap as an int (bit i set = chunk i received)"""
+    if 'uploadedBits' in session:
+        return int(session['uploadedBits'], 16)
+    # Sessions saved before the bitmap kept a list of chunk indexes
+    bits = 0
+    for chunk_index in session.get('uploadedChunks', []):
+        bits |= 1 << chunk_index
+    return bits
+
+def set_uploaded_bits(session, bits):
+    """Store the uploaded-chunk bitmap on the session as hex"""
+    session.pop('uploadedChunks', None)
+    session['uploadedBits'] = format(bits, 'x')
+
+def iter_missing_chunks(bits, total_chunks):
+    """Indexes of chunks not yet uploaded, lowest first"""
+    missing = ((1 << total_chunks) - 1) & ~bits
+    while missing:
+        lowest = missing & -missing
+        yield lowest.bit_length() - 1
+        missing ^= lowest
+
+def now_iso():
+    """Local time as an ISO-8601 string (C strftime, no datetime object per call)"""
+    return time.strftime('%Y-%m-%dT%H:%M:%S')
+
+HASH_BUFSIZE = 1024 * 1024  # large reads let OpenSSL's SHA-NI path run long
+
+def calculate_file_hash(filepath, sha256=None):
+    """Calculate SHA256 hash of file (or feed it into an existing sha256 object)"""
+    if sha256 is None:
+        sha256 = hashlib.sha256()
+    buf = bytearray(HASH_BUFSIZE)
+    view = memoryview(buf)
+    with open(filepath, 'rb', buffering=0) as f:
+        while n := f.readinto(buf):
+            sha256.update(view[:n])
+    return sha256.hexdigest()
+
+HAS_COPY_FILE_RANGE = hasattr(os, 'copy_file_range')
 
-def calculate_file_hash(filepath):
-    """Calculate SHA256 hash of file"""
+def copy_chunk_to_offset(chunk_path, out_fd, offset):
+    """Copy one chunk file into out_fd at offset (safe to run concurrently)"""
+    in_fd = os.open(chunk_path, os.O_RDONLY)
+    try:
+        pos = 0
+        if HAS_COPY_FILE_RANGE:
+            # Kernel-side copy with explicit offsets on both ends - no bytes pass
+            # through Python (sendfile can't be used: it writes at the file position)
+            size = os.fstat(in_fd).st_size
+            try:
+                while pos < size:
+                    copied = os.copy_file_range(in_fd, out_fd, size - pos, pos, offset + pos)
+                    if copied == 0:
+                        break
+                    pos += copied
+            except OSError:
+                pass  # unsupported filesystem - finish with pread/pwrite
+        while True:
+            buf = os.pread(in_fd, REASSEMBLE_BUFSIZE, pos)
+            if not buf:
+                break
+            view = memoryview(buf)
+            while view:
+                n = os.pwrite(out_fd, view, offset + pos)
+                view = view[n:]
+                pos += n
+    finally:
+        os.close(in_fd)
+
+def reassemble_chunks(chunk_paths, final_path, file_size, chunk_size):
+    """Build final_path from chunk files and return its SHA-256 (runs inside the reassembly process pool)
+
+    The copy threads place chunks in parallel while this thread hashes the
+    chunk files in order, so the finished file never has to be read back.
+    """
     sha256 = hashlib.sha256()
-    with open(filepath, 'rb') as f:
-        for chunk in iter(lambda: f.read(8192), b''):
-            sha256.update(chunk)
+    out_fd = os.open(final_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.ftruncate(out_fd, file_size)
+        # Chunks land at known, non-overlapping offsets, so copy them in parallel
+        with ThreadPoolExecutor(max_workers=REASSEMBLE_WORKERS) as pool:
+            futures = [
+                pool.submit(copy_chunk_to_offset, chunk_path, out_fd, i * chunk_size)
+                for i, chunk_path in enumerate(chunk_paths)
+            ]
+            for chunk_path in chunk_paths:
+                calculate_file_hash(chunk_path, sha256)
+            for future in futures:
+                future.result()
+    finally:
+        os.close(out_fd)
     return sha256.hexdigest()
 
+# Created on first use so importing the blueprint doesn't fork worker processes
+_reassemble_pool = None
+_reassemble_pool_lock = threading.Lock()
+
+def get_reassemble_pool():
+    """Bounded process pool that keeps reassembly I/O out of the web process"""
+    global _reassemble_pool
+    with _reassemble_pool_lock:
+        if _reassemble_pool is None:
+            _reassemble_pool = ProcessPoolExecutor(max_workers=REASSEMBLE_PROCESSES)
+        return _reassemble_pool
+
 # ============================================================================
 # API ROUTES - CHUNKED UPLOAD
 # ============================================================================
@@ -69,6 +229,7 @@ def initiate_upload():
         
         # Calculate total chunks
         total_chunks = (file_size + chunk_size - 1) // chunk_size
+        now = now_iso()
         
         # Create upload session
         session_data = {
@@ -77,10 +238,10 @@ def initiate_upload():
             'fileSize': file_size,
             'chunkSize': chunk_size,
             'totalChunks': total_chunks,
-            'uploadedChunks': [],
+            'uploadedBits': '0',
             'status': 'in_progress',
-            'createdAt': datetime.now().isoformat(),
-            'updatedAt': datetime.now().isoformat()
+            'createdAt': now,
+            'updatedAt': now
         }
         
         # Create directory for this upload
@@ -130,12 +291,15 @@ def upload_chunk():
             return jsonify({'error': f'Upload already completed or failed: {session["status"]}'}), 400
         
         # Validate chunk index
-        if chunk_index in session['uploadedChunks']:
+        total_chunks = session['totalChunks']
+        bits = get_uploaded_bits(session)
+        if bits >> chunk_index & 1:
             # Chunk already uploaded - return success
+            chunks_uploaded = bits.bit_count()
             return jsonify({
                 'chunkIndex': chunk_index,
-                'chunksUploaded': len(session['uploadedChunks']),
-                'progress': len(session['uploadedChunks']) / session['totalChunks'] * 100,
+                'chunksUploaded': chunks_uploaded,
+                'progress': chunks_uploaded / total_chunks * 100,
                 'message': 'Chunk already uploaded'
             }), 200
         
@@ -145,17 +309,17 @@ def upload_chunk():
         chunk_file.save(chunk_path)
         
         # Update session
-        session['uploadedChunks'].append(chunk_index)
-        session['updatedAt'] = datetime.now().isoformat()
-        save_upload_session(session)
+        bits |= 1 << chunk_index
+        log_uploaded_chunk(upload_id, chunk_index)
         
         # Calculate progress
-        progress = len(session['uploadedChunks']) / session['totalChunks'] * 100
+        chunks_uploaded = bits.bit_count()
+        progress = chunks_uploaded / total_chunks * 100
         
         return jsonify({
             'chunkIndex': chunk_index,
-            'chunksUploaded': len(session['uploadedChunks']),
-            'totalChunks': session['totalChunks'],
+            'chunksUploaded': chunks_uploaded,
+            'totalChunks': total_chunks,
             'progress': progress
         }), 200
         
@@ -174,13 +338,14 @@ def get_upload_status(upload_id):
         if not session:
             return jsonify({'error': 'Upload session not found'}), 404
         
+        chunks_uploaded = get_uploaded_bits(session).bit_count()
         return jsonify({
             'status': session['status'],
             'filename': session['filename'],
             'fileSize': session['fileSize'],
-            'chunksUploaded': len(session['uploadedChunks']),
+            'chunksUploaded': chunks_uploaded,
             'totalChunks': session['totalChunks'],
-            'progress': len(session['uploadedChunks']) / session['totalChunks'] * 100
+            'progress': chunks_uploaded / session['totalChunks'] * 100
         }), 200
         
     except Exception as e:
@@ -215,17 +380,16 @@ def complete_upload(upload_id=None):
                 'message': 'Upload already completed'
             }), 200
         
-        # Check if all chunks uploaded
-        expected_chunks = set(range(session['totalChunks']))
-        uploaded_chunks = set(session['uploadedChunks'])
-        missing_chunks = expected_chunks - uploaded_chunks
-        
-        if missing_chunks:
+        # Check if all chunks uploaded (only enumerate the gaps when something is missing)
+        bits = get_uploaded_bits(session)
+        chunks_uploaded = bits.bit_count()
+        if chunks_uploaded < session['totalChunks']:
+            missing_chunks = list(islice(iter_missing_chunks(bits, session['totalChunks']), 10))
             return jsonify({
-                'error': f'Missing chunks: {sorted(missing_chunks)[:10]}...',
-                'missingCount': len(missing_chunks),
+                'error': f'Missing chunks: {missing_chunks}...',
+                'missingCount': session['totalChunks'] - chunks_uploaded,
                 'totalChunks': session['totalChunks'],
-                'uploadedChunks': len(session['uploadedChunks'])
+                'uploadedChunks': chunks_uploaded
             }), 400
         
         # Reassemble chunks
@@ -239,18 +403,16 @@ def complete_upload(upload_id=None):
         final_filename = f"{upload_id}_{session['filename']}"
         final_path = os.path.join(final_dir, final_filename)
         
-        # Combine chunks with error handling
+        chunk_paths = [os.path.join(upload_dir, f"chunk_{i:05d}") for i in range(session['totalChunks'])]
+        for i, chunk_path in enumerate(chunk_paths):
+            if not os.path.exists(chunk_path):
+                return jsonify({'error': f'Chunk {i} not found at {chunk_path}'}), 500
+
         print(f"[CHUNKED] Reassembling {session['totalChunks']} chunks...")
         try:
-            with open(final_path, 'wb') as outfile:
-                for i in range(session['totalChunks']):
-                    chunk_path = os.path.join(upload_dir, f"chunk_{i:05d}")
-                    if not os.path.exists(chunk_path):
-                        return jsonify({'error': f'Chunk {i} not found at {chunk_path}'}), 500
-                    with open(chunk_path, 'rb') as infile:
-                        outfile.write(infile.read())
-                    if i % 10 == 0:
-                        print(f"[CHUNKED] Processed chunk {i}/{session['totalChunks']}")
+            file_hash = get_reassemble_pool().submit(
+                reassemble_chunks, chunk_paths, final_path, session['fileSize'], session['chunkSize']
+            ).result()
         except Exception as e:
             print(f"[CHUNKED] Error reassembling: {e}")
             return jsonify({'error': f'Failed to reassemble file: {str(e)}'}), 500
@@ -258,15 +420,12 @@ def complete_upload(upload_id=None):
         # Verify file size
         actual_size = os.path.getsize(final_path)
         
-        # Calculate hash
-        file_hash = calculate_file_hash(final_path)
-        
         # Update session
         session['status'] = 'completed'
         session['finalPath'] = final_path
         session['finalSize'] = actual_size
         session['fileHash'] = file_hash
-        session['completedAt'] = datetime.now().isoformat()
+        session['completedAt'] = now_iso()
         save_upload_session(session)
         
         # Cleanup chunks (optional - comment out to keep for debugging)
@@ -309,9 +468,9 @@ def abort_upload():
             shutil.rmtree(upload_dir)
         
         # Remove session file
-        session_file = os.path.join(CHUNKED_UPLOAD_DIR, f"session_{upload_id}.json")
-        if os.path.exists(session_file):
-            os.remove(session_file)
+        for session_file in (_session_file(upload_id), _session_log_file(upload_id)):
+            if os.path.exists(session_file):
+                os.remove(session_file)
         
         return jsonify({'status': 'aborted', 'uploadId': upload_id}), 200
         
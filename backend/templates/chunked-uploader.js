@@ -137,14 +137,14 @@ class ChunkedUploader {
         
         for (let attempt = 0; attempt < this.retryAttempts; attempt++) {
             try {
-                const formData = new FormData();
-                formData.append('chunk', chunk);
-                formData.append('uploadId', this.uploadId);
-                formData.append('chunkIndex', chunkIndex);
-                
                 const response = await fetch('/api/chunked/upload', {
                     method: 'POST',
-                    body: formData
+                    headers: {
+                        'Content-Type': 'application/octet-stream',
+                        'X-Upload-Id': this.uploadId,
+                        'X-Chunk-Index': String(chunkIndex)
+                    },
+                    body: chunk
                 });
                 
                 if (!response.ok) {
@@ -0,0 +1,44 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from word_level_transcript import ClipWordEditor, WordLevelTranscriptParser
+
+# 12 words squeezed into 0.2s get 0.05s each, so they run to 0.6s - past the
+# next segment's start at 0.3s
+DENSE_SEGMENTS = [
+    {'text': 'a b c d e f g h i j k l', 'start_seconds': 0.0, 'end_seconds': 0.2},
+    {'text': 'next words here now', 'start_seconds': 0.3, 'end_seconds': 2.0},
+]
+
+
+def overlapping(words, start_time, end_time):
+    return [w for w in words if w.end_time >= start_time and w.start_time <= end_time]
+
+
+def test_range_lookups_with_overlapping_segments():
+    transcript = WordLevelTranscriptParser().parse_transcript(DENSE_SEGMENTS)
+
+    words = transcript.get_words_in_range(0.35, 0.5)
+    assert [w.text for w in words] == ['g', 'h', 'i', 'j', 'k', 'next']
+    assert words == overlapping(transcript.words, 0.35, 0.5)
+    assert transcript.get_word_indices_for_range(0.35, 0.5) == (6, 12)
+
+    clip = ClipWordEditor(transcript).get_clip_words(0.35, 0.5)
+    assert clip['text'] == 'g h i j k next'
+    assert (clip['start_index'], clip['end_index']) == (6, 12)
+
+
+def test_range_lookups_match_linear_filter_when_ordered():
+    segments = [
+        {'text': 'hello world number %d again' % i, 'start_seconds': i * 10.0, 'end_seconds': i * 10.0 + 10}
+        for i in range(5)
+    ]
+    transcript = WordLevelTranscriptParser().parse_transcript(segments)
+
+    for start_time, end_time in [(0, 0), (3.3, 17.9), (12, 12.5), (25, 60), (60, 70)]:
+        expected = overlapping(transcript.words, start_time, end_time)
+        assert transcript.get_words_in_range(start_time, end_time) == expected
+        clip = ClipWordEditor(transcript).get_clip_words(start_time, end_time)
+        assert clip['word_count'] == len(expected)
@@ -12,7 +12,18 @@ Supports:
 """
 
 import re
+import bisect
+import heapq
 import logging
+import math
+import os
+import pickle
+import sys
+import threading
+from array import array
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from itertools import accumulate, islice
 from typing import List, Dict, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -24,8 +35,39 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Patterns used by clean_transcript_text on every segment. Brackets and time
+# codes stay separate passes: removing a [..] can join digits into a new time code.
+BRACKETED_RE = re.compile(r'\[[^\]]*\]')
+TIME_CODE_RE = re.compile(r'\d+:\d+\.?\d*')
+PUNCTUATION_RE = re.compile(r'[^\w\s\'-]')
+WHITESPACE_RE = re.compile(r'\s+')
+# PUNCTUATION_RE's deletions for ASCII text, as a str.translate table
+ASCII_PUNCTUATION_TABLE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128)
+    if not (chr(c).isalnum() or chr(c).isspace() or chr(c) in "_'-")
+))
 
-@dataclass
+
+def _non_decreasing(values) -> bool:
+    """Whether a sequence never decreases (so it can be bisected)."""
+    return all(a <= b for a, b in zip(values, islice(values, 1, None)))
+
+
+@lru_cache(maxsize=4096)
+def clean_transcript_text(text: str) -> str:
+    """Clean transcript text for word parsing (cached - segments repeat boilerplate)."""
+    cleaned = BRACKETED_RE.sub('', text)  # Remove [timestamp] style
+    cleaned = TIME_CODE_RE.sub('', cleaned)  # Remove time codes
+    # Keep apostrophes and hyphens
+    if cleaned.isascii():
+        cleaned = cleaned.translate(ASCII_PUNCTUATION_TABLE)
+    else:
+        cleaned = PUNCTUATION_RE.sub('', cleaned)
+    cleaned = WHITESPACE_RE.sub(' ', cleaned)  # Normalize whitespace
+    return cleaned.strip()
+
+
+@dataclass(slots=True)
 class Word:
     """Represents a single word with timestamp information."""
     text: str
@@ -48,6 +90,14 @@ class Word:
         }
 
 
+def words_to_dicts(words: List[Word]) -> List[Dict[str, Any]]:
+    """Word.to_dict() for each word, built inline rather than a method call per word."""
+    return [
+        {'text': w.text, 'start_time': w.start_time, 'end_time': w.end_time, 'index': w.index}
+        for w in words
+    ]
+
+
 @dataclass
 class WordTranscript:
     """Container for word-level transcript data."""
@@ -58,21 +108,111 @@ class WordTranscript:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
-            'words': [w.to_dict() for w in self.words],
+            'words': words_to_dicts(self.words),
             'word_count': len(self.words),
             'total_duration': self.total_duration
         }
     
+    # Flat (unboxed float) views of the time-ordered word list plus a search index, built on first use
+    _starts: array = field(default_factory=lambda: array('d'), init=False, repr=False, compare=False)
+    _ends: array = field(default_factory=lambda: array('d'), init=False, repr=False, compare=False)
+    _postings: Dict[str, List[int]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _vocab: List[str] = field(default_factory=list, init=False, repr=False, compare=False)
+    _vocab_offsets: List[int] = field(default_factory=list, init=False, repr=False, compare=False)
+    _vocab_text: str = field(default='', init=False, repr=False, compare=False)
+    _text: str = field(default='', init=False, repr=False, compare=False)
+    _text_ends: array = field(default_factory=lambda: array('q'), init=False, repr=False, compare=False)
+    _time_ordered: bool = field(default=True, init=False, repr=False, compare=False)
+    _indexed_count: int = field(default=-1, init=False, repr=False, compare=False)
+
+    def _ensure_index(self) -> None:
+        """Build start/end time arrays and an inverted index of the lowercased words."""
+        if self._indexed_count == len(self.words):
+            return
+        self._starts = array('d', [w.start_time for w in self.words])
+        self._ends = array('d', [w.end_time for w in self.words])
+        # Time ranges can only be bisected when starts and ends both never go
+        # backwards. Estimated words can overrun the next segment's start (each
+        # gets at least 0.05s), and then ranges fall back to a linear scan.
+        self._time_ordered = _non_decreasing(self._starts) and _non_decreasing(self._ends)
+        # Distinct lowercased word -> positions in self.words (ascending)
+        postings = defaultdict(list)
+        for i, w in enumerate(self.words):
+            postings[w.text.lower()].append(i)
+        self._postings = dict(postings)
+        # Vocabulary joined by NUL (never part of a word) for substring lookups;
+        # _vocab_offsets[k] is where _vocab[k] starts in _vocab_text
+        self._vocab = list(self._postings)
+        self._vocab_offsets = [0, *accumulate(len(text) + 1 for text in self._vocab[:-1])] if self._vocab else []
+        self._vocab_text = '\x00'.join(self._vocab)
+        # All words space-joined; word i ends just before _text_ends[i]
+        self._text = ' '.join(w.text for w in self.words)
+        self._text_ends = array('q', accumulate(len(w.text) + 1 for w in self.words))
+        self._indexed_count = len(self.words)
+
+    def text_between(self, first: int, last: int) -> str:
+        """Space-joined text of the words at positions [first, last)."""
+        self._ensure_index()
+        if first >= last:
+            return ''
+        start = self._text_ends[first - 1] if first > 0 else 0
+        return self._text[start:self._text_ends[last - 1] - 1]
+
+    def find_word_index_at(self, time: float) -> int:
+        """Position of the first word ending at or after time (len(words) if none)."""
+        self._ensure_index()
+        if self._time_ordered:
+            return bisect.bisect_left(self._ends, time)
+        return next((i for i, end in enumerate(self._ends) if end >= time), len(self._ends))
+
+    def _range_bounds(self, start_time: float, end_time: float) -> Optional[Tuple[int, int]]:
+        """[first, last) positions of the words overlapping a time range, or None
+        if word times aren't ordered (the overlapping words may not be contiguous)."""
+        self._ensure_index()
+        if not self._time_ordered:
+            return None
+        first = bisect.bisect_left(self._ends, start_time)
+        last = bisect.bisect_right(self._starts, end_time)
+        return first, last
+
     def get_words_in_range(self, start_time: float, end_time: float) -> List[Word]:
         """Get all words within a time range."""
-        return [w for w in self.words if w.end_time >= start_time and w.start_time <= end_time]
+        bounds = self._range_bounds(start_time, end_time)
+        if bounds is None:
+            return [w for w in self.words if w.end_time >= start_time and w.start_time <= end_time]
+        first, last = bounds
+        return self.words[first:last]
+
+    def search_words(self, query: str, limit: int) -> List[Word]:
+        """Get up to limit words containing query (case-insensitive), in transcript order."""
+        self._ensure_index()
+        query = query.lower()
+        if not query or '\x00' in query:
+            return []
+
+        # Scan the distinct words, not every word, then merge their postings
+        hits = []
+        pos = self._vocab_text.find(query)
+        while pos != -1:
+            k = bisect.bisect_right(self._vocab_offsets, pos) - 1
+            hits.append(self._postings[self._vocab[k]])
+            if k + 1 >= len(self._vocab_offsets):
+                break
+            pos = self._vocab_text.find(query, self._vocab_offsets[k + 1])
+
+        positions = hits[0] if len(hits) == 1 else heapq.merge(*hits)
+        return [self.words[i] for i in islice(positions, limit)]
     
     def get_word_indices_for_range(self, start_time: float, end_time: float) -> Tuple[int, int]:
         """Get start and end word indices for a time range."""
-        words_in_range = self.get_words_in_range(start_time, end_time)
-        if not words_in_range:
+        bounds = self._range_bounds(start_time, end_time)
+        if bounds is None:
+            words = self.get_words_in_range(start_time, end_time)
+            return (words[0].index, words[-1].index) if words else (0, 0)
+        first, last = bounds
+        if first >= last:
             return (0, 0)
-        return (words_in_range[0].index, words_in_range[-1].index)
+        return (self.words[first].index, self.words[last - 1].index)
     
     def get_time_range_for_indices(self, start_index: int, end_index: int) -> Tuple[float, float]:
         """Get start and end times for a range of word indices."""
@@ -138,6 +278,8 @@ class WordLevelTranscriptParser:
             words.extend(segment_words)
             word_index += len(segment_words)
         
+        logger.debug("clean_transcript_text cache: %s", clean_transcript_text.cache_info())
+        
         # Calculate total duration
         total_duration = words[-1].end_time if words else 0.0
         
@@ -170,75 +312,42 @@ class WordLevelTranscriptParser:
         Returns:
             List of Word objects
         """
-        words = []
-        
         # Clean and split text into words
-        cleaned_text = self._clean_text(text)
-        word_list = cleaned_text.split()
+        cleaned_text = clean_transcript_text(text)
+        # Interned so repeated words ("the", "and", ...) share one string object
+        word_list = list(map(sys.intern, cleaned_text.split()))
         
         if not word_list:
-            return words
+            return []
         
         # Calculate duration per word using actual timing
         segment_duration = end_time - start_time
         
-        if segment_duration > 0 and len(word_list) > 0:
+        if segment_duration > 0:
             # Use actual duration distribution
             # Words typically have varying lengths, so we weight by word length
-            total_chars = sum(len(w) for w in word_list)
+            total_chars = sum(map(len, word_list))
             
             if total_chars > 0:
-                # Distribute time proportional to character count
-                current_time = start_time
-                for i, word in enumerate(word_list):
-                    word_duration = (len(word) / total_chars) * segment_duration
-                    # Ensure minimum duration
-                    word_duration = max(word_duration, 0.05)
-                    
-                    word_obj = Word(
-                        text=word,
-                        start_time=current_time,
-                        end_time=current_time + word_duration,
-                        index=start_index + i
-                    )
-                    words.append(word_obj)
-                    current_time += word_duration
+                # Distribute time proportional to character count (minimum 0.05s each)
+                durations = [max(len(word) / total_chars * segment_duration, 0.05) for word in word_list]
             else:
                 # Fallback: equal distribution
-                word_duration = segment_duration / len(word_list)
-                current_time = start_time
-                for i, word in enumerate(word_list):
-                    word_obj = Word(
-                        text=word,
-                        start_time=current_time,
-                        end_time=current_time + word_duration,
-                        index=start_index + i
-                    )
-                    words.append(word_obj)
-                    current_time += word_duration
+                durations = [segment_duration / len(word_list)] * len(word_list)
         else:
             # Fallback: use average word duration
-            current_time = start_time
-            for i, word in enumerate(word_list):
-                word_obj = Word(
-                    text=word,
-                    start_time=current_time,
-                    end_time=current_time + self.avg_word_duration,
-                    index=start_index + i
-                )
-                words.append(word_obj)
-                current_time += self.avg_word_duration
-        
-        return words
+            durations = [self.avg_word_duration] * len(word_list)
+        
+        # Word i spans boundaries[i]..boundaries[i + 1]
+        boundaries = list(accumulate(durations, initial=start_time))
+        return list(map(
+            Word, word_list, boundaries, islice(boundaries, 1, None),
+            range(start_index, start_index + len(word_list))
+        ))
     
     def _clean_text(self, text: str) -> str:
         """Clean transcript text for word parsing."""
-        # Remove speaker labels and timestamps
-        cleaned = re.sub(r'\[[^\]]*\]', '', text)  # Remove [timestamp] style
-        cleaned = re.sub(r'\d+:\d+\.?\d*', '', cleaned)  # Remove time codes
-        cleaned = re.sub(r'[^\w\s\'-]', '', cleaned)  # Keep apostrophes and hyphens
-        cleaned = re.sub(r'\s+', ' ', cleaned)  # Normalize whitespace
-        return cleaned.strip()
+        return clean_transcript_text(text)
     
     def get_partial_word(
         self, 
@@ -324,7 +433,11 @@ class ClipWordEditor:
         Returns:
             Dictionary with words, indices, and timing info
         """
-        words = self.transcript.get_words_in_range(clip_start, clip_end)
+        bounds = self.transcript._range_bounds(clip_start, clip_end)
+        if bounds is None:
+            words = self.transcript.get_words_in_range(clip_start, clip_end)
+        else:
+            words = self.transcript.words[bounds[0]:bounds[1]]
         
         if not words:
             return {
@@ -336,14 +449,18 @@ class ClipWordEditor:
                 'word_count': 0
             }
         
+        if bounds is None:
+            text = ' '.join(w.text for w in words)
+        else:
+            text = self.transcript.text_between(*bounds)
         return {
-            'words': [w.to_dict() for w in words],
+            'words': words_to_dicts(words),
             'start_index': words[0].index,
             'end_index': words[-1].index,
             'start_time': words[0].start_time,
             'end_time': words[-1].end_time,
             'word_count': len(words),
-            'text': ' '.join(w.text for w in words)
+            'text': text
         }
     
     def update_clip_by_words(
@@ -418,8 +535,8 @@ class ClipWordEditor:
             'end_time': new_end_time,
             'duration': new_end_time - new_start_time,
             'word_count': len(words),
-            'text': ' '.join(w.text for w in words),
-            'words': [w.to_dict() for w in words],
+            'text': self.transcript.text_between(start_word_index, end_word_index + 1),
+            'words': words_to_dicts(words),
             'partial_options': partial_info,
             'formatted_start': self._format_timestamp(new_start_time),
             'formatted_end': self._format_timestamp(new_end_time)
@@ -427,13 +544,7 @@ class ClipWordEditor:
     
     def _format_timestamp(self, seconds: float) -> str:
         """Format seconds to MM:SS or HH:MM:SS format."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        
-        if hours > 0:
-            return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-        return f"{minutes:02d}:{secs:02d}"
+        return format_timestamp(seconds)
 
 
 # =============================================================================
@@ -442,9 +553,14 @@ class ClipWordEditor:
 
 def format_timestamp(seconds: float) -> str:
     """Format seconds to MM:SS or HH:MM:SS format."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    return _format_whole_seconds(math.floor(seconds))
+
+
+@lru_cache(maxsize=16384)
+def _format_whole_seconds(seconds: int) -> str:
+    """format_timestamp for an int, cached since nearby words share the same second."""
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
     
     if hours > 0:
         return f"{hours:02d}:{minutes:02d}:{secs:02d}"
@@ -481,31 +597,132 @@ def create_word_transcript_from_job(job_data: Dict) -> WordTranscript:
     
     segments = job_data['transcript']['segments']
     parser = WordLevelTranscriptParser()
-    return parser.parse_transcript(segments)
+    transcript = parser.parse_transcript(segments)
+    # Build the search index now, while the transcript is built for the cache,
+    # rather than on the first search request
+    transcript._ensure_index()
+    return transcript
 
 
 # =============================================================================
 # CACHING
 # =============================================================================
 
-# In-memory cache for word transcripts (job_id -> WordTranscript)
-_word_transcript_cache: Dict[str, WordTranscript] = {}
+# In-memory LRU cache for word transcripts (job_id -> WordTranscript), least
+# recently used first; bounded so a long-running server doesn't keep every job
+MAX_CACHED_WORD_TRANSCRIPTS = 64
+_word_transcript_cache: "OrderedDict[str, WordTranscript]" = OrderedDict()
+_word_transcript_cache_lock = threading.Lock()
+
+
+# Optional on-disk tier, so a restart doesn't re-parse every transcript; enabled by
+# set_word_transcript_cache_dir(). Entries are pickled as flat columns, not Words.
+_word_transcript_cache_dir: Optional[str] = None
+
+
+def set_word_transcript_cache_dir(directory: Optional[str]) -> None:
+    """Persist cached word transcripts under directory (None disables the disk tier)."""
+    global _word_transcript_cache_dir
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    _word_transcript_cache_dir = directory
+
+
+def _word_transcript_path(job_id: str) -> Optional[str]:
+    if not _word_transcript_cache_dir:
+        return None
+    return os.path.join(_word_transcript_cache_dir, f"{os.path.basename(job_id)}.pkl")
+
+
+def _save_word_transcript(path: str, transcript: WordTranscript) -> None:
+    """Atomically write transcript's words as parallel columns."""
+    words = transcript.words
+    state = {
+        'texts': [w.text for w in words],
+        'starts': array('d', [w.start_time for w in words]),
+        'ends': array('d', [w.end_time for w in words]),
+        'indices': array('q', [w.index for w in words]),
+        'total_duration': transcript.total_duration,
+    }
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not persist word transcript {path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _load_word_transcript(path: str) -> Optional[WordTranscript]:
+    """Rebuild a transcript written by _save_word_transcript, or None."""
+    try:
+        with open(path, 'rb') as f:
+            state = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable word transcript {path}: {e}")
+        return None
+    transcript = WordTranscript(
+        words=list(map(Word, state['texts'], state['starts'], state['ends'], state['indices'])),
+        total_duration=state['total_duration']
+    )
+    transcript._ensure_index()
+    return transcript
+
+
+def _remember_word_transcript(job_id: str, transcript: WordTranscript) -> None:
+    with _word_transcript_cache_lock:
+        _word_transcript_cache[job_id] = transcript
+        _word_transcript_cache.move_to_end(job_id)
+        while len(_word_transcript_cache) > MAX_CACHED_WORD_TRANSCRIPTS:
+            _word_transcript_cache.popitem(last=False)
 
 
 def get_cached_word_transcript(job_id: str) -> Optional[WordTranscript]:
-    """Get cached word transcript for a job."""
-    return _word_transcript_cache.get(job_id)
+    """Get cached word transcript for a job (memory first, then disk)."""
+    with _word_transcript_cache_lock:
+        transcript = _word_transcript_cache.get(job_id)
+        if transcript is not None:
+            _word_transcript_cache.move_to_end(job_id)
+            return transcript
+    path = _word_transcript_path(job_id)
+    if path is None:
+        return None
+    transcript = _load_word_transcript(path)
+    if transcript is not None:
+        _remember_word_transcript(job_id, transcript)
+    return transcript
 
 
 def cache_word_transcript(job_id: str, transcript: WordTranscript) -> None:
-    """Cache word transcript for a job."""
-    _word_transcript_cache[job_id] = transcript
+    """Cache word transcript for a job, evicting the least recently used."""
+    _remember_word_transcript(job_id, transcript)
+    path = _word_transcript_path(job_id)
+    if path is not None:
+        _save_word_transcript(path, transcript)
 
 
 def clear_word_transcript_cache(job_id: str = None) -> None:
-    """Clear word transcript cache."""
-    global _word_transcript_cache
+    """Clear word transcript cache (and its on-disk copies)."""
+    with _word_transcript_cache_lock:
+        if job_id:
+            _word_transcript_cache.pop(job_id, None)
+        else:
+            _word_transcript_cache.clear()
+    if not _word_transcript_cache_dir:
+        return
     if job_id:
-        _word_transcript_cache.pop(job_id, None)
+        paths = [_word_transcript_path(job_id)]
     else:
-        _word_transcript_cache.clear()
+        paths = [os.path.join(_word_transcript_cache_dir, name)
+                 for name in os.listdir(_word_transcript_cache_dir) if name.endswith('.pkl')]
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -12,6 +12,81 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Tuple
 import re
 import math
+import heapq
+from functools import lru_cache
+from operator import itemgetter
+
+
+# A pattern that is only literal word alternatives: \b(word|two words|...)\b
+LITERAL_PATTERN_RE = re.compile(r'\\b\(([a-z |]+)\)\\b')
+# Splits text into [gap, word, gap, word, ..., gap]
+WORD_SPLIT_RE = re.compile(r'(\w+)')
+
+
+def _index_title_patterns(patterns: Dict[str, str]):
+    """
+    Split title patterns into word lookups and regexes.
+    
+    Returns (words, phrases, regexes): single literal words -> pattern name,
+    first word -> [(remaining words, pattern name)] for multi-word literals,
+    and compiled regexes for the patterns that aren't literal alternatives.
+    """
+    words, phrases, regexes = {}, {}, {}
+    for name, pattern in patterns.items():
+        match = LITERAL_PATTERN_RE.fullmatch(pattern)
+        if not match:
+            regexes[name] = re.compile(pattern)
+            continue
+        for alternative in match.group(1).split('|'):
+            first, *rest = alternative.split(' ')
+            if rest:
+                phrases.setdefault(first, []).append((rest, name))
+            else:
+                words[first] = name
+    return words, phrases, regexes
+
+
+# Common stop words, ignored by transcript similarity
+STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at',
+                        'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were',
+                        'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does',
+                        'did', 'will', 'would', 'could', 'should', 'may', 'might'})
+
+
+@lru_cache(maxsize=64)
+def _content_words(text: str) -> frozenset:
+    """Distinct lowercased words of text, minus stop words."""
+    return frozenset(text.lower().split()) - STOP_WORDS
+
+
+@lru_cache(maxsize=4096)
+def _parse_published_date(published_date: str) -> Optional[datetime]:
+    """Naive datetime for a YYYY-MM-DD or ISO datetime string, or None if unparseable
+    (cached - the same videos are rescored for each episode and weighting)."""
+    try:
+        # Try parsing ISO format
+        if 'T' in published_date:
+            pub_date = datetime.fromisoformat(published_date.replace('Z', '+00:00'))
+            # Convert to naive datetime for calculation
+            return pub_date.replace(tzinfo=None)
+        return datetime.strptime(published_date, '%Y-%m-%d')
+    except (ValueError, AttributeError):
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _category_match_score(user_category: str, target_category: str) -> float:
+    """1.0 for the same category, 0.5 if one contains the other, else 0.0
+    (cached - there are few distinct categories across a batch)."""
+    user_category = user_category.lower().strip()
+    target_category = target_category.lower().strip()
+    
+    if user_category and target_category:
+        if user_category == target_category:
+            return 1.0
+        elif user_category in target_category or target_category in user_category:
+            return 0.5  # Partial match
+    return 0.0
 
 
 class YouTubeTitleScorer:
@@ -37,6 +112,7 @@ class YouTubeTitleScorer:
         'pattern': 0.05,
         'cluster': 0.02
     }
+    FACTORS = tuple(DEFAULT_WEIGHTS)
     
     # Title pattern triggers (for pattern matching)
     TITLE_PATTERNS = {
@@ -52,6 +128,24 @@ class YouTubeTitleScorer:
         'list': r'\b(\d+\s+(things|ways|reasons|tips|secrets|tricks|hacks))\b',
     }
     
+    # Score added per matching title pattern
+    PATTERN_WEIGHTS = {
+        'numbers': 0.15,
+        'how_to': 0.15,
+        'why': 0.10,
+        'best': 0.10,
+        'mistakes': 0.15,
+        'secret': 0.15,
+        'emotional': 0.10,
+        'tutorial': 0.10,
+        'vs': 0.05,
+        'list': 0.20,
+    }
+    
+    # Literal-word patterns become hash lookups on the title's words; only the
+    # rest ('numbers', 'list') run as regexes
+    _TITLE_WORDS, _TITLE_PHRASES, _TITLE_REGEXES = _index_title_patterns(TITLE_PATTERNS)
+    
     # Emotional triggers for scoring
     EMOTIONAL_WORDS = {
         'high': ['amazing', 'incredible', 'shocking', 'insane', 'mind-blowing', 
@@ -69,9 +163,9 @@ class YouTubeTitleScorer:
             weights: Dictionary of factor weights. If None, uses DEFAULT_WEIGHTS.
         """
         self.weights = weights or self.DEFAULT_WEIGHTS.copy()
-        # Normalize weights to sum to 1
+        # Normalize weights to sum to 1 (a sum of floats may miss 1.0 by rounding)
         total = sum(self.weights.values())
-        if total != 1.0 and total > 0:
+        if total > 0 and not math.isclose(total, 1.0, rel_tol=1e-9):
             self.weights = {k: v / total for k, v in self.weights.items()}
     
     # =========================================================================
@@ -146,7 +240,8 @@ class YouTubeTitleScorer:
     # FACTOR 3: Recency (15% weight)
     # =========================================================================
     
-    def calculate_recency_score(self, published_date: str) -> float:
+    def calculate_recency_score(self, published_date: str,
+                                now: Optional[datetime] = None) -> float:
         """
         Score based on how recently the video was uploaded.
         
@@ -157,22 +252,16 @@ class YouTubeTitleScorer:
         
         Args:
             published_date: ISO format date string (YYYY-MM-DD or ISO datetime)
+            now: Reference time (defaults to datetime.now())
             
         Returns:
             Score between 0 and 1
         """
-        try:
-            # Try parsing ISO format
-            if 'T' in published_date:
-                pub_date = datetime.fromisoformat(published_date.replace('Z', '+00:00'))
-                # Convert to naive datetime for calculation
-                pub_date = pub_date.replace(tzinfo=None)
-            else:
-                pub_date = datetime.strptime(published_date, '%Y-%m-%d')
-        except (ValueError, AttributeError):
+        pub_date = _parse_published_date(published_date)
+        if pub_date is None:
             return 0.0
         
-        now = datetime.now()
+        now = now or datetime.now()
         days_ago = (now - pub_date).days
         
         if days_ago < 0:
@@ -193,7 +282,8 @@ class YouTubeTitleScorer:
         Uses Jaccard similarity for keyword matching.
         
         Args:
-            episode_keywords: List of keywords from the episode
+            episode_keywords: List of keywords from the episode (or a frozenset
+                              already normalized by _normalize_keywords)
             video_keywords: List of keywords from the YouTube video
             
         Returns:
@@ -203,18 +293,26 @@ class YouTubeTitleScorer:
             return 0.0
         
         # Normalize to lowercase for comparison
-        ep_set = set(kw.lower().strip() for kw in episode_keywords)
-        vid_set = set(kw.lower().strip() for kw in video_keywords)
+        if isinstance(episode_keywords, frozenset):
+            ep_set = episode_keywords
+        else:
+            ep_set = self._normalize_keywords(episode_keywords)
+        vid_set = self._normalize_keywords(video_keywords)
         
-        # Calculate Jaccard similarity
+        # Calculate Jaccard similarity (|A ∪ B| = |A| + |B| - |A ∩ B|)
         intersection = len(ep_set & vid_set)
-        union = len(ep_set | vid_set)
+        union = len(ep_set) + len(vid_set) - intersection
         
         if union == 0:
             return 0.0
         
         return intersection / union
     
+    @staticmethod
+    def _normalize_keywords(keywords: List[str]) -> frozenset:
+        """Lowercased, stripped keyword set."""
+        return frozenset(kw.lower().strip() for kw in keywords)
+    
     def calculate_transcript_similarity(self, episode_transcript: str,
                                          video_title: str) -> float:
         """
@@ -230,21 +328,15 @@ class YouTubeTitleScorer:
         if not episode_transcript or not video_title:
             return 0.0
         
-        # Extract words from transcript (common words)
-        transcript_words = set(episode_transcript.lower().split())
-        title_words = set(video_title.lower().split())
-        
-        # Remove common stop words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 
-                      'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were',
-                      'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does',
-                      'did', 'will', 'would', 'could', 'should', 'may', 'might'}
-        
-        transcript_words -= stop_words
-        title_words -= stop_words
+        # Distinct non-stop words; the transcript's set is cached, since the
+        # same episode transcript is compared against many titles
+        title_words = _content_words(video_title)
+        if not title_words:
+            return 0.0
+        transcript_words = _content_words(episode_transcript)
         
         intersection = len(transcript_words & title_words)
-        union = len(transcript_words | title_words)
+        union = len(transcript_words) + len(title_words) - intersection
         
         if union == 0:
             return 0.0
@@ -271,18 +363,11 @@ class YouTubeTitleScorer:
         Returns:
             Score between 0 and 1
         """
-        category_score = 0.0
         subscriber_score = 0.0
         
         # Category match
-        user_category = user_channel.get('category', '').lower().strip()
-        target_category = target_channel.get('category', '').lower().strip()
-        
-        if user_category and target_category:
-            if user_category == target_category:
-                category_score = 1.0
-            elif user_category in target_category or target_category in user_category:
-                category_score = 0.5  # Partial match
+        category_score = _category_match_score(user_channel.get('category', ''),
+                                               target_channel.get('category', ''))
         
         # Subscriber count similarity
         user_subs = user_channel.get('subscribers', 0)
@@ -328,25 +413,23 @@ class YouTubeTitleScorer:
             return 0.0
         
         title_lower = title.lower()
-        score = 0.0
-        
-        # Check each pattern
-        pattern_weights = {
-            'numbers': 0.15,
-            'how_to': 0.15,
-            'why': 0.10,
-            'best': 0.10,
-            'mistakes': 0.15,
-            'secret': 0.15,
-            'emotional': 0.10,
-            'tutorial': 0.10,
-            'vs': 0.05,
-            'list': 0.20,
-        }
-        
-        for pattern_name, pattern_regex in self.TITLE_PATTERNS.items():
-            if re.search(pattern_regex, title_lower):
-                score += pattern_weights.get(pattern_name, 0.05)
+        parts = WORD_SPLIT_RE.split(title_lower)
+        title_words = parts[1::2]
+        gaps = parts[2::2]  # gaps[i] follows title_words[i]
+        
+        # Check each pattern: literal words, then phrases (words joined by
+        # single spaces), then the remaining regexes
+        hits = {self._TITLE_WORDS[word] for word in title_words if word in self._TITLE_WORDS}
+        for i, word in enumerate(title_words):
+            for rest, name in self._TITLE_PHRASES.get(word, ()):
+                end = i + len(rest)
+                if title_words[i + 1:end + 1] == rest and all(gap == ' ' for gap in gaps[i:end]):
+                    hits.add(name)
+        for name, pattern in self._TITLE_REGEXES.items():
+            if name not in hits and pattern.search(title_lower):
+                hits.add(name)
+        
+        score = sum((self.PATTERN_WEIGHTS.get(name, 0.05) for name in self.TITLE_PATTERNS if name in hits), 0.0)
         
         # Cap at 1.0
         return min(1.0, score)
@@ -417,56 +500,112 @@ class YouTubeTitleScorer:
             Tuple of (composite_score, breakdown_dict)
         """
         w = weights or self.weights
+        return self._score_video(video, w, self._prepare_context(episode_context, w))
+    
+    def _prepare_context(self, episode_context: Optional[Dict[str, Any]],
+                         weights: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """
+        Work shared by every video scored against one episode context: the
+        reference time, normalized episode keywords and the search cluster score.
         
-        breakdown = {}
+        Given weights, factors weighted zero are skipped (scored 0.0), since
+        they can't change the composite score.
+        """
+        episode_context = episode_context or {}
+        if weights is None:
+            active = frozenset(self.FACTORS)
+        else:
+            active = frozenset(name for name in self.FACTORS if weights.get(name, 0))
+        keywords = episode_context.get('keywords') if 'relevance' in active else None
+        search_results = episode_context.get('search_results') if 'cluster' in active else None
+        return {
+            'now': datetime.now(),
+            'active': active,
+            'keywords': self._normalize_keywords(keywords) if keywords else None,
+            'channel': episode_context.get('channel') if 'similarity' in active else None,
+            'cluster': self.calculate_search_cluster_score(search_results) if search_results else None,
+        }
+    
+    def _raw_factors(self, video: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, float]:
+        """Unweighted 0-1 score per factor, against a context from _prepare_context."""
+        factors = dict.fromkeys(self.FACTORS, 0.0)
+        active = context['active']
         
         # Factor 1: Channel Outlier
         channel_data = video.get('channel_data', {})
-        breakdown['outlier'] = self.calculate_outlier_score(video, channel_data) * w.get('outlier', 0)
+        if 'outlier' in active:
+            factors['outlier'] = self.calculate_outlier_score(video, channel_data)
         
         # Factor 2: View Count
-        breakdown['views'] = self.calculate_view_score(video.get('views', 0)) * w.get('views', 0)
+        if 'views' in active:
+            factors['views'] = self.calculate_view_score(video.get('views', 0))
         
         # Factor 3: Recency
-        breakdown['recency'] = self.calculate_recency_score(video.get('published_date', '')) * w.get('recency', 0)
+        if 'recency' in active:
+            factors['recency'] = self.calculate_recency_score(video.get('published_date', ''), context['now'])
         
         # Factor 4: Topic Relevance
-        if episode_context and episode_context.get('keywords'):
-            breakdown['relevance'] = self.calculate_relevance_score(
-                episode_context['keywords'],
+        if context['keywords']:
+            factors['relevance'] = self.calculate_relevance_score(
+                context['keywords'],
                 video.get('keywords', [])
-            ) * w.get('relevance', 0)
+            )
         else:
-            breakdown['relevance'] = 0.0
+            factors['relevance'] = 0.0
         
         # Factor 5: Channel Similarity
-        if episode_context and episode_context.get('channel'):
-            breakdown['similarity'] = self.calculate_similarity_score(
-                episode_context['channel'],
-                video.get('channel_data', {})
-            ) * w.get('similarity', 0)
+        if context['channel']:
+            factors['similarity'] = self.calculate_similarity_score(context['channel'], channel_data)
         else:
-            breakdown['similarity'] = 0.0
+            factors['similarity'] = 0.0
         
         # Factor 6: Title Pattern
-        breakdown['pattern'] = self.calculate_pattern_score(video.get('title', '')) * w.get('pattern', 0)
+        if 'pattern' in active:
+            factors['pattern'] = self.calculate_pattern_score(video.get('title', ''))
         
         # Factor 7: Search Cluster
-        if episode_context and episode_context.get('search_results'):
-            breakdown['cluster'] = self.calculate_search_cluster_score(
-                episode_context['search_results']
-            ) * w.get('cluster', 0)
-        else:
-            breakdown['cluster'] = 0.0
+        factors['cluster'] = context['cluster'] if context['cluster'] is not None else 0.0
         
-        # Calculate composite
-        composite = sum(breakdown.values())
+        return factors
+    
+    @staticmethod
+    def _weigh(factors: Dict[str, float], w: Dict[str, float]) -> Tuple[float, Dict[str, float]]:
+        """(composite score, weighted breakdown) for raw factor scores."""
+        breakdown = {name: score * w.get(name, 0) for name, score in factors.items()}
+        return sum(breakdown.values()), breakdown
+    
+    def _score_video(self, video: Dict[str, Any], w: Dict[str, float],
+                     context: Dict[str, Any]) -> Tuple[float, Dict[str, float]]:
+        """get_composite_score against a context from _prepare_context."""
+        return self._weigh(self._raw_factors(video, context), w)
+    
+    def score_factors(self, videos: List[Dict[str, Any]],
+                      episode_context: Optional[Dict[str, Any]] = None) -> List[Dict[str, float]]:
+        """
+        Unweighted factor scores for each video.
         
-        return composite, breakdown
+        They don't depend on weights, so passing them to rank_videos(factors=...)
+        re-ranks the same videos under different weights without rescoring.
+        
+        Args:
+            videos: List of video dicts
+            episode_context: Context for scoring (keywords, channel, etc.)
+            
+        Returns:
+            List of {factor: score} dicts, parallel to videos
+        """
+        return self._score_batch(videos, self._prepare_context(episode_context))
+    
+    def _score_batch(self, videos: List[Dict[str, Any]],
+                     context: Dict[str, Any]) -> List[Dict[str, float]]:
+        """score_factors against a context from _prepare_context."""
+        return [self._raw_factors(video, context) for video in videos]
     
     def rank_videos(self, videos: List[Dict[str, Any]], 
                    episode_context: Optional[Dict[str, Any]] = None,
-                   weights: Optional[Dict[str, float]] = None) -> List[Dict[str, Any]]:
+                   weights: Optional[Dict[str, float]] = None,
+                   factors: Optional[List[Dict[str, float]]] = None,
+                   top_n: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Rank a list of videos by their composite score.
         
@@ -474,30 +613,34 @@ class YouTubeTitleScorer:
             videos: List of video dicts
             episode_context: Context for scoring (keywords, channel, etc.)
             weights: Custom weights
+            factors: score_factors(videos, episode_context) output to reuse (optional)
+            top_n: Only return the top_n highest scoring videos (optional)
             
         Returns:
             List of videos with added 'score' and 'breakdown' keys, sorted by score descending
         """
-        scored_videos = []
+        # Weights and factor scores are resolved once for the whole batch
+        w = weights or self.weights
+        if factors is None:
+            factors = self._score_batch(videos, self._prepare_context(episode_context, w))
         
-        for video in videos:
-            score, breakdown = self.get_composite_score(
-                video, 
-                weights=weights,
-                episode_context=episode_context
-            )
-            
-            scored_video = {
+        scored = [(video, *self._weigh(video_factors, w)) for video, video_factors in zip(videos, factors)]
+        
+        # Sort by score descending (stable, so ties keep input order); a heap
+        # selects the top_n without sorting the whole batch
+        if top_n is None:
+            scored.sort(key=itemgetter(1), reverse=True)
+        else:
+            scored = heapq.nlargest(top_n, scored, key=itemgetter(1))
+        
+        return [
+            {
                 **video,
                 'score': score,
                 'breakdown': breakdown
             }
-            scored_videos.append(scored_video)
-        
-        # Sort by score descending
-        scored_videos.sort(key=lambda x: x['score'], reverse=True)
-        
-        return scored_videos
+            for video, score, breakdown in scored
+        ]
 
 
 # =============================================================================
@@ -576,7 +719,8 @@ def example_usage():
     ]
     
     # Score and rank videos
-    ranked = scorer.rank_videos(videos, episode_context)
+    factors = scorer.score_factors(videos, episode_context)
+    ranked = scorer.rank_videos(videos, episode_context, factors=factors)
     
     # Print results
     print("\n📊 RANKED VIDEO TITLES (Best to Mimic):\n")
@@ -608,7 +752,8 @@ def example_usage():
         'cluster': 0.02
     }
     scorer_custom = YouTubeTitleScorer(weights=custom_weights)
-    ranked_custom = scorer_custom.rank_videos(videos, episode_context)
+    # Factor scores don't depend on weights - re-rank without rescoring
+    ranked_custom = scorer_custom.rank_videos(videos, episode_context, factors=factors)
     print(f"   With recency boost, top result: \"{ranked_custom[0]['title']}\"")
     
     return ranked
@@ -701,10 +846,10 @@ class EpisodeOptimizerIntegration:
         Returns:
             List of recommended titles with scores and metadata
         """
-        ranked = self.scorer.rank_videos(videos, episode_context)
+        ranked = self.scorer.rank_videos(videos, episode_context, top_n=top_n)
         
         recommendations = []
-        for video in ranked[:top_n]:
+        for video in ranked:
             recommendations.append({
                 'title': video['title'],
                 'score': video['score'],